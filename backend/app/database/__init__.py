@@ -1,4 +1,5 @@
 """Database package"""
 from .connection import get_db, engine, SessionLocal, Base
+from .query_stats import QueryStats, track_queries
 
-__all__ = ['get_db', 'engine', 'SessionLocal', 'Base']
+__all__ = ['get_db', 'engine', 'SessionLocal', 'Base', 'QueryStats', 'track_queries']
@@ -0,0 +1,84 @@
+"""
+Per-request SQL statistics
+Counts statements, rows and database time for the statements executed while
+a tracker is active, and flags statements repeated many times in one request
+(the usual sign of an N+1 lazy-load pattern).
+"""
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+@dataclass
+class QueryStats:
+    statements: int = 0
+    rows: int = 0
+    db_time: float = 0.0
+    statement_counts: Counter = field(default_factory=Counter)
+
+    @property
+    def db_time_ms(self) -> float:
+        return self.db_time * 1000
+
+    @property
+    def max_repeats(self) -> int:
+        """Highest number of times any single statement ran"""
+        return max(self.statement_counts.values(), default=0)
+
+    def repeated_statements(self, threshold: int = 2) -> List[Tuple[str, int]]:
+        """Statements executed at least `threshold` times, most repeated first"""
+        return [(sql, count) for sql, count in self.statement_counts.most_common() if count >= threshold]
+
+    def headers(self) -> dict:
+        return {
+            "X-DB-Statements": str(self.statements),
+            "X-DB-Rows": str(self.rows),
+            "X-DB-Time-Ms": f"{self.db_time_ms:.1f}",
+            "X-DB-Max-Repeats": str(self.max_repeats),
+        }
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Collect statistics for statements executed in this context"""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("query_start_times", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+
+    start_times = conn.info.get("query_start_times")
+    if start_times:
+        stats.db_time += time.perf_counter() - start_times.pop()
+    stats.statements += 1
+    stats.rows += max(cursor.rowcount, 0)
+    stats.statement_counts[statement] += 1
+
+
+def install_query_instrumentation(engine: Engine) -> None:
+    """Register the statement counters on an engine (idempotent)"""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
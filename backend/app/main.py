@@ -3,24 +3,51 @@ FastAPI Main Application
 FTA Comprehensive Review - Applicability & LOE Assessment API
 """
 
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import os
 from dotenv import load_dotenv
 
-from app.routers import questions, sections, sub_areas, projects, assessment
+from app.database.connection import SessionLocal
+from app.database.query_stats import track_queries
+from app.routers import questions, sections, sub_areas, projects, assessment, export_jobs, editions
+from app.services.catalog import get_catalog
+from app.services.export_jobs import export_jobs as export_job_manager
+from app.services.result_cache import applicability_cache
+from app.services.workbook_generator import get_workbook_fragments
 
 # Load environment variables
 load_dotenv()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Load the catalog snapshot and pre-render workbook fragments so the
+    # first requests are served from memory
+    db = SessionLocal()
+    try:
+        catalog = get_catalog(db)
+        get_workbook_fragments(catalog)
+        print(f"Catalog snapshot loaded: edition {catalog.edition_id}, "
+              f"{len(catalog.sub_areas)} sub-areas (version {catalog.version})")
+    except Exception as e:
+        print(f"Catalog snapshot not loaded at startup: {e}")
+    finally:
+        db.close()
+    yield
+    export_job_manager.shutdown()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="FTA Comprehensive Review API",
     description="API for FTA Comprehensive Review Applicability Assessment and LOE Estimation",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    lifespan=lifespan
 )
 
 # CORS Configuration
@@ -40,12 +67,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request SQL statistics as X-DB-* response headers (debug only)
+if os.getenv("QUERY_DEBUG", "False").lower() == "true":
+    @app.middleware("http")
+    async def query_stats_headers(request: Request, call_next):
+        with track_queries() as stats:
+            response = await call_next(request)
+        # Streaming bodies are produced after this point and are not counted
+        response.headers.update(stats.headers())
+        return response
+
 # Include routers
 app.include_router(questions.router)
 app.include_router(sections.router)
 app.include_router(sub_areas.router)
 app.include_router(projects.router)
 app.include_router(assessment.router)
+app.include_router(export_jobs.router)
+app.include_router(editions.router)
 
 
 # Root endpoint
@@ -64,6 +103,18 @@ def health_check():
     return {"status": "healthy"}
 
 
+# Applicability result cache statistics
+@app.get("/health/cache")
+def cache_stats():
+    return applicability_cache.stats()
+
+
+# Background export job statistics
+@app.get("/health/export-jobs")
+def export_job_stats():
+    return export_job_manager.stats()
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request, exc):
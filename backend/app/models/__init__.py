@@ -2,6 +2,7 @@
 SQLAlchemy Models
 """
 
+from .edition import GuideEdition
 from .section import Section
 from .sub_area import SubArea
 from .indicator import IndicatorOfCompliance
@@ -9,8 +10,11 @@ from .deficiency import Deficiency
 from .question import Question
 from .rule import ApplicabilityRule
 from .project import Project, ProjectAnswer, ProjectApplicability
+from .catalog_version import CatalogVersion
+from .finding import WorkbookImport, ProjectFinding
 
 __all__ = [
+    'GuideEdition',
     'Section',
     'SubArea',
     'IndicatorOfCompliance',
@@ -20,4 +24,7 @@ __all__ = [
     'Project',
     'ProjectAnswer',
     'ProjectApplicability',
+    'CatalogVersion',
+    'WorkbookImport',
+    'ProjectFinding',
 ]
@@ -0,0 +1,19 @@
+"""
+Catalog Version model
+"""
+
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+from app.database.connection import Base
+
+
+class CatalogVersion(Base):
+    """
+    Version counters bumped by database triggers whenever the rule set or
+    the regulatory catalog changes, used to invalidate in-process caches.
+    """
+    __tablename__ = "catalog_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=1)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -2,7 +2,7 @@
 Deficiency model
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, ForeignKeyConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.connection import Base
@@ -10,9 +10,13 @@ from app.database.connection import Base
 
 class Deficiency(Base):
     __tablename__ = "deficiencies"
+    __table_args__ = (
+        ForeignKeyConstraint(["edition_id", "sub_area_id"], ["sub_areas.edition_id", "sub_areas.id"]),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    sub_area_id = Column(String(50), ForeignKey("sub_areas.id"), nullable=False)
+    edition_id = Column(Integer, ForeignKey("guide_editions.id"), nullable=False)
+    sub_area_id = Column(String(50), nullable=False)
     code = Column(String(50), nullable=False)
     title = Column(Text, nullable=False)
     determination = Column(Text)
@@ -0,0 +1,24 @@
+"""
+GuideEdition model
+"""
+
+from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy.sql import func
+from app.database.connection import Base
+
+
+class GuideEdition(Base):
+    """
+    One edition of the FTA Comprehensive Review Guide (e.g. FY2025).
+    Catalog rows and applicability rules are keyed by edition, and every
+    project is pinned to one; new projects use the current edition.
+    """
+    __tablename__ = "guide_editions"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    code = Column(String(20), unique=True, nullable=False)
+    title = Column(String(255), nullable=False)
+    source_document = Column(String(255))
+    extraction_date = Column(DateTime)
+    is_current = Column(Boolean, nullable=False, default=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,52 @@
+"""
+WorkbookImport and ProjectFinding models
+"""
+
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, ForeignKeyConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database.connection import Base
+
+
+class WorkbookImport(Base):
+    """A completed audit workbook uploaded for a project"""
+    __tablename__ = "workbook_imports"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    filename = Column(String(255))
+    rows_read = Column(Integer, nullable=False, default=0)
+    findings_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    # Findings are bulk-inserted and removed by ON DELETE CASCADE
+    findings = relationship("ProjectFinding", back_populates="workbook_import", passive_deletes=True)
+
+
+class ProjectFinding(Base):
+    """
+    Reviewer input for one sub-area (indicator_id NULL) or one indicator row
+    of an imported workbook
+    """
+    __tablename__ = "project_findings"
+    __table_args__ = (
+        ForeignKeyConstraint(["edition_id", "sub_area_id"], ["sub_areas.edition_id", "sub_areas.id"]),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    import_id = Column(Integer, ForeignKey("workbook_imports.id", ondelete="CASCADE"), nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
+    edition_id = Column(Integer, ForeignKey("guide_editions.id"), nullable=False)
+    sub_area_id = Column(String(50), nullable=False)
+    indicator_id = Column(String(50))
+    sheet_row = Column(Integer)
+    compliance = Column(String(20))  # compliant, non_compliant or na
+    audit_evidence = Column(Text)
+    finding_code = Column(Text)
+    finding_description = Column(Text)
+    additional_info = Column(Text)
+    required_action = Column(Text)
+
+    # Relationships
+    workbook_import = relationship("WorkbookImport", back_populates="findings")
@@ -2,7 +2,7 @@
 Indicator of Compliance model
 """
 
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, ForeignKeyConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.connection import Base
@@ -10,9 +10,13 @@ from app.database.connection import Base
 
 class IndicatorOfCompliance(Base):
     __tablename__ = "indicators_of_compliance"
+    __table_args__ = (
+        ForeignKeyConstraint(["edition_id", "sub_area_id"], ["sub_areas.edition_id", "sub_areas.id"]),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    sub_area_id = Column(String(50), ForeignKey("sub_areas.id"), nullable=False)
+    edition_id = Column(Integer, ForeignKey("guide_editions.id"), nullable=False)
+    sub_area_id = Column(String(50), nullable=False)
     indicator_id = Column(String(10), nullable=False)
     text = Column(Text, nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -2,7 +2,7 @@
 Project, ProjectAnswer, and ProjectApplicability models
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, DateTime, ForeignKey, JSON, LargeBinary
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.connection import Base
@@ -17,12 +17,17 @@ class Project(Base):
     grantee_name = Column(String(255))
     grant_number = Column(String(100))
     review_type = Column(String(50))
+    # Guide edition the project is scoped against; its catalog and rules never change with newer editions
+    edition_id = Column(Integer, ForeignKey("guide_editions.id"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    # Applicable sub-areas as a bitset over sub_areas.ordinal (see services/applicability_bitset.py)
+    applicability_bits = Column(LargeBinary)
 
     # Relationships
-    project_answers = relationship("ProjectAnswer", back_populates="project", cascade="all, delete-orphan")
-    applicability = relationship("ProjectApplicability", back_populates="project", cascade="all, delete-orphan")
+    # Answers are removed by ON DELETE CASCADE, without loading them first
+    project_answers = relationship("ProjectAnswer", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
+    applicability = relationship("ProjectApplicability", back_populates="project", viewonly=True)
 
 
 class ProjectAnswer(Base):
@@ -39,13 +44,15 @@ class ProjectAnswer(Base):
 
 
 class ProjectApplicability(Base):
+    """
+    Read-only compatibility view expanding projects.applicability_bits into
+    one row per applicable sub-area, for reporting queries
+    """
     __tablename__ = "project_applicability"
 
-    id = Column(Integer, primary_key=True, autoincrement=True)
-    project_id = Column(Integer, ForeignKey("projects.id"), nullable=False)
-    sub_area_id = Column(String(50), ForeignKey("sub_areas.id"), nullable=False)
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+    sub_area_id = Column(String(50), primary_key=True)
     is_applicable = Column(Boolean, default=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     project = relationship("Project", back_populates="applicability")
@@ -2,19 +2,25 @@
 Applicability Rule model
 """
 
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey, ForeignKeyConstraint
 from sqlalchemy.sql import func
 from app.database.connection import Base
 
 
 class ApplicabilityRule(Base):
     __tablename__ = "applicability_rules"
+    __table_args__ = (
+        ForeignKeyConstraint(["edition_id", "sub_area_id"], ["sub_areas.edition_id", "sub_areas.id"]),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
-    sub_area_id = Column(String(50), ForeignKey("sub_areas.id"), nullable=False)
-    question_id = Column(Integer, ForeignKey("questionnaire_questions.id"), nullable=False)
-    required_answer = Column(String(50), nullable=False)
+    edition_id = Column(Integer, ForeignKey("guide_editions.id"), nullable=False)
+    sub_area_id = Column(String(50), nullable=False)
+    # Both empty on condition-only rules (rule_conditions), used by POST /api/assess
+    question_id = Column(Integer, ForeignKey("questionnaire_questions.id"), nullable=True)
+    required_answer = Column(String(50), nullable=True)
     rule_type = Column(String(50), default='include')
+    is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
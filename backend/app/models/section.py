@@ -2,7 +2,7 @@
 Section model
 """
 
-from sqlalchemy import Column, String, Text, DateTime, Integer
+from sqlalchemy import Column, String, Text, DateTime, Integer, ForeignKey
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.connection import Base
@@ -11,6 +11,8 @@ from app.database.connection import Base
 class Section(Base):
     __tablename__ = "sections"
 
+    # Keyed by (edition_id, id): each guide edition has its own sections
+    edition_id = Column(Integer, ForeignKey("guide_editions.id"), primary_key=True)
     id = Column(String(50), primary_key=True)
     title = Column(String(255), nullable=False)
     page_range = Column(String(50))
@@ -19,5 +21,5 @@ class Section(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    # Relationships
-    sub_areas = relationship("SubArea", back_populates="section", lazy="joined")
+    # Relationships (loader strategy chosen per query)
+    sub_areas = relationship("SubArea", back_populates="section")
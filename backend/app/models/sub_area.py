@@ -2,7 +2,7 @@
 SubArea model
 """
 
-from sqlalchemy import Column, String, Text, Numeric, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, String, Text, Numeric, Integer, DateTime, ForeignKey, ForeignKeyConstraint
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database.connection import Base
@@ -10,9 +10,14 @@ from app.database.connection import Base
 
 class SubArea(Base):
     __tablename__ = "sub_areas"
+    __table_args__ = (
+        ForeignKeyConstraint(["edition_id", "section_id"], ["sections.edition_id", "sections.id"]),
+    )
 
+    # Keyed by (edition_id, id): each guide edition has its own sub-areas
+    edition_id = Column(Integer, ForeignKey("guide_editions.id"), primary_key=True)
     id = Column(String(50), primary_key=True)
-    section_id = Column(String(50), ForeignKey("sections.id"), nullable=False)
+    section_id = Column(String(50), nullable=False)
     question = Column(Text, nullable=False)
     basic_requirement = Column(Text)
     applicability = Column(Text)
@@ -22,10 +27,13 @@ class SubArea(Base):
     loe_confidence = Column(String(20))
     loe_confidence_score = Column(Integer)
     loe_reasoning = Column(Text)
+    # Dense, stable position of this sub-area in project applicability bitsets,
+    # unique across editions
+    ordinal = Column(Integer, unique=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
-    # Relationships
+    # Relationships (loader strategy chosen per query)
     section = relationship("Section", back_populates="sub_areas")
-    indicators = relationship("IndicatorOfCompliance", back_populates="sub_area", lazy="joined")
-    deficiencies = relationship("Deficiency", back_populates="sub_area", lazy="joined")
+    indicators = relationship("IndicatorOfCompliance", back_populates="sub_area")
+    deficiencies = relationship("Deficiency", back_populates="sub_area")
@@ -2,67 +2,56 @@
 Assessment API endpoints (without creating a project)
 """
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from sqlalchemy import text, func
 from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 import json
+from tempfile import SpooledTemporaryFile
 
-from app.database.connection import get_db
-from app.models import SubArea, Section
+from pydantic import ValidationError
+
+from app.database.connection import get_db, SessionLocal
+from app.routers.editions import EDITION_QUERY, resolve_edition
 from app.schemas import AssessmentRequestSchema, AssessmentResultSchema, SubAreaSchema
+from app.services.rule_evaluator import evaluate_applicable_sub_areas, evaluate_applicable_sub_areas_batch
+from app.services.catalog import CatalogSnapshot, CatalogSubArea, get_catalog
+from app.services.catalog_version import edition_versions, get_catalog_versions
+from app.services.result_cache import applicability_cache, answers_cache_key
 
 router = APIRouter(prefix="/api/assess", tags=["assessment"])
 
+# Number of answer sets evaluated per query in a batch
+BATCH_CHUNK_SIZE = 50
+# NDJSON uploads larger than this are spooled to disk
+NDJSON_SPOOL_SIZE = 1024 * 1024
 
-@router.post("", response_model=AssessmentResultSchema)
-def assess_applicability(assessment: AssessmentRequestSchema, db: Session = Depends(get_db)):
-    """
-    Assess which sub-areas are applicable based on answers
-    Does not create a project - just returns applicable sub-areas
-    """
-    # Convert answers to JSONB format
-    answers_jsonb = json.dumps(assessment.answers)
-
-    # Use database function to evaluate rules
-    # Since we don't have a project, we'll check rules directly
-    query = text("""
-        SELECT DISTINCT ar.sub_area_id
-        FROM applicability_rules ar
-        WHERE ar.is_active = TRUE
-        AND evaluate_rule(ar.id, :answers::jsonb)
-    """)
-
-    result = db.execute(query, {"answers": answers_jsonb})
-    applicable_sub_area_ids = [row[0] for row in result]
-
-    # Get sub-area details
-    sub_areas = db.query(SubArea).filter(SubArea.id.in_(applicable_sub_area_ids)).all()
 
+def _build_assessment_result(sub_areas: List[CatalogSubArea], catalog: CatalogSnapshot) -> AssessmentResultSchema:
+    """Build the assessment result for a list of applicable sub-areas"""
     # Calculate totals
     total_hours = sum(sa.loe_hours for sa in sub_areas if sa.loe_hours) or Decimal('0')
     avg_confidence = sum(sa.loe_confidence_score for sa in sub_areas if sa.loe_confidence_score) / len(sub_areas) if sub_areas else 0
 
-    # Get summary by section
-    section_summaries = db.query(
-        Section.id,
-        Section.title,
-        func.count(SubArea.id).label('count'),
-        func.sum(SubArea.loe_hours).label('hours')
-    ).join(SubArea, Section.id == SubArea.section_id)\
-    .filter(SubArea.id.in_(applicable_sub_area_ids))\
-    .group_by(Section.id, Section.title)\
-    .order_by(func.sum(SubArea.loe_hours).desc().nullslast())\
-    .all()
+    # Summarize by section, ordered by total hours (sections without hours last)
+    summaries = {}
+    for sa in sub_areas:
+        summary = summaries.setdefault(sa.section_id, {'count': 0, 'hours': None})
+        summary['count'] += 1
+        if sa.loe_hours is not None:
+            summary['hours'] = (summary['hours'] or Decimal('0')) + sa.loe_hours
 
+    ordered = sorted(summaries.items(), key=lambda item: (item[1]['hours'] is None, -(item[1]['hours'] or 0)))
     sections_summary = [
         {
-            "section_id": s.id,
-            "section_title": s.title,
-            "sub_area_count": s.count,
-            "total_hours": float(s.hours) if s.hours else 0.0
+            "section_id": section_id,
+            "section_title": catalog.sections[section_id].title if section_id in catalog.sections else '',
+            "sub_area_count": summary['count'],
+            "total_hours": float(summary['hours']) if summary['hours'] else 0.0
         }
-        for s in section_summaries
+        for section_id, summary in ordered
     ]
 
     return AssessmentResultSchema(
@@ -72,3 +61,186 @@ def assess_applicability(assessment: AssessmentRequestSchema, db: Session = Depe
         avg_confidence=float(avg_confidence),
         sections_summary=sections_summary
     )
+
+
+@router.post("", response_model=AssessmentResultSchema)
+def assess_applicability(
+    assessment: AssessmentRequestSchema,
+    edition: Optional[str] = EDITION_QUERY,
+    db: Session = Depends(get_db)
+):
+    """
+    Assess which sub-areas are applicable based on answers
+    Does not create a project - just returns applicable sub-areas
+    of the requested guide edition (the current edition by default)
+    """
+    versions = get_catalog_versions(db)
+    edition_id = resolve_edition(db, edition, versions).id
+
+    # Identical answer sets against the same rules/catalog give identical results
+    result_versions = edition_versions(versions, edition_id)
+    applicability_cache.sync_version(tuple(sorted(result_versions.items())), partition=edition_id)
+    cache_key = answers_cache_key(f'assess:{edition_id}', assessment.answers, result_versions)
+
+    cached = applicability_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Evaluate all rules in a single set-based query
+    applicable_sub_area_ids = evaluate_applicable_sub_areas(db, assessment.answers, edition_id)
+
+    # Get sub-area details from the catalog snapshot
+    catalog = get_catalog(db, edition_id, versions)
+    result = _build_assessment_result(catalog.sub_areas_for_ids(applicable_sub_area_ids), catalog)
+    applicability_cache.set(cache_key, result, partition=edition_id)
+
+    return result
+
+
+class _BatchAssessor:
+    """
+    Evaluates answer sets in chunks against one consistent snapshot.
+
+    All queries run in a single REPEATABLE READ transaction, so every input
+    in the batch sees the same rules and catalog of one guide edition.
+    Sub-area and section details come from the catalog snapshot; only rule
+    evaluation hits the database per chunk.
+    """
+
+    def __init__(self, edition_id: int):
+        self.db = SessionLocal()
+        self.db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+        self.edition_id = edition_id
+        self.versions = get_catalog_versions(self.db)
+        self.result_versions = edition_versions(self.versions, edition_id)
+        applicability_cache.sync_version(tuple(sorted(self.result_versions.items())), partition=edition_id)
+
+        self.catalog = get_catalog(self.db, edition_id, self.versions)
+
+    def assess_chunk(self, items: List[Union[Dict[str, str], str]]) -> List[str]:
+        """Return one NDJSON line per item; items are answer maps or error messages"""
+        results: List[Any] = [None] * len(items)
+        cache_keys = {}
+        pending = []
+
+        for i, item in enumerate(items):
+            if isinstance(item, str):
+                results[i] = {"error": item}
+                continue
+            cache_keys[i] = answers_cache_key(f'assess:{self.edition_id}', item, self.result_versions)
+            results[i] = applicability_cache.get(cache_keys[i])
+            if results[i] is None:
+                pending.append(i)
+
+        evaluated = evaluate_applicable_sub_areas_batch(self.db, [items[i] for i in pending], self.edition_id)
+        for i, sub_area_ids in zip(pending, evaluated):
+            sub_areas = self.catalog.sub_areas_for_ids(sub_area_ids)
+            results[i] = _build_assessment_result(sub_areas, self.catalog)
+            applicability_cache.set(cache_keys[i], results[i], partition=self.edition_id)
+
+        return [
+            (result.model_dump_json() if isinstance(result, AssessmentResultSchema) else json.dumps(result)) + "\n"
+            for result in results
+        ]
+
+    def close(self):
+        self.db.rollback()
+        self.db.close()
+
+
+def _parse_assessment_item(item: Any) -> Union[Dict[str, str], str]:
+    """Validate one batch input, returning its answers or an error message"""
+    try:
+        return AssessmentRequestSchema.model_validate(item).answers
+    except ValidationError as e:
+        return f"Invalid assessment request: {e.errors(include_url=False)}"
+
+
+async def _spool_request_body(request: Request) -> SpooledTemporaryFile:
+    """
+    Copy the request body into a spooled temporary file.
+    The body has to be fully received before the streaming response starts
+    (the response listens on the same channel for disconnects), and spooling
+    keeps memory bounded for large uploads.
+    """
+    body = SpooledTemporaryFile(max_size=NDJSON_SPOOL_SIZE)
+    async for chunk in request.stream():
+        body.write(chunk)
+    body.seek(0)
+    return body
+
+
+async def _iter_ndjson_items(body: SpooledTemporaryFile) -> AsyncIterator[Union[Dict[str, str], str]]:
+    """Parse a spooled NDJSON body line by line"""
+    try:
+        for line in body:
+            if line.strip():
+                yield _parse_ndjson_line(line)
+    finally:
+        body.close()
+
+
+def _parse_ndjson_line(line: bytes) -> Union[Dict[str, str], str]:
+    try:
+        return _parse_assessment_item(json.loads(line))
+    except ValueError:
+        return "Invalid JSON line"
+
+
+async def _iter_list_items(items: List[Any]) -> AsyncIterator[Union[Dict[str, str], str]]:
+    for item in items:
+        yield _parse_assessment_item(item)
+
+
+async def _stream_batch_results(
+    items: AsyncIterator[Union[Dict[str, str], str]],
+    edition_id: int
+) -> AsyncIterator[str]:
+    """Evaluate inputs in chunks and yield result lines as each chunk completes"""
+    assessor = await run_in_threadpool(_BatchAssessor, edition_id)
+    try:
+        chunk = []
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) >= BATCH_CHUNK_SIZE:
+                for line in await run_in_threadpool(assessor.assess_chunk, chunk):
+                    yield line
+                chunk = []
+        if chunk:
+            for line in await run_in_threadpool(assessor.assess_chunk, chunk):
+                yield line
+    finally:
+        await run_in_threadpool(assessor.close)
+
+
+@router.post("/batch")
+async def assess_applicability_batch(
+    request: Request,
+    edition: Optional[str] = EDITION_QUERY,
+    db: Session = Depends(get_db)
+):
+    """
+    Assess many answer sets against one rule snapshot
+    Accepts a JSON list of assessment requests, or an NDJSON body
+    (Content-Type: application/x-ndjson) with one request per line.
+    Streams back one AssessmentResultSchema JSON line per input, in order;
+    invalid inputs produce an {"error": ...} line in their position.
+    """
+    # Resolved before streaming starts, so an unknown edition is a plain 404
+    edition_id = (await run_in_threadpool(resolve_edition, db, edition)).id
+
+    content_type = request.headers.get('content-type', '')
+
+    if 'ndjson' in content_type or 'jsonlines' in content_type:
+        items = _iter_ndjson_items(await _spool_request_body(request))
+    else:
+        try:
+            body = await request.json()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Request body must be a JSON list or NDJSON")
+        if not isinstance(body, list):
+            raise HTTPException(status_code=400, detail="Request body must be a JSON list of assessment requests")
+        items = _iter_list_items(body)
+
+    return StreamingResponse(_stream_batch_results(items, edition_id), media_type="application/x-ndjson")
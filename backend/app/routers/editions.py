@@ -0,0 +1,48 @@
+"""
+Guide editions API endpoints
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+
+from app.database.connection import get_db
+from app.schemas import EditionSchema
+from app.services.catalog import CatalogSnapshot, get_catalog
+from app.services.catalog_version import get_catalog_versions
+from app.services.editions import Edition, get_editions
+
+router = APIRouter(prefix="/api/editions", tags=["editions"])
+
+# Optional ?edition= parameter of the catalog and assessment endpoints
+EDITION_QUERY = Query(None, description="Guide edition code, e.g. FY2025 (default: current edition)")
+
+
+def resolve_edition(db: Session, code: Optional[str], versions: Optional[Dict[str, int]] = None) -> Edition:
+    """Edition for a requested code (the current edition when none is given), 404 if unknown"""
+    edition = get_editions(db, versions).resolve(code)
+
+    if edition is None:
+        if code is None:
+            raise HTTPException(status_code=404, detail="No current guide edition")
+        raise HTTPException(status_code=404, detail=f"Guide edition not found: {code}")
+
+    return edition
+
+
+def edition_catalog(db: Session, code: Optional[str]) -> CatalogSnapshot:
+    """Catalog snapshot of a requested edition (the current edition when none is given)"""
+    versions = get_catalog_versions(db)
+    return get_catalog(db, resolve_edition(db, code, versions).id, versions)
+
+
+@router.get("", response_model=List[EditionSchema])
+def get_guide_editions(db: Session = Depends(get_db)):
+    """Get all guide editions, oldest first"""
+    return list(get_editions(db).by_id.values())
+
+
+@router.get("/{code}", response_model=EditionSchema)
+def get_guide_edition(code: str, db: Session = Depends(get_db)):
+    """Get a guide edition by code (e.g. FY2025)"""
+    return resolve_edition(db, code)
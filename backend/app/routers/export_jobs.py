@@ -0,0 +1,116 @@
+"""
+Export Jobs API endpoints
+Background workbook generation with status polling
+"""
+
+import os
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.orm import Session, raiseload
+
+from app.database.connection import get_db
+from app.models import Project
+from app.schemas import ExportJobSchema
+from app.services.applicability_bitset import decode_ordinals
+from app.services.catalog import get_catalog, snapshot_version
+from app.services.catalog_version import get_catalog_versions
+from app.services.export_cache import workbook_export_cache, export_cache_key, attachment_header, iter_file
+from app.services.export_jobs import DONE, FAILED, ExportJob, ExportQueueFull, export_jobs
+from app.services.workbook_generator import (
+    WORKBOOK_GENERATOR_VERSION,
+    XLSX_MEDIA_TYPE,
+    build_workbook_data,
+    workbook_filename
+)
+
+router = APIRouter(tags=["export-jobs"])
+
+
+def _job_schema(job: ExportJob) -> ExportJobSchema:
+    done, total = export_jobs.progress(job)
+    return ExportJobSchema(
+        job_id=job.id,
+        project_id=job.project_id,
+        status=job.status,
+        sheets_done=done,
+        sheets_total=total,
+        created_at=datetime.fromtimestamp(job.created_at),
+        finished_at=datetime.fromtimestamp(job.finished_at) if job.finished_at else None,
+        error=job.error,
+        download_url=f"/api/export-jobs/{job.id}"
+    )
+
+
+def _job_response(job: ExportJob, status_code: int) -> JSONResponse:
+    return JSONResponse(
+        content=_job_schema(job).model_dump(mode="json"),
+        status_code=status_code,
+        headers={"Location": f"/api/export-jobs/{job.id}"}
+    )
+
+
+@router.post("/api/projects/{project_id}/export-jobs", response_model=ExportJobSchema, status_code=202)
+def create_export_job(project_id: int, db: Session = Depends(get_db)):
+    """
+    Start generating the project's workbook in the background.
+    Returns the job to poll; a request for an export that is already being
+    generated returns the existing job.
+    """
+    project = db.query(Project).options(raiseload("*")).filter(Project.id == project_id).first()
+
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    versions = get_catalog_versions(db)
+    cache_key = export_cache_key(
+        'workbook', project.applicability_bits, snapshot_version(versions, project.edition_id),
+        WORKBOOK_GENERATOR_VERSION
+    )
+
+    catalog = get_catalog(db, project.edition_id, versions)
+    sub_areas = catalog.sub_areas_for_ordinals(decode_ordinals(project.applicability_bits))
+    if not sub_areas:
+        raise HTTPException(status_code=400, detail="Project has no applicable sub-areas to export")
+
+    try:
+        job, _ = export_jobs.submit(project.id, project.name, cache_key, build_workbook_data(catalog, sub_areas))
+    except ExportQueueFull:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many exports in progress, try again shortly",
+            headers={"Retry-After": "5"}
+        )
+
+    return _job_response(job, 202)
+
+
+@router.get("/api/export-jobs/{job_id}", response_model=ExportJobSchema)
+def get_export_job(job_id: str):
+    """
+    Poll an export job.
+    Returns the job status (202) while it is queued or running, and the
+    workbook itself once it is done.
+    """
+    job = export_jobs.get(job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Export job not found")
+
+    if job.status == FAILED:
+        raise HTTPException(status_code=500, detail=f"Export failed: {job.error}")
+
+    if job.status != DONE:
+        return _job_response(job, 202)
+
+    cached = workbook_export_cache.open(job.cache_key)
+    if cached is None:
+        raise HTTPException(status_code=410, detail="Export file has expired, start a new export")
+
+    headers = {
+        "Content-Disposition": attachment_header(workbook_filename(job.project_name)),
+        "Content-Length": str(os.fstat(cached.fileno()).st_size),
+        "ETag": f'"{job.cache_key}"',
+        "Cache-Control": "private, no-cache"
+    }
+    return StreamingResponse(iter_file(cached), media_type=XLSX_MEDIA_TYPE, headers=headers)
@@ -2,28 +2,49 @@
 Projects API endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session
-from sqlalchemy import func, text
-from typing import List
-from decimal import Decimal
+from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy.orm import Session, load_only, raiseload
+from typing import Iterable, List
 from datetime import datetime
-import urllib.parse
+import os
 
 from app.database.connection import get_db
-from app.models import Project, ProjectAnswer, SubArea, Section, ProjectApplicability, IndicatorOfCompliance
+from app.models import Project
 from app.schemas import (
     ProjectSchema,
     ProjectCreateSchema,
     ProjectUpdateSchema,
     ProjectAnswersSchema,
+    ProjectAnswersPatchSchema,
+    ExportBundleRequestSchema,
     ProjectApplicabilityResultSchema,
+    ProjectApplicabilityDeltaSchema,
+    ProjectWriteStatsSchema,
     ProjectLOESummarySchema,
     SectionLOESummary,
-    SubAreaSchema
+    WorkbookImportErrorSchema,
+    WorkbookImportResultSchema
 )
-from app.services.workbook_generator import generate_project_workbook
+from app.services.workbook_generator import (
+    WORKBOOK_GENERATOR_VERSION,
+    XLSX_MEDIA_TYPE,
+    export_filename,
+    iter_prerendered_workbook_chunks,
+    workbook_filename
+)
+from app.services.workbook_import import WorkbookFormatError, import_workbook
+from app.services.tabular_export import EXPORT_MEDIA_TYPES, iter_export, iter_export_rows, parquet_available
+from app.services.export_bundle import BundleMember, BundleWriter
+from app.services.export_jobs import EXPORT_PRERENDER, export_jobs
+from app.services.export_cache import workbook_export_cache, export_cache_key, attachment_header, iter_file
+from app.services.applicability_engine import get_applicability_engine, engine_version
+from app.services.applicability_bitset import bytes_to_bits, count_bits, decode_ordinals
+from app.routers.editions import resolve_edition
+from app.services.catalog import CatalogSnapshot, CatalogSubArea, get_catalog, snapshot_version
+from app.services.catalog_version import edition_versions, get_catalog_versions
+from app.services.result_cache import applicability_cache, answers_cache_key
+from app.services.project_store import empty_write_stats, sync_project_answers, save_project_applicability
 
 router = APIRouter(prefix="/api/projects", tags=["projects"])
 
@@ -31,19 +52,28 @@ router = APIRouter(prefix="/api/projects", tags=["projects"])
 @router.get("", response_model=List[ProjectSchema])
 def get_projects(db: Session = Depends(get_db)):
     """Get all projects"""
-    projects = db.query(Project).order_by(Project.created_at.desc()).all()
+    projects = db.query(Project).options(
+        load_only(
+            Project.id, Project.edition_id, Project.name, Project.description, Project.grantee_name,
+            Project.grant_number, Project.review_type, Project.created_at, Project.updated_at
+        ),
+        raiseload("*")
+    ).order_by(Project.created_at.desc()).all()
     return projects
 
 
 @router.post("", response_model=ProjectSchema, status_code=201)
 def create_project(project: ProjectCreateSchema, db: Session = Depends(get_db)):
-    """Create a new project"""
+    """Create a new project, pinned to the requested guide edition (the current edition by default)"""
     # Check if project name already exists
-    existing = db.query(Project).filter(Project.name == project.name).first()
+    existing = db.query(Project.id).filter(Project.name == project.name).first()
     if existing:
         raise HTTPException(status_code=400, detail=f"Project with name '{project.name}' already exists")
 
+    edition = resolve_edition(db, project.edition)
+
     new_project = Project(
+        edition_id=edition.id,
         name=project.name,
         description=project.description,
         grantee_name=project.grantee_name,
@@ -61,7 +91,7 @@ def create_project(project: ProjectCreateSchema, db: Session = Depends(get_db)):
 @router.get("/{project_id}", response_model=ProjectSchema)
 def get_project(project_id: int, db: Session = Depends(get_db)):
     """Get a specific project"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.query(Project).options(raiseload("*")).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -72,14 +102,14 @@ def get_project(project_id: int, db: Session = Depends(get_db)):
 @router.put("/{project_id}", response_model=ProjectSchema)
 def update_project(project_id: int, project_update: ProjectUpdateSchema, db: Session = Depends(get_db)):
     """Update a project"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.query(Project).options(raiseload("*")).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
     if project_update.name:
         # Check if new name conflicts with another project
-        existing = db.query(Project).filter(
+        existing = db.query(Project.id).filter(
             Project.name == project_update.name,
             Project.id != project_id
         ).first()
@@ -99,7 +129,7 @@ def update_project(project_id: int, project_update: ProjectUpdateSchema, db: Ses
 @router.delete("/{project_id}", status_code=204)
 def delete_project(project_id: int, db: Session = Depends(get_db)):
     """Delete a project"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.query(Project).options(raiseload("*")).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
@@ -110,196 +140,179 @@ def delete_project(project_id: int, db: Session = Depends(get_db)):
     return None
 
 
+def _format_applicable_sub_areas(catalog: CatalogSnapshot, sub_areas: Iterable[CatalogSubArea]) -> List[dict]:
+    """Format sub-areas with their indicators as ApplicableSubArea dicts sorted by chapter number"""
+    applicable_sub_areas = []
+    for sa in sub_areas:
+        section = catalog.sections.get(sa.section_id)
+        applicable_sub_areas.append({
+            'section_id': sa.section_id,
+            'section_name': section.title if section else '',
+            'chapter_number': section.chapter_number if section else None,
+            'sub_area_id': sa.id,
+            'question': sa.question or '',
+            'basic_requirement': sa.basic_requirement or '',
+            'loe_hours': float(sa.loe_hours) if sa.loe_hours else 0.0,
+            'loe_confidence': sa.loe_confidence or 'medium',
+            'loe_confidence_score': sa.loe_confidence_score or 0,
+            'indicators': [
+                {'id': ind.id, 'indicator_id': ind.indicator_id, 'text': ind.text}
+                for ind in sa.indicators
+            ]
+        })
+
+    # Sort by chapter number
+    applicable_sub_areas.sort(key=lambda x: (x['chapter_number'] or 999, x['sub_area_id']))
+
+    return applicable_sub_areas
+
+
+def _schedule_workbook_prerender(
+    background_tasks: BackgroundTasks,
+    project: Project,
+    versions: dict,
+    catalog: CatalogSnapshot
+) -> None:
+    """Build the project's workbook for its new applicability once the response is sent"""
+    if not EXPORT_PRERENDER:
+        return
+    cache_key = export_cache_key(
+        'workbook', project.applicability_bits, snapshot_version(versions, project.edition_id),
+        WORKBOOK_GENERATOR_VERSION
+    )
+    sub_areas = catalog.sub_areas_for_ordinals(decode_ordinals(project.applicability_bits))
+    background_tasks.add_task(export_jobs.prerender, project.id, project.name, cache_key, catalog, sub_areas)
+
+
 @router.post("/{project_id}/answers", response_model=ProjectApplicabilityResultSchema)
 def submit_project_answers(
     project_id: int,
     answers_data: ProjectAnswersSchema,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
-    """Submit answers for a project and calculate applicable sub-areas"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    """
+    Submit answers for a project and calculate applicable sub-areas
+    The project's workbook is pre-built in the background for the export that usually follows.
+    """
+    project = db.query(Project).options(raiseload("*")).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Delete existing answers and applicability
-    db.query(ProjectAnswer).filter(ProjectAnswer.project_id == project_id).delete()
-    db.query(ProjectApplicability).filter(ProjectApplicability.project_id == project_id).delete()
-
-    # Insert new answers
-    for question_id, answer in answers_data.answers.items():
-        project_answer = ProjectAnswer(
-            project_id=project_id,
-            question_id=question_id,
-            answer=answer
-        )
-        db.add(project_answer)
+    # Write only the answers that changed
+    write_stats = empty_write_stats()
+    answer_map, _ = sync_project_answers(db, project_id, answers_data.answers, True, write_stats)
+
+    # Calculate applicable sub-areas, reusing cached results for identical answer sets
+    versions = get_catalog_versions(db)
+    result_versions = edition_versions(versions, project.edition_id)
+    applicability_cache.sync_version(tuple(sorted(result_versions.items())), partition=project.edition_id)
+    cache_key = answers_cache_key(f'project:{project.edition_id}', answer_map, result_versions)
+
+    engine = get_applicability_engine(db, project.edition_id, engine_version(versions, project.edition_id))
+    catalog = get_catalog(db, project.edition_id, versions)
+    applicable_sub_areas = applicability_cache.get(cache_key)
+    if applicable_sub_areas is None:
+        applicable_sub_area_ids = engine.applicable_sub_area_ids(answer_map)
+
+        # Get detailed sub-area information from the catalog snapshot
+        sub_areas = catalog.sub_areas_for_ids(applicable_sub_area_ids)
+        applicable_sub_areas = _format_applicable_sub_areas(catalog, sub_areas)
+        applicability_cache.set(cache_key, applicable_sub_areas, partition=project.edition_id)
+
+    # Store the applicability bitset in the same transaction
+    save_project_applicability(
+        db, project, engine.encode(sa['sub_area_id'] for sa in applicable_sub_areas), write_stats
+    )
+    _schedule_workbook_prerender(background_tasks, project, versions, catalog)
 
     db.commit()
 
-    # Calculate applicable sub-areas by matching answers with applicability rules
-    # Get all project answers
-    project_answers = db.query(ProjectAnswer).filter(ProjectAnswer.project_id == project_id).all()
-
-    # Create a map of question_id -> answer
-    answer_map = {pa.question_id: pa.answer for pa in project_answers}
-
-    # Get all applicability rules
-    from app.models import ApplicabilityRule
-
-    # Find sub-areas where ALL rules match the answers
-    # Group rules by sub_area_id
-    from collections import defaultdict
-    rules_by_sub_area = defaultdict(list)
-
-    all_rules = db.query(ApplicabilityRule).all()
-    for rule in all_rules:
-        rules_by_sub_area[rule.sub_area_id].append(rule)
-
-    # Check which sub-areas are applicable
-    applicable_sub_area_ids = []
-    for sub_area_id, rules in rules_by_sub_area.items():
-        # A sub-area is applicable if ANY of its rules match (OR logic)
-        # Each rule checks if question_id's answer matches required_answer
-        is_applicable = False
-        for rule in rules:
-            if rule.question_id in answer_map:
-                # Check if answer matches (handle multi-select with comma-separated values)
-                user_answer = answer_map[rule.question_id]
-                required_answer = rule.required_answer
-
-                # Special logic for question 1 (recipient type):
-                # If rule requires "all" (all recipients), it matches state/non_state
-                # If user selected "state" or "non_state", also match "all" rules
-                if rule.question_id == 1:  # Question 1 is recipient type
-                    if required_answer == 'all':
-                        # "all" matches any recipient type selection
-                        is_applicable = True
-                        break
-                    elif user_answer in ['state', 'non_state'] and required_answer == user_answer:
-                        # Exact match for specific recipient type
-                        is_applicable = True
-                        break
-                    elif user_answer == 'all' and required_answer in ['state', 'non_state', 'all']:
-                        # User selected "all" matches any specific type
-                        is_applicable = True
-                        break
-                # For other questions, check exact or multi-select match
-                elif required_answer in user_answer.split(',') or user_answer == required_answer:
-                    is_applicable = True
-                    break
-
-        if is_applicable:
-            applicable_sub_area_ids.append(sub_area_id)
-
-    # Insert applicability records
-    for sub_area_id in applicable_sub_area_ids:
-        applicability = ProjectApplicability(
+    return ProjectApplicabilityResultSchema(
+        project_id=project_id,
+        applicable_count=len(applicable_sub_areas),
+        applicable_sub_areas=applicable_sub_areas,
+        write_stats=ProjectWriteStatsSchema(**write_stats)
+    )
+
+
+@router.patch("/{project_id}/answers", response_model=ProjectApplicabilityDeltaSchema)
+def patch_project_answers(
+    project_id: int,
+    answers_data: ProjectAnswersPatchSchema,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
+    """
+    Change individual answers for a project and return the applicability delta.
+    Only sub-areas with rules on the changed questions are re-evaluated, and only
+    answers and bits that actually change are written. A null answer removes the answer.
+    """
+    project = db.query(Project).options(raiseload("*")).filter(Project.id == project_id).first()
+
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    # Apply only the answers that actually changed
+    write_stats = empty_write_stats()
+    answer_map, changed_questions = sync_project_answers(
+        db, project_id, answers_data.answers, False, write_stats
+    )
+
+    stored_bits = bytes_to_bits(project.applicability_bits)
+
+    if not changed_questions:
+        return ProjectApplicabilityDeltaSchema(
             project_id=project_id,
-            sub_area_id=sub_area_id,
-            is_applicable=True
+            applicable_count=count_bits(stored_bits),
+            write_stats=ProjectWriteStatsSchema(**write_stats)
         )
-        db.add(applicability)
 
-    db.commit()
+    # Re-evaluate only the sub-areas that depend on the changed questions
+    versions = get_catalog_versions(db)
+    engine = get_applicability_engine(db, project.edition_id, engine_version(versions, project.edition_id))
+    affected = engine.affected_sub_areas(changed_questions)
+    new_bits = (stored_bits & ~affected) | (engine.evaluate(answer_map) & affected)
 
-    # Get detailed sub-area information
-    sub_areas = db.query(SubArea).filter(SubArea.id.in_(applicable_sub_area_ids)).all()
-
-    # Get all indicators for applicable sub-areas
-    indicators = db.query(IndicatorOfCompliance).filter(
-        IndicatorOfCompliance.sub_area_id.in_(applicable_sub_area_ids)
-    ).all()
-
-    # Group indicators by sub_area_id
-    indicators_by_sub_area = {}
-    for indicator in indicators:
-        if indicator.sub_area_id not in indicators_by_sub_area:
-            indicators_by_sub_area[indicator.sub_area_id] = []
-        indicators_by_sub_area[indicator.sub_area_id].append({
-            'id': indicator.id,
-            'indicator_id': indicator.indicator_id,
-            'text': indicator.text
-        })
+    added, removed = save_project_applicability(db, project, new_bits, write_stats)
+    added_ids = engine.decode(added)
+    removed_ids = engine.decode(removed)
 
-    # Format as ApplicableSubArea objects and sort by chapter number
-    applicable_sub_areas = []
-    for sa in sub_areas:
-        applicable_sub_areas.append({
-            'section_id': sa.section_id,
-            'section_name': sa.section.title if sa.section else '',
-            'chapter_number': sa.section.chapter_number if sa.section else None,
-            'sub_area_id': sa.id,
-            'question': sa.question or '',
-            'basic_requirement': sa.basic_requirement or '',
-            'loe_hours': float(sa.loe_hours) if sa.loe_hours else 0.0,
-            'loe_confidence': sa.loe_confidence or 'medium',
-            'loe_confidence_score': sa.loe_confidence_score or 0,
-            'indicators': indicators_by_sub_area.get(sa.id, [])
-        })
+    catalog = get_catalog(db, project.edition_id, versions)
+    added_hours = float(sum(sa.loe_hours or 0 for sa in catalog.sub_areas_for_ids(added_ids)))
+    removed_hours = float(sum(sa.loe_hours or 0 for sa in catalog.sub_areas_for_ids(removed_ids)))
+    if added or removed:
+        _schedule_workbook_prerender(background_tasks, project, versions, catalog)
 
-    # Sort by chapter number
-    applicable_sub_areas.sort(key=lambda x: (x['chapter_number'] or 999, x['sub_area_id']))
+    db.commit()
 
-    return ProjectApplicabilityResultSchema(
-        project_id=project.id,
-        applicable_count=len(applicable_sub_areas),
-        applicable_sub_areas=applicable_sub_areas
+    return ProjectApplicabilityDeltaSchema(
+        project_id=project_id,
+        changed_questions=sorted(changed_questions),
+        added_sub_areas=added_ids,
+        removed_sub_areas=removed_ids,
+        added_hours=added_hours,
+        removed_hours=removed_hours,
+        net_hours=added_hours - removed_hours,
+        applicable_count=count_bits(new_bits),
+        write_stats=ProjectWriteStatsSchema(**write_stats)
     )
 
 
 @router.get("/{project_id}/applicable-sub-areas", response_model=ProjectApplicabilityResultSchema)
 def get_project_applicable_sub_areas(project_id: int, db: Session = Depends(get_db)):
     """Get applicable sub-areas for a project"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.query(Project).options(raiseload("*")).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Get applicable sub-areas
-    sub_areas = db.query(SubArea).join(
-        ProjectApplicability,
-        SubArea.id == ProjectApplicability.sub_area_id
-    ).filter(
-        ProjectApplicability.project_id == project_id,
-        ProjectApplicability.is_applicable == True
-    ).order_by(SubArea.section_id, SubArea.id).all()
-
-    # Get all indicators for applicable sub-areas
-    sub_area_ids = [sa.id for sa in sub_areas]
-    indicators = db.query(IndicatorOfCompliance).filter(
-        IndicatorOfCompliance.sub_area_id.in_(sub_area_ids)
-    ).all()
-
-    # Group indicators by sub_area_id
-    indicators_by_sub_area = {}
-    for indicator in indicators:
-        if indicator.sub_area_id not in indicators_by_sub_area:
-            indicators_by_sub_area[indicator.sub_area_id] = []
-        indicators_by_sub_area[indicator.sub_area_id].append({
-            'id': indicator.id,
-            'indicator_id': indicator.indicator_id,
-            'text': indicator.text
-        })
-
-    # Format as ApplicableSubArea objects and sort by chapter number
-    applicable_sub_areas = []
-    for sa in sub_areas:
-        applicable_sub_areas.append({
-            'section_id': sa.section_id,
-            'section_name': sa.section.title if sa.section else '',
-            'chapter_number': sa.section.chapter_number if sa.section else None,
-            'sub_area_id': sa.id,
-            'question': sa.question or '',
-            'basic_requirement': sa.basic_requirement or '',
-            'loe_hours': float(sa.loe_hours) if sa.loe_hours else 0.0,
-            'loe_confidence': sa.loe_confidence or 'medium',
-            'loe_confidence_score': sa.loe_confidence_score or 0,
-            'indicators': indicators_by_sub_area.get(sa.id, [])
-        })
+    # Get applicable sub-areas from the project's bitset
+    catalog = get_catalog(db, project.edition_id)
+    sub_areas = catalog.sub_areas_for_ordinals(decode_ordinals(project.applicability_bits))
 
-    # Sort by chapter number
-    applicable_sub_areas.sort(key=lambda x: (x['chapter_number'] or 999, x['sub_area_id']))
+    applicable_sub_areas = _format_applicable_sub_areas(catalog, sub_areas)
 
     return ProjectApplicabilityResultSchema(
         project_id=project_id,
@@ -311,66 +324,33 @@ def get_project_applicable_sub_areas(project_id: int, db: Session = Depends(get_
 @router.get("/{project_id}/loe-summary", response_model=ProjectLOESummarySchema)
 def get_project_loe_summary(project_id: int, db: Session = Depends(get_db)):
     """Get LOE summary for a project"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+    project = db.query(Project).options(raiseload("*")).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Get summary by section
-    section_summaries = db.query(
-        Section.id,
-        Section.title,
-        Section.chapter_number,
-        func.count(SubArea.id).label('applicable_sub_areas'),
-        func.sum(SubArea.loe_hours).label('section_hours'),
-        func.avg(SubArea.loe_confidence_score).label('avg_confidence')
-    ).join(SubArea, Section.id == SubArea.section_id)\
-    .join(ProjectApplicability, SubArea.id == ProjectApplicability.sub_area_id)\
-    .filter(
-        ProjectApplicability.project_id == project_id,
-        ProjectApplicability.is_applicable == True
-    ).group_by(Section.id, Section.title, Section.chapter_number)\
-    .order_by(Section.chapter_number.asc().nullslast())\
-    .all()
-
-    # Get all applicable sub-areas for this project to count indicators
-    applicable_sub_areas = db.query(SubArea.id, SubArea.section_id).join(
-        ProjectApplicability,
-        SubArea.id == ProjectApplicability.sub_area_id
-    ).filter(
-        ProjectApplicability.project_id == project_id,
-        ProjectApplicability.is_applicable == True
-    ).all()
-
-    sub_area_ids = [sa.id for sa in applicable_sub_areas]
-
-    # Count indicators per section
-    indicator_counts_by_section = {}
-    if sub_area_ids:
-        indicator_counts = db.query(
-            SubArea.section_id,
-            func.count(IndicatorOfCompliance.id).label('indicator_count')
-        ).join(
-            IndicatorOfCompliance,
-            SubArea.id == IndicatorOfCompliance.sub_area_id
-        ).filter(
-            SubArea.id.in_(sub_area_ids)
-        ).group_by(SubArea.section_id).all()
-
-        indicator_counts_by_section = {ic.section_id: ic.indicator_count for ic in indicator_counts}
-
-    sections = [
-        SectionLOESummary(
-            section_id=s.id,
-            section_name=s.title,
-            chapter_number=s.chapter_number,
-            sub_area_count=s.applicable_sub_areas,
-            indicator_count=indicator_counts_by_section.get(s.id, 0),
-            total_hours=float(s.section_hours) if s.section_hours else 0.0,
-            avg_confidence_score=float(s.avg_confidence) if s.avg_confidence else 0.0
-        )
-        for s in section_summaries
-    ]
+    catalog = get_catalog(db, project.edition_id)
+    sub_areas = catalog.sub_areas_for_ordinals(decode_ordinals(project.applicability_bits))
+
+    # Summarize by section
+    sub_areas_by_section = {}
+    for sa in sub_areas:
+        sub_areas_by_section.setdefault(sa.section_id, []).append(sa)
+
+    sections = []
+    for section_id in sorted(sub_areas_by_section, key=lambda section_id: catalog.chapter_rank[section_id]):
+        section = catalog.sections[section_id]
+        section_sub_areas = sub_areas_by_section[section_id]
+        scores = [sa.loe_confidence_score for sa in section_sub_areas if sa.loe_confidence_score is not None]
+        sections.append(SectionLOESummary(
+            section_id=section.id,
+            section_name=section.title,
+            chapter_number=section.chapter_number,
+            sub_area_count=len(section_sub_areas),
+            indicator_count=sum(len(sa.indicators) for sa in section_sub_areas),
+            total_hours=float(sum(sa.loe_hours or 0 for sa in section_sub_areas)),
+            avg_confidence_score=sum(scores) / len(scores) if scores else 0.0
+        ))
 
     # Calculate totals
     total_sub_areas = sum(s.sub_area_count for s in sections)
@@ -389,30 +369,178 @@ def get_project_loe_summary(project_id: int, db: Session = Depends(get_db)):
     )
 
 
+def _if_none_match(request: Request, etag: str) -> bool:
+    """True when the request's If-None-Match header matches the ETag"""
+    header = request.headers.get('if-none-match')
+    if not header:
+        return False
+    tags = [tag.strip() for tag in header.split(',')]
+    return '*' in tags or etag in tags or f'W/{etag}' in tags
+
+
 @router.get("/{project_id}/export-workbook")
-def export_project_workbook(project_id: int, db: Session = Depends(get_db)):
-    """Export project assessment results as Excel workbook"""
-    project = db.query(Project).filter(Project.id == project_id).first()
+def export_project_workbook(project_id: int, request: Request, db: Session = Depends(get_db)):
+    """
+    Export project assessment results as Excel workbook
+    Identical exports are served from the export cache; the ETag changes
+    whenever the project's applicability or its edition's catalog changes.
+    """
+    project = db.query(Project).options(raiseload("*")).filter(Project.id == project_id).first()
 
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
-    # Generate workbook
-    workbook_bytes = generate_project_workbook(db, project_id)
+    versions = get_catalog_versions(db)
+    cache_key = export_cache_key(
+        'workbook', project.applicability_bits, snapshot_version(versions, project.edition_id),
+        WORKBOOK_GENERATOR_VERSION
+    )
+    etag = f'"{cache_key}"'
+
+    if _if_none_match(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    headers = {
+        "Content-Disposition": attachment_header(workbook_filename(project.name)),
+        "ETag": etag,
+        "Cache-Control": "private, no-cache"
+    }
+
+    cached = workbook_export_cache.open(cache_key)
+    if cached is None and export_jobs.wait_for(cache_key):
+        # Built by an in-flight job, e.g. the pre-render scheduled on answer submission
+        cached = workbook_export_cache.open(cache_key)
+    if cached is not None:
+        headers["Content-Length"] = str(os.fstat(cached.fileno()).st_size)
+        return StreamingResponse(iter_file(cached), media_type=XLSX_MEDIA_TYPE, headers=headers)
+
+    # Assemble the workbook from pre-rendered sub-area fragments while streaming
+    catalog = get_catalog(db, project.edition_id, versions)
+    sub_areas = catalog.sub_areas_for_ordinals(decode_ordinals(project.applicability_bits))
+    if not sub_areas:
+        raise HTTPException(status_code=400, detail="Project has no applicable sub-areas to export")
 
-    # Create filename: ProjectName-Scoping Workbook-YYYYMMDD-HHMMSS.xlsx
-    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
-    # Sanitize project name for filename
-    safe_project_name = "".join(c for c in project.name if c.isalnum() or c in (' ', '-', '_')).strip()
-    filename = f"{safe_project_name}-Scoping Workbook-{timestamp}.xlsx"
+    return StreamingResponse(
+        workbook_export_cache.store_stream(cache_key, iter_prerendered_workbook_chunks(catalog, sub_areas)),
+        media_type=XLSX_MEDIA_TYPE,
+        headers=headers
+    )
+
+
+@router.get("/{project_id}/export")
+def export_project_results(
+    project_id: int,
+    format: str = Query("csv", pattern="^(csv|jsonl|parquet)$", description="csv, jsonl or parquet"),
+    db: Session = Depends(get_db)
+):
+    """
+    Export project scoping results as a flat table for BI tools
+    One row per (sub-area, indicator of compliance), streamed as it is encoded.
+    """
+    project = db.query(Project).options(raiseload("*")).filter(Project.id == project_id).first()
+
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
 
-    # URL encode the filename for the Content-Disposition header
-    encoded_filename = urllib.parse.quote(filename)
+    if format == 'parquet' and not parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet export requires the pyarrow package")
+
+    catalog = get_catalog(db, project.edition_id)
+    sub_areas = catalog.sub_areas_for_ordinals(decode_ordinals(project.applicability_bits))
+    rows = iter_export_rows(catalog, sub_areas, project.id, project.name)
+
+    headers = {
+        "Content-Disposition": attachment_header(export_filename(project.name, "Scoping Results", format))
+    }
+    return StreamingResponse(iter_export(format, rows), media_type=EXPORT_MEDIA_TYPES[format], headers=headers)
+
+
+def _escape_like(value: str) -> str:
+    """Escape LIKE wildcards so the value matches literally (with escape="\\")"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+@router.post("/export-bundle")
+def export_project_bundle(selection: ExportBundleRequestSchema, db: Session = Depends(get_db)):
+    """
+    Export the workbooks for several projects as one ZIP archive
+    Projects are selected by id and/or filter; projects with no applicable
+    sub-areas are left out. The archive is streamed while later workbooks
+    are still being generated. Each workbook uses its project's guide edition.
+    """
+    # An empty selection is a mistake, not a request for every project
+    if not (selection.project_ids or selection.review_type or selection.grantee_name or selection.name_contains):
+        raise HTTPException(status_code=422, detail="Select projects by project_ids or at least one filter")
+
+    query = db.query(Project.id, Project.name, Project.edition_id, Project.applicability_bits)
+    if selection.project_ids is not None:
+        query = query.filter(Project.id.in_(selection.project_ids))
+    if selection.review_type is not None:
+        query = query.filter(Project.review_type == selection.review_type)
+    if selection.grantee_name is not None:
+        query = query.filter(Project.grantee_name == selection.grantee_name)
+    if selection.name_contains:
+        query = query.filter(Project.name.ilike(f"%{_escape_like(selection.name_contains)}%", escape="\\"))
+
+    versions = get_catalog_versions(db)
+
+    members = []
+    for project_id, name, edition_id, bits in query.order_by(Project.name):
+        catalog = get_catalog(db, edition_id, versions)
+        if not catalog.sub_areas_for_ordinals(decode_ordinals(bits)):
+            continue
+        members.append(BundleMember(
+            project_id=project_id,
+            project_name=name,
+            applicability_bits=bits,
+            cache_key=export_cache_key(
+                'workbook', bits, snapshot_version(versions, edition_id), WORKBOOK_GENERATOR_VERSION
+            ),
+            catalog=catalog
+        ))
+    if not members:
+        raise HTTPException(status_code=400, detail="No selected project has applicable sub-areas to export")
 
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    headers = {
+        "Content-Disposition": attachment_header(f"Scoping Workbooks-{timestamp}.zip"),
+        "X-Export-Count": str(len(members))
+    }
     return StreamingResponse(
-        workbook_bytes,
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={
-            "Content-Disposition": f"attachment; filename*=UTF-8''{encoded_filename}"
-        }
+        BundleWriter().iter_chunks(members),
+        media_type="application/zip",
+        headers=headers
+    )
+
+
+@router.post("/{project_id}/workbook-import", response_model=WorkbookImportResultSchema, status_code=201)
+def import_project_workbook(project_id: int, file: UploadFile = File(...), db: Session = Depends(get_db)):
+    """
+    Import a completed audit workbook into project findings
+    The upload is read row by row and stored in one transaction; if any row
+    is invalid nothing is stored and the errors are returned with a 422.
+    """
+    project = db.query(Project).options(raiseload("*")).filter(Project.id == project_id).first()
+
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+
+    catalog = get_catalog(db, project.edition_id)
+    try:
+        result = import_workbook(db, project, catalog, file.file, file.filename)
+    except WorkbookFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    response = WorkbookImportResultSchema(
+        import_id=result.import_id,
+        project_id=project_id,
+        filename=file.filename,
+        sheets=result.sheets,
+        rows_read=result.rows_read,
+        findings_imported=result.findings if result.import_id else 0,
+        error_count=result.error_count,
+        errors=[WorkbookImportErrorSchema.model_validate(error) for error in result.errors]
     )
+    if result.error_count:
+        return JSONResponse(status_code=422, content=response.model_dump(mode="json"))
+    return response
@@ -4,53 +4,49 @@ Sections API endpoints
 
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import func, case
-from typing import List
+from decimal import Decimal
+from typing import List, Optional
 
 from app.database.connection import get_db
-from app.models import Section, SubArea
 from app.schemas import SectionSchema, SectionSummarySchema
+from app.routers.editions import EDITION_QUERY, edition_catalog
 
 router = APIRouter(prefix="/api/sections", tags=["sections"])
 
 
 @router.get("", response_model=List[SectionSchema])
-def get_sections(db: Session = Depends(get_db)):
+def get_sections(edition: Optional[str] = EDITION_QUERY, db: Session = Depends(get_db)):
     """Get all sections"""
-    sections = db.query(Section).order_by(Section.id).all()
-    return sections
+    return list(edition_catalog(db, edition).sections.values())
 
 
 @router.get("/summary", response_model=List[SectionSummarySchema])
-def get_sections_summary(db: Session = Depends(get_db)):
+def get_sections_summary(edition: Optional[str] = EDITION_QUERY, db: Session = Depends(get_db)):
     """Get sections with LOE summary"""
-    results = db.query(
-        Section.id,
-        Section.title,
-        func.count(SubArea.id).label('total_sub_areas'),
-        func.sum(SubArea.loe_hours).label('total_hours'),
-        func.avg(SubArea.loe_confidence_score).label('avg_confidence')
-    ).outerjoin(SubArea, Section.id == SubArea.section_id)\
-    .group_by(Section.id, Section.title)\
-    .order_by(func.sum(SubArea.loe_hours).desc().nullslast())\
-    .all()
-
-    return [
-        SectionSummarySchema(
-            id=r.id,
-            title=r.title,
-            total_sub_areas=r.total_sub_areas,
-            total_hours=r.total_hours,
-            avg_confidence=float(r.avg_confidence) if r.avg_confidence else None
-        )
-        for r in results
-    ]
+    catalog = edition_catalog(db, edition)
+
+    summaries = []
+    for section in catalog.sections.values():
+        sub_areas = catalog.section_sub_areas(section.id)
+        hours = [sa.loe_hours for sa in sub_areas if sa.loe_hours is not None]
+        scores = [sa.loe_confidence_score for sa in sub_areas if sa.loe_confidence_score is not None]
+        summaries.append(SectionSummarySchema(
+            id=section.id,
+            title=section.title,
+            total_sub_areas=len(sub_areas),
+            total_hours=sum(hours, Decimal('0')) if hours else None,
+            avg_confidence=sum(scores) / len(scores) if scores else None
+        ))
+
+    # Highest total hours first, sections without hours last
+    summaries.sort(key=lambda s: (s.total_hours is None, -(s.total_hours or 0)))
+    return summaries
 
 
 @router.get("/{section_id}", response_model=SectionSchema)
-def get_section(section_id: str, db: Session = Depends(get_db)):
+def get_section(section_id: str, edition: Optional[str] = EDITION_QUERY, db: Session = Depends(get_db)):
     """Get a specific section"""
-    section = db.query(Section).filter(Section.id == section_id).first()
+    section = edition_catalog(db, edition).sections.get(section_id)
 
     if not section:
         raise HTTPException(status_code=404, detail="Section not found")
@@ -7,8 +7,8 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from app.database.connection import get_db
-from app.models import SubArea
 from app.schemas import SubAreaSchema, SubAreaDetailSchema
+from app.routers.editions import EDITION_QUERY, edition_catalog
 
 router = APIRouter(prefix="/api/sub-areas", tags=["sub-areas"])
 
@@ -16,22 +16,22 @@ router = APIRouter(prefix="/api/sub-areas", tags=["sub-areas"])
 @router.get("", response_model=List[SubAreaSchema])
 def get_sub_areas(
     section_id: Optional[str] = Query(None, description="Filter by section ID"),
+    edition: Optional[str] = EDITION_QUERY,
     db: Session = Depends(get_db)
 ):
     """Get all sub-areas, optionally filtered by section"""
-    query = db.query(SubArea)
+    catalog = edition_catalog(db, edition)
 
     if section_id:
-        query = query.filter(SubArea.section_id == section_id)
+        return catalog.section_sub_areas(section_id)
 
-    sub_areas = query.order_by(SubArea.section_id, SubArea.id).all()
-    return sub_areas
+    return list(catalog.sub_areas.values())
 
 
 @router.get("/{sub_area_id}", response_model=SubAreaDetailSchema)
-def get_sub_area(sub_area_id: str, db: Session = Depends(get_db)):
+def get_sub_area(sub_area_id: str, edition: Optional[str] = EDITION_QUERY, db: Session = Depends(get_db)):
     """Get detailed information for a specific sub-area"""
-    sub_area = db.query(SubArea).filter(SubArea.id == sub_area_id).first()
+    sub_area = edition_catalog(db, edition).sub_areas.get(sub_area_id)
 
     if not sub_area:
         raise HTTPException(status_code=404, detail="Sub-area not found")
@@ -10,11 +10,18 @@ from .project import (
     ProjectCreateSchema,
     ProjectUpdateSchema,
     ProjectAnswersSchema,
+    ProjectAnswersPatchSchema,
+    ExportBundleRequestSchema,
     ProjectApplicabilityResultSchema,
+    ProjectApplicabilityDeltaSchema,
+    ProjectWriteStatsSchema,
     ProjectLOESummarySchema,
     SectionLOESummary
 )
 from .assessment import AssessmentRequestSchema, AssessmentResultSchema
+from .export_job import ExportJobSchema
+from .workbook_import import WorkbookImportErrorSchema, WorkbookImportResultSchema
+from .edition import EditionSchema
 
 __all__ = [
     'QuestionSchema',
@@ -29,9 +36,17 @@ __all__ = [
     'ProjectCreateSchema',
     'ProjectUpdateSchema',
     'ProjectAnswersSchema',
+    'ProjectAnswersPatchSchema',
+    'ExportBundleRequestSchema',
     'ProjectApplicabilityResultSchema',
+    'ProjectApplicabilityDeltaSchema',
+    'ProjectWriteStatsSchema',
     'ProjectLOESummarySchema',
     'SectionLOESummary',
     'AssessmentRequestSchema',
     'AssessmentResultSchema',
+    'ExportJobSchema',
+    'WorkbookImportErrorSchema',
+    'WorkbookImportResultSchema',
+    'EditionSchema',
 ]
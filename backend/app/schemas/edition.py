@@ -0,0 +1,19 @@
+"""
+Guide edition schemas
+"""
+
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class EditionSchema(BaseModel):
+    id: int
+    code: str
+    title: str
+    source_document: Optional[str] = None
+    extraction_date: Optional[datetime] = None
+    is_current: bool
+
+    class Config:
+        from_attributes = True
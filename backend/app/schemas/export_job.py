@@ -0,0 +1,20 @@
+"""
+Export job schemas
+"""
+
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class ExportJobSchema(BaseModel):
+    """Status of a background workbook export"""
+    job_id: str
+    project_id: int
+    status: str  # queued, running, done or failed
+    sheets_done: int
+    sheets_total: int
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    download_url: str
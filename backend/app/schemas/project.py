@@ -15,6 +15,7 @@ class ProjectCreateSchema(BaseModel):
     grantee_name: Optional[str] = None
     grant_number: Optional[str] = None
     review_type: Optional[str] = None
+    edition: Optional[str] = None  # guide edition code, e.g. FY2025 (default: current edition)
 
 
 class ProjectUpdateSchema(BaseModel):
@@ -30,8 +31,22 @@ class ProjectAnswersSchema(BaseModel):
     answers: Dict[int, str]  # question_id: answer_value
 
 
+class ProjectAnswersPatchSchema(BaseModel):
+    """Schema for changing individual project answers"""
+    answers: Dict[int, Optional[str]]  # question_id: answer_value (null removes the answer)
+
+
+class ExportBundleRequestSchema(BaseModel):
+    """Schema for selecting the projects in a workbook bundle, by id or by filter"""
+    project_ids: Optional[List[int]] = None
+    review_type: Optional[str] = None
+    grantee_name: Optional[str] = None
+    name_contains: Optional[str] = None
+
+
 class ProjectSchema(BaseModel):
     id: int
+    edition_id: int
     name: str
     description: Optional[str] = None
     grantee_name: Optional[str] = None
@@ -65,11 +80,34 @@ class ApplicableSubAreaSchema(BaseModel):
     indicators: List[IndicatorOfComplianceSchema] = []
 
 
+class ProjectWriteStatsSchema(BaseModel):
+    """Answer rows written and sub-area bits flipped when saving project answers"""
+    answers_upserted: int = 0
+    answers_deleted: int = 0
+    # Sub-areas that became / stopped being applicable (bits set / cleared in the bitset)
+    applicability_added: int = 0
+    applicability_removed: int = 0
+
+
 class ProjectApplicabilityResultSchema(BaseModel):
     """Result of applicability assessment"""
     project_id: int
     applicable_count: int
     applicable_sub_areas: List[ApplicableSubAreaSchema]
+    write_stats: Optional[ProjectWriteStatsSchema] = None
+
+
+class ProjectApplicabilityDeltaSchema(BaseModel):
+    """Change in applicability caused by an answer update"""
+    project_id: int
+    changed_questions: List[int] = []
+    added_sub_areas: List[str] = []
+    removed_sub_areas: List[str] = []
+    added_hours: float = 0.0
+    removed_hours: float = 0.0
+    net_hours: float = 0.0
+    applicable_count: int
+    write_stats: Optional[ProjectWriteStatsSchema] = None
 
 
 class SectionLOESummary(BaseModel):
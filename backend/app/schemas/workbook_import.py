@@ -0,0 +1,28 @@
+"""
+Workbook import schemas
+"""
+
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class WorkbookImportErrorSchema(BaseModel):
+    """Validation error for one row of an imported workbook"""
+    sheet: str
+    row: int
+    message: str
+
+    class Config:
+        from_attributes = True
+
+
+class WorkbookImportResultSchema(BaseModel):
+    """Result of importing a completed workbook"""
+    import_id: Optional[int] = None  # None when the import was rejected
+    project_id: int
+    filename: Optional[str] = None
+    sheets: int
+    rows_read: int
+    findings_imported: int
+    error_count: int
+    errors: List[WorkbookImportErrorSchema]  # First errors only when error_count is large
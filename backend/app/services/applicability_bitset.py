@@ -0,0 +1,42 @@
+"""
+Applicability Bitset Helpers
+Per-project applicability is stored as a packed bitset in
+projects.applicability_bits: bit N (byte N // 8, bit N % 8 counted from the
+least significant bit, as in PostgreSQL get_bit) is set when the sub-area
+with sub_areas.ordinal = N applies.
+"""
+
+from typing import Iterable, List, Optional
+
+
+def bits_to_bytes(bits: int) -> bytes:
+    """Pack an integer bitset into bytes"""
+    return bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+
+
+def bytes_to_bits(data: Optional[bytes]) -> int:
+    """Unpack stored bytes into an integer bitset (NULL means no sub-areas)"""
+    return int.from_bytes(data, 'little') if data else 0
+
+
+def encode_ordinals(ordinals: Iterable[int]) -> bytes:
+    """Pack sub-area ordinals into bytes"""
+    bits = 0
+    for ordinal in ordinals:
+        bits |= 1 << ordinal
+    return bits_to_bytes(bits)
+
+
+def decode_ordinals(data: Optional[bytes]) -> List[int]:
+    """Return the sub-area ordinals set in stored bytes, in ascending order"""
+    ordinals = []
+    for byte_index, byte in enumerate(data or b''):
+        while byte:
+            low_bit = byte & -byte
+            ordinals.append(byte_index * 8 + low_bit.bit_length() - 1)
+            byte ^= low_bit
+    return ordinals
+
+
+def count_bits(bits: int) -> int:
+    return bin(bits).count('1')
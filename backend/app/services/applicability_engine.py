@@ -0,0 +1,226 @@
+"""
+Applicability Engine Service
+Compiles applicability rules into an in-memory inverted index so that a
+questionnaire submission can be evaluated without scanning every rule.
+One engine is compiled per guide edition, from that edition's rules.
+"""
+
+import threading
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.models import ApplicabilityRule, SubArea
+from app.services.catalog_version import edition_catalog_version, edition_rules_version
+
+# Question 1 is the recipient type question (all, state, non_state)
+RECIPIENT_TYPE_QUESTION_ID = 1
+RECIPIENT_TYPES = ('state', 'non_state')
+
+
+# A rule's conditions: (question_id, required_answer) pairs, all of which must hold
+Conditions = Sequence[Tuple[int, str]]
+
+
+def _condition_keys(question_id: int, required_answer: str) -> List[Tuple[int, Optional[str]]]:
+    """
+    Index keys under which a condition is stored. Question 1 (recipient type)
+    is compiled to the answers it matches: a required "all" matches any
+    answer (key None), "state"/"non_state" match that answer or an "all"
+    answer, and any other required answer can never match.
+    """
+    if question_id != RECIPIENT_TYPE_QUESTION_ID:
+        return [(question_id, required_answer)]
+    if required_answer == 'all':
+        return [(question_id, None)]
+    if required_answer in RECIPIENT_TYPES:
+        return [(question_id, required_answer), (question_id, 'all')]
+    return []
+
+
+def _answer_keys(question_id: int, answer: str) -> Set[Tuple[int, Optional[str]]]:
+    """Index keys an answer looks up; at most one key per condition can match"""
+    if question_id == RECIPIENT_TYPE_QUESTION_ID:
+        return {(question_id, None), (question_id, answer)}
+    # Multi-select answers are stored comma-separated; also match
+    # the full answer in case a required answer contains a comma
+    return {(question_id, key) for key in set(answer.split(',')) | {answer}}
+
+
+class ApplicabilityEngine:
+    """
+    Applicability rules compiled into an inverted index.
+
+    Sets of sub-areas are kept as integer bitsets (bit N set = sub-area with
+    ordinal N), using the sub_areas.ordinal column so that evaluated bitsets
+    can be stored directly in projects.applicability_bits. A rule is a
+    sub-area and its conditions: it matches when ALL of its conditions hold
+    (a rule without conditions always matches), and a sub-area is applicable
+    if ANY of its rules match (OR logic).
+
+    Single-condition rules map their (question_id, answer) key straight to a
+    sub-area bitset. Rules with several conditions are listed under each of
+    their keys and match once every condition was hit, so evaluating a
+    submission only touches the answered keys.
+    """
+
+    def __init__(
+        self,
+        rules: Iterable[Tuple[str, Conditions]],
+        version: Optional[Hashable] = None,
+        ordinals: Optional[Dict[str, int]] = None
+    ):
+        rules = [(sub_area_id, list(dict.fromkeys(conditions))) for sub_area_id, conditions in rules]
+        self.version = version
+
+        # Without stored ordinals, assign dense, deterministic ones
+        if ordinals is None:
+            rule_sub_area_ids = sorted({sub_area_id for sub_area_id, _ in rules})
+            ordinals = {sa_id: i for i, sa_id in enumerate(rule_sub_area_ids)}
+        self.ordinals: Dict[str, int] = dict(ordinals)
+        self.sub_area_ids: List[Optional[str]] = [None] * (max(self.ordinals.values(), default=-1) + 1)
+        for sub_area_id, ordinal in self.ordinals.items():
+            self.sub_area_ids[ordinal] = sub_area_id
+
+        index: Dict[Tuple[int, Optional[str]], int] = defaultdict(int)
+        compound_index: Dict[Tuple[int, Optional[str]], List[int]] = defaultdict(list)
+        question_bits: Dict[int, int] = defaultdict(int)
+        self.always_bits = 0
+        # (sub-area bit, number of conditions) of each rule with several conditions
+        self.compound_rules: List[Tuple[int, int]] = []
+
+        for sub_area_id, conditions in rules:
+            bit = 1 << self.ordinals[sub_area_id]
+            for question_id, _ in conditions:
+                question_bits[question_id] |= bit
+
+            if not conditions:
+                self.always_bits |= bit
+            elif len(conditions) == 1:
+                for key in _condition_keys(*conditions[0]):
+                    index[key] |= bit
+            else:
+                rule_number = len(self.compound_rules)
+                self.compound_rules.append((bit, len(conditions)))
+                for condition in conditions:
+                    for key in _condition_keys(*condition):
+                        compound_index[key].append(rule_number)
+
+        # Reverse index: question_id -> sub-areas whose applicability depends on it
+        self.question_sub_areas: Dict[int, int] = dict(question_bits)
+
+        self.index: Dict[Tuple[int, Optional[str]], int] = dict(index)
+        self.compound_index: Dict[Tuple[int, Optional[str]], List[int]] = dict(compound_index)
+        self.rule_count = len(rules)
+
+    @classmethod
+    def from_db(cls, db: Session, edition_id: int, version: Optional[Hashable] = None) -> "ApplicabilityEngine":
+        """
+        Compile the engine from an edition's active applicability rules and
+        sub-area ordinals. Each project rule is one (question_id,
+        required_answer) condition; condition-only rules without a question
+        are evaluated by rule_evaluator for POST /api/assess instead.
+        """
+        rows = db.query(
+            ApplicabilityRule.sub_area_id,
+            ApplicabilityRule.question_id,
+            ApplicabilityRule.required_answer
+        ).filter(
+            ApplicabilityRule.edition_id == edition_id,
+            ApplicabilityRule.is_active.isnot(False),
+            ApplicabilityRule.question_id.isnot(None)
+        ).all()
+        ordinals = dict(
+            db.query(SubArea.id, SubArea.ordinal)
+            .filter(SubArea.edition_id == edition_id, SubArea.ordinal.isnot(None))
+            .all()
+        )
+        rules = [
+            (row.sub_area_id, [(row.question_id, row.required_answer)])
+            for row in rows
+            if row.sub_area_id in ordinals
+        ]
+        return cls(rules, version, ordinals)
+
+    def evaluate(self, answers: Dict[int, str]) -> int:
+        """Return the bitset of sub-areas applicable for a question_id -> answer map"""
+        bits = self.always_bits
+        hits: Dict[int, int] = defaultdict(int)
+        for question_id, answer in answers.items():
+            if answer is None:
+                continue
+
+            for key in _answer_keys(question_id, answer):
+                bits |= self.index.get(key, 0)
+                for rule_number in self.compound_index.get(key, ()):
+                    hits[rule_number] += 1
+
+        for rule_number, hit_count in hits.items():
+            bit, condition_count = self.compound_rules[rule_number]
+            if hit_count == condition_count:
+                bits |= bit
+
+        return bits
+
+    def affected_sub_areas(self, question_ids: Iterable[int]) -> int:
+        """Return the bitset of sub-areas having a rule on any of the given questions"""
+        bits = 0
+        for question_id in question_ids:
+            bits |= self.question_sub_areas.get(question_id, 0)
+        return bits
+
+    def encode(self, sub_area_ids: Iterable[str]) -> int:
+        """Convert sub-area ids into a bitset, ignoring ids without rules"""
+        bits = 0
+        for sub_area_id in sub_area_ids:
+            ordinal = self.ordinals.get(sub_area_id)
+            if ordinal is not None:
+                bits |= 1 << ordinal
+        return bits
+
+    def decode(self, bits: int) -> List[str]:
+        """Convert a sub-area bitset into a list of sub-area ids"""
+        sub_area_ids = []
+        while bits:
+            low_bit = bits & -bits
+            ordinal = low_bit.bit_length() - 1
+            if ordinal < len(self.sub_area_ids) and self.sub_area_ids[ordinal] is not None:
+                sub_area_ids.append(self.sub_area_ids[ordinal])
+            bits ^= low_bit
+        return sub_area_ids
+
+    def applicable_sub_area_ids(self, answers: Dict[int, str]) -> List[str]:
+        """Return ids of the sub-areas applicable for the given answers"""
+        return self.decode(self.evaluate(answers))
+
+
+_engines: Dict[int, ApplicabilityEngine] = {}
+_engine_lock = threading.Lock()
+
+
+def get_applicability_engine(db: Session, edition_id: int, version: Optional[Hashable] = None) -> ApplicabilityEngine:
+    """
+    Get the process-wide compiled engine of an edition, compiling it on first use.
+    When a version is given (see engine_version()), the engine is recompiled
+    if it was compiled against a different version.
+    """
+    engine = _engines.get(edition_id)
+    if engine is None or (version is not None and engine.version != version):
+        with _engine_lock:
+            engine = _engines.get(edition_id)
+            if engine is None or (version is not None and engine.version != version):
+                engine = ApplicabilityEngine.from_db(db, edition_id, version)
+                _engines[edition_id] = engine
+    return engine
+
+
+def engine_version(versions: Dict[str, int], edition_id: int) -> Tuple[int, int]:
+    """Engine version of an edition for the given catalog versions; ordinals come from its catalog"""
+    return edition_rules_version(versions, edition_id), edition_catalog_version(versions, edition_id)
+
+
+def invalidate_applicability_engine() -> None:
+    """Drop the compiled engines so the next requests recompile them"""
+    with _engine_lock:
+        _engines.clear()
@@ -0,0 +1,251 @@
+"""
+Catalog Snapshot Service
+Read-only, in-memory copy of the regulatory catalog (sections, sub-areas,
+indicators of compliance and deficiencies). The catalog only changes when a
+new Comprehensive Review Guide is loaded, so read paths are served from a
+snapshot per guide edition, rebuilt and swapped whenever that edition's
+catalog version changes. Snapshots of different editions are cached side by
+side, so projects pinned to an older edition keep being served from memory.
+"""
+
+import threading
+from dataclasses import dataclass
+from decimal import Decimal
+from types import MappingProxyType
+from typing import Dict, Hashable, Iterable, List, Mapping, Optional, Tuple
+
+from sqlalchemy.orm import Session, load_only, raiseload
+
+from app.models import Section, SubArea, IndicatorOfCompliance, Deficiency
+from app.services.catalog_version import edition_catalog_version, get_catalog_versions
+from app.services.editions import get_editions
+
+
+@dataclass(frozen=True)
+class CatalogIndicator:
+    id: int
+    sub_area_id: str
+    indicator_id: str
+    text: str
+
+
+@dataclass(frozen=True)
+class CatalogDeficiency:
+    id: int
+    sub_area_id: str
+    code: str
+    title: str
+    determination: Optional[str]
+    suggested_corrective_action: Optional[str]
+
+
+@dataclass(frozen=True)
+class CatalogSubArea:
+    id: str
+    section_id: str
+    ordinal: Optional[int]
+    question: str
+    basic_requirement: Optional[str]
+    applicability: Optional[str]
+    detailed_explanation: Optional[str]
+    instructions_for_reviewer: Optional[str]
+    loe_hours: Optional[Decimal]
+    loe_confidence: Optional[str]
+    loe_confidence_score: Optional[int]
+    loe_reasoning: Optional[str]
+    indicators: Tuple[CatalogIndicator, ...]
+    deficiencies: Tuple[CatalogDeficiency, ...]
+
+
+@dataclass(frozen=True)
+class CatalogSection:
+    id: str
+    title: str
+    page_range: Optional[str]
+    purpose: Optional[str]
+    chapter_number: Optional[int]
+    sub_area_ids: Tuple[str, ...]
+
+
+def chapter_sort_key(section: CatalogSection) -> Tuple[int, str]:
+    """Order sections by chapter number, sections without one last"""
+    return (section.chapter_number or 999, section.id)
+
+
+class CatalogSnapshot:
+    """
+    Immutable catalog snapshot of one guide edition at one catalog version.
+
+    Sections are keyed in id order and sub-areas in (section_id, id) order;
+    indicators and deficiencies are pre-grouped on their sub-area, and
+    chapter_order lists section ids in workbook/report order.
+    """
+
+    def __init__(
+        self,
+        sections: Iterable[CatalogSection],
+        sub_areas: Iterable[CatalogSubArea],
+        version: Optional[Hashable] = None,
+        edition_id: Optional[int] = None
+    ):
+        self.version = version
+        self.edition_id = edition_id
+        self.sections: Mapping[str, CatalogSection] = MappingProxyType(
+            {section.id: section for section in sorted(sections, key=lambda s: s.id)}
+        )
+        self.sub_areas: Mapping[str, CatalogSubArea] = MappingProxyType(
+            {sa.id: sa for sa in sorted(sub_areas, key=lambda sa: (sa.section_id, sa.id))}
+        )
+        self.chapter_order: Tuple[str, ...] = tuple(
+            section.id for section in sorted(self.sections.values(), key=chapter_sort_key)
+        )
+        self.chapter_rank: Mapping[str, int] = MappingProxyType(
+            {section_id: rank for rank, section_id in enumerate(self.chapter_order)}
+        )
+        self._by_ordinal: Dict[int, CatalogSubArea] = {
+            sa.ordinal: sa for sa in self.sub_areas.values() if sa.ordinal is not None
+        }
+
+    @classmethod
+    def from_db(cls, db: Session, edition_id: int, version: Optional[Hashable] = None) -> "CatalogSnapshot":
+        """
+        Load the full catalog of an edition with one query per table.
+        Collections are grouped here from their own queries, so no
+        relationship may load on the side (raiseload).
+        """
+        indicators: Dict[str, List[CatalogIndicator]] = {}
+        for row in db.query(IndicatorOfCompliance).options(
+            load_only(
+                IndicatorOfCompliance.id, IndicatorOfCompliance.sub_area_id,
+                IndicatorOfCompliance.indicator_id, IndicatorOfCompliance.text
+            ),
+            raiseload("*")
+        ).filter(
+            IndicatorOfCompliance.edition_id == edition_id
+        ).order_by(
+            IndicatorOfCompliance.sub_area_id, IndicatorOfCompliance.id
+        ):
+            indicators.setdefault(row.sub_area_id, []).append(CatalogIndicator(
+                id=row.id,
+                sub_area_id=row.sub_area_id,
+                indicator_id=row.indicator_id,
+                text=row.text
+            ))
+
+        deficiencies: Dict[str, List[CatalogDeficiency]] = {}
+        for row in db.query(Deficiency).options(
+            load_only(
+                Deficiency.id, Deficiency.sub_area_id, Deficiency.code, Deficiency.title,
+                Deficiency.determination, Deficiency.suggested_corrective_action
+            ),
+            raiseload("*")
+        ).filter(
+            Deficiency.edition_id == edition_id
+        ).order_by(Deficiency.sub_area_id, Deficiency.id):
+            deficiencies.setdefault(row.sub_area_id, []).append(CatalogDeficiency(
+                id=row.id,
+                sub_area_id=row.sub_area_id,
+                code=row.code,
+                title=row.title,
+                determination=row.determination,
+                suggested_corrective_action=row.suggested_corrective_action
+            ))
+
+        sub_areas = [
+            CatalogSubArea(
+                id=row.id,
+                section_id=row.section_id,
+                ordinal=row.ordinal,
+                question=row.question,
+                basic_requirement=row.basic_requirement,
+                applicability=row.applicability,
+                detailed_explanation=row.detailed_explanation,
+                instructions_for_reviewer=row.instructions_for_reviewer,
+                loe_hours=row.loe_hours,
+                loe_confidence=row.loe_confidence,
+                loe_confidence_score=row.loe_confidence_score,
+                loe_reasoning=row.loe_reasoning,
+                indicators=tuple(indicators.get(row.id, ())),
+                deficiencies=tuple(deficiencies.get(row.id, ()))
+            )
+            for row in db.query(SubArea).options(
+                raiseload("*")
+            ).filter(SubArea.edition_id == edition_id).order_by(SubArea.section_id, SubArea.id)
+        ]
+
+        sub_area_ids: Dict[str, List[str]] = {}
+        for sa in sub_areas:
+            sub_area_ids.setdefault(sa.section_id, []).append(sa.id)
+
+        sections = [
+            CatalogSection(
+                id=row.id,
+                title=row.title,
+                page_range=row.page_range,
+                purpose=row.purpose,
+                chapter_number=row.chapter_number,
+                sub_area_ids=tuple(sub_area_ids.get(row.id, ()))
+            )
+            for row in db.query(Section).options(
+                raiseload("*")
+            ).filter(Section.edition_id == edition_id)
+        ]
+
+        return cls(sections, sub_areas, version, edition_id)
+
+    def section_sub_areas(self, section_id: str) -> List[CatalogSubArea]:
+        section = self.sections.get(section_id)
+        return [self.sub_areas[sa_id] for sa_id in section.sub_area_ids] if section else []
+
+    def sub_areas_for_ids(self, sub_area_ids: Iterable[str]) -> List[CatalogSubArea]:
+        """Sub-areas for the given ids in catalog order, ignoring unknown ids"""
+        wanted = set(sub_area_ids)
+        return [sa for sa_id, sa in self.sub_areas.items() if sa_id in wanted]
+
+    def sub_areas_for_ordinals(self, ordinals: Iterable[int]) -> List[CatalogSubArea]:
+        """Sub-areas for bitset ordinals in catalog order, ignoring unknown ordinals"""
+        found = [self._by_ordinal[o] for o in ordinals if o in self._by_ordinal]
+        return sorted(found, key=lambda sa: (sa.section_id, sa.id))
+
+
+_snapshots: Dict[int, CatalogSnapshot] = {}
+_snapshot_lock = threading.Lock()
+
+
+def snapshot_version(versions: Dict[str, int], edition_id: int) -> Tuple[int, int]:
+    """Version of an edition's snapshot: (edition_id, that edition's catalog version)"""
+    return edition_id, edition_catalog_version(versions, edition_id)
+
+
+def get_catalog(
+    db: Session,
+    edition_id: Optional[int] = None,
+    versions: Optional[Dict[str, int]] = None
+) -> CatalogSnapshot:
+    """
+    Get the catalog snapshot of an edition (the current edition by default),
+    (re)loading it when that edition's catalog version differs from the
+    snapshot's. Pass the catalog versions when they have already been read
+    in this request.
+    """
+    if versions is None:
+        versions = get_catalog_versions(db)
+    if edition_id is None:
+        edition_id = get_editions(db, versions).current_id
+    version = snapshot_version(versions, edition_id)
+
+    snapshot = _snapshots.get(edition_id)
+    if snapshot is None or snapshot.version != version:
+        with _snapshot_lock:
+            snapshot = _snapshots.get(edition_id)
+            if snapshot is None or snapshot.version != version:
+                # Build fully before publishing, so readers never see a partial snapshot
+                snapshot = CatalogSnapshot.from_db(db, edition_id, version)
+                _snapshots[edition_id] = snapshot
+    return snapshot
+
+
+def invalidate_catalog() -> None:
+    """Drop every snapshot so the next requests reload them"""
+    with _snapshot_lock:
+        _snapshots.clear()
@@ -0,0 +1,49 @@
+"""
+Catalog Version Service
+Reads the trigger-maintained version counters for rules and catalog data
+"""
+
+from typing import Dict
+
+from sqlalchemy.orm import Session
+
+from app.models import CatalogVersion
+
+# Version groups. Each edition has its own counter in a group,
+# '<group>:<edition_id>', bumped by any change to that edition's rows; the
+# group counter itself is bumped by TRUNCATE, which also bumps every
+# edition's counter.
+# Rules: applicability_rules / rule_conditions
+RULES_VERSION = 'applicability_rules'
+# Catalog: sections, sub_areas, indicators and deficiencies. The group
+# counter is also bumped by changes to guide_editions.
+CATALOG_VERSION = 'catalog'
+
+
+def get_catalog_versions(db: Session) -> Dict[str, int]:
+    """Return the current version of every tracked table group"""
+    rows = db.query(CatalogVersion.name, CatalogVersion.version).all()
+    versions = {RULES_VERSION: 0, CATALOG_VERSION: 0}
+    versions.update({row.name: row.version for row in rows})
+    return versions
+
+
+def edition_rules_version(versions: Dict[str, int], edition_id: int) -> int:
+    """Version of one edition's applicability rules and their conditions"""
+    return versions.get(f"{RULES_VERSION}:{edition_id}", 0)
+
+
+def edition_catalog_version(versions: Dict[str, int], edition_id: int) -> int:
+    """
+    Version of one edition's catalog ('catalog:<edition_id>'), bumped only
+    by changes to that edition's sections, sub-areas, indicators or deficiencies
+    """
+    return versions.get(f"{CATALOG_VERSION}:{edition_id}", 0)
+
+
+def edition_versions(versions: Dict[str, int], edition_id: int) -> Dict[str, int]:
+    """The versions that results computed for one edition depend on: its rules and its catalog"""
+    return {
+        RULES_VERSION: edition_rules_version(versions, edition_id),
+        CATALOG_VERSION: edition_catalog_version(versions, edition_id),
+    }
@@ -0,0 +1,89 @@
+"""
+Guide Edition Service
+In-memory list of Comprehensive Review Guide editions, reloaded whenever the
+'catalog' version changes (adding an edition or switching the current one
+bumps it), so resolving a project's or request's edition costs no query.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models import GuideEdition
+from app.services.catalog_version import get_catalog_versions, CATALOG_VERSION
+
+
+@dataclass(frozen=True)
+class Edition:
+    id: int
+    code: str
+    title: str
+    source_document: Optional[str]
+    extraction_date: Optional[datetime]
+    is_current: bool
+
+
+class EditionRegistry:
+    """Editions by id and by code, plus the current edition new projects use"""
+
+    def __init__(self, editions: Iterable[Edition], version: Optional[int] = None):
+        self.version = version
+        self.by_id: Dict[int, Edition] = {edition.id: edition for edition in sorted(editions, key=lambda e: e.id)}
+        self.by_code: Dict[str, Edition] = {edition.code.upper(): edition for edition in self.by_id.values()}
+        self.current: Optional[Edition] = next((e for e in self.by_id.values() if e.is_current), None)
+
+    @classmethod
+    def from_db(cls, db: Session, version: Optional[int] = None) -> "EditionRegistry":
+        return cls(
+            (
+                Edition(
+                    id=row.id,
+                    code=row.code,
+                    title=row.title,
+                    source_document=row.source_document,
+                    extraction_date=row.extraction_date,
+                    is_current=row.is_current
+                )
+                for row in db.query(GuideEdition)
+            ),
+            version
+        )
+
+    @property
+    def current_id(self) -> int:
+        if self.current is None:
+            raise LookupError("No current guide edition (see guide_editions.is_current)")
+        return self.current.id
+
+    def resolve(self, code: Optional[str]) -> Optional[Edition]:
+        """Edition for a code such as 'FY2025' (case-insensitive); the current edition when code is None"""
+        if code is None:
+            return self.current
+        return self.by_code.get(code.strip().upper())
+
+
+_registry: Optional[EditionRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_editions(db: Session, versions: Optional[Dict[str, int]] = None) -> EditionRegistry:
+    """
+    Get the edition registry, reloading it when the 'catalog' version
+    differs from the registry's. Pass the catalog versions when they have
+    already been read in this request.
+    """
+    global _registry
+    if versions is None:
+        versions = get_catalog_versions(db)
+    version = versions[CATALOG_VERSION]
+
+    registry = _registry
+    if registry is None or registry.version != version:
+        with _registry_lock:
+            if _registry is None or _registry.version != version:
+                _registry = EditionRegistry.from_db(db, version)
+            registry = _registry
+    return registry
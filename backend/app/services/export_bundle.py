@@ -0,0 +1,113 @@
+"""
+Export Bundle Service
+Streams a ZIP archive holding the scoping workbooks for many projects.
+Workbooks are rendered by the export job pool a few projects ahead of the
+archive writer and read back from the export cache, so memory use does not
+grow with the number of projects in the bundle. Each workbook is built
+from the catalog of its project's guide edition.
+"""
+
+import zipfile
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Iterable, Iterator, Optional, Set, Tuple
+
+from app.services.applicability_bitset import decode_ordinals
+from app.services.catalog import CatalogSnapshot
+from app.services.export_cache import ExportCache, iter_file, workbook_export_cache
+from app.services.export_jobs import ExportJob, ExportJobManager, ExportQueueFull, ExportTimeout, export_jobs
+from app.services.workbook_generator import build_workbook_data, iter_prerendered_workbook_chunks, workbook_filename
+from app.services.xlsx_stream import ChunkSink
+
+
+@dataclass(frozen=True)
+class BundleMember:
+    project_id: int
+    project_name: str
+    applicability_bits: bytes
+    cache_key: str
+    catalog: CatalogSnapshot
+
+
+def _member_name(member: BundleMember, used: Set[str]) -> str:
+    """Workbook filename for a member, de-duplicated within the archive"""
+    name = workbook_filename(member.project_name)
+    stem, ext = name.rsplit('.', 1)
+    candidate, n = name, 2
+    while candidate in used:
+        candidate = f"{stem} ({n}).{ext}"
+        n += 1
+    used.add(candidate)
+    return candidate
+
+
+class BundleWriter:
+    """Writes bundle members into a streamed ZIP, rendering up to `window` workbooks ahead"""
+
+    def __init__(
+        self,
+        jobs: ExportJobManager = export_jobs,
+        cache: ExportCache = workbook_export_cache,
+        window: Optional[int] = None,
+        chunk_size: int = 64 * 1024
+    ):
+        self.jobs = jobs
+        self.cache = cache
+        self.window = window or jobs.max_workers * 2
+        self.chunk_size = chunk_size
+
+    def _start(self, member: BundleMember) -> Optional[ExportJob]:
+        """Queue a member's workbook unless it is cached; None means render it inline"""
+        if self.cache.contains(member.cache_key):
+            return None
+        sub_areas = member.catalog.sub_areas_for_ordinals(decode_ordinals(member.applicability_bits))
+        try:
+            job, _ = self.jobs.submit(
+                member.project_id, member.project_name, member.cache_key,
+                build_workbook_data(member.catalog, sub_areas)
+            )
+        except ExportQueueFull:
+            return None
+        return job
+
+    def _workbook_chunks(self, member: BundleMember, job: Optional[ExportJob]) -> Iterator[bytes]:
+        # Same limit as a direct export waiting for an in-flight job; raising
+        # aborts the bundle stream instead of holding the request forever
+        if job is not None and not job.wait(self.jobs.wait_timeout):
+            raise ExportTimeout(f"Workbook for project {member.project_id} not ready after {self.jobs.wait_timeout}s")
+        cached = self.cache.open(member.cache_key)
+        if cached is not None:
+            yield from iter_file(cached)
+            return
+        # Not rendered by the pool (queue full, job failed or file evicted)
+        sub_areas = member.catalog.sub_areas_for_ordinals(decode_ordinals(member.applicability_bits))
+        yield from self.cache.store_stream(
+            member.cache_key, iter_prerendered_workbook_chunks(member.catalog, sub_areas)
+        )
+
+    def iter_chunks(self, members: Iterable[BundleMember]) -> Iterator[bytes]:
+        """Stream the ZIP archive in member order"""
+        members = iter(members)
+        pending: Deque[Tuple[BundleMember, Optional[ExportJob]]] = deque()
+
+        def fill() -> None:
+            while len(pending) < self.window:
+                member = next(members, None)
+                if member is None:
+                    return
+                pending.append((member, self._start(member)))
+
+        sink = ChunkSink()
+        used: Set[str] = set()
+        # Workbooks are already deflated, so members are stored as-is
+        with zipfile.ZipFile(sink, mode='w', compression=zipfile.ZIP_STORED) as zf:
+            fill()
+            while pending:
+                member, job = pending.popleft()
+                fill()
+                with zf.open(_member_name(member, used), mode='w', force_zip64=True) as entry:
+                    for chunk in self._workbook_chunks(member, job):
+                        entry.write(chunk)
+                        if len(sink.buffer) >= self.chunk_size:
+                            yield sink.drain()
+        yield sink.drain()
@@ -0,0 +1,169 @@
+"""
+Export Cache Service
+Content-addressed on-disk cache for generated export files. An export is
+keyed by a hash of everything its content depends on (the project's
+applicability bitset, the catalog version and the generator version), so
+identical exports are generated once and served from disk afterwards.
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import urllib.parse
+from typing import BinaryIO, Hashable, Iterable, Iterator, Optional
+
+
+class ExportCache:
+    """
+    Directory of export files with size-bounded LRU eviction.
+
+    Files are written to a temporary name and renamed into place when
+    complete, so readers never see a partial export. A cache hit touches the
+    file's mtime; when the directory grows past max_bytes the least recently
+    used files are removed first.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, suffix: str = '.xlsx'):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.suffix = suffix
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.suffix)
+
+    def open(self, key: str) -> Optional[BinaryIO]:
+        """Open a cached export for reading, or return None on a miss"""
+        path = self._path(key)
+        try:
+            f = open(path, 'rb')
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return f
+
+    def temp_path(self) -> str:
+        """Reserve a temporary file in the cache directory for a new export"""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(fd)
+        return tmp_path
+
+    def publish(self, key: str, tmp_path: str) -> None:
+        """Move a completed export into place under its key"""
+        os.replace(tmp_path, self._path(key))
+        self.evict()
+
+    def contains(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def store_stream(self, key: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """
+        Pass chunks through while writing them to the cache.
+        The file is only published once every chunk has been written; if
+        the stream is abandoned (e.g. the client disconnects) it is discarded.
+        """
+        tmp_path = self.temp_path()
+        completed = False
+        try:
+            with open(tmp_path, 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    yield chunk
+            self.publish(key, tmp_path)
+            completed = True
+        finally:
+            if not completed:
+                discard(tmp_path)
+
+    def evict(self) -> None:
+        """Remove least recently used exports until the directory fits in max_bytes"""
+        with self._lock:
+            try:
+                entries = [e for e in os.scandir(self.directory) if e.name.endswith(self.suffix)]
+            except FileNotFoundError:
+                return
+
+            files = []
+            for entry in entries:
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                    self.evictions += 1
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+    def stats(self) -> dict:
+        return {
+            "directory": self.directory,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def export_cache_key(
+    kind: str,
+    applicability_bits: Optional[bytes],
+    catalog_version: Hashable,
+    generator_version: str
+) -> str:
+    """
+    Content hash identifying an export; also used as its ETag.
+    catalog_version is the snapshot version of the project's edition (see
+    catalog.snapshot_version()), so exports of different editions never collide.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{kind}:{catalog_version}:{generator_version}:".encode('utf-8'))
+    digest.update(applicability_bits or b'')
+    return digest.hexdigest()
+
+
+def discard(path: str) -> None:
+    """Remove a file if it exists"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def attachment_header(filename: str) -> str:
+    """Content-Disposition value for a download, URL-encoding the filename"""
+    return f"attachment; filename*=UTF-8''{urllib.parse.quote(filename)}"
+
+
+def iter_file(f: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Read an open file in chunks, closing it when done"""
+    with f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+
+# Shared cache for workbook exports
+workbook_export_cache = ExportCache(
+    directory=os.getenv("EXPORT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "fta_export_cache")),
+    max_bytes=int(os.getenv("EXPORT_CACHE_MAX_MB", 512)) * 1024 * 1024
+)
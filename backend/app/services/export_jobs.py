@@ -0,0 +1,266 @@
+"""
+Export Job Service
+Background workbook generation. Jobs render in a bounded process pool so
+large exports do not tie up request threads, report per-sheet progress and
+publish their file into the export cache when done. Requests for an export
+that is already queued or running join the existing job.
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.catalog import CatalogSnapshot, CatalogSubArea
+from app.services.export_cache import ExportCache, discard, workbook_export_cache
+from app.services.workbook_generator import build_workbook_data, iter_workbook_chunks
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+class ExportQueueFull(Exception):
+    """Raised when the export queue is at its depth limit"""
+
+
+class ExportTimeout(Exception):
+    """Raised when an export job does not finish within the wait timeout"""
+
+
+@dataclass
+class ExportJob:
+    id: str
+    project_id: int
+    project_name: str
+    cache_key: str
+    total: int
+    status: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    tmp_path: Optional[str] = None
+    finished: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def progress_path(self) -> Optional[str]:
+        return self.tmp_path + '.progress' if self.tmp_path else None
+
+    @property
+    def active(self) -> bool:
+        return self.status in (QUEUED, RUNNING)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Block until the job is done or failed; False on timeout"""
+        return self.finished.wait(timeout)
+
+
+def render_workbook_file(data: Dict[str, Any], tmp_path: str, progress_path: str) -> None:
+    """
+    Write the workbook for workbook data to tmp_path (runs in a worker process).
+    The number of sheets written so far is kept in progress_path.
+    """
+    def report(done: int) -> None:
+        with open(progress_path, 'w') as f:
+            f.write(str(done))
+
+    report(0)
+    with open(tmp_path, 'wb') as f:
+        for chunk in iter_workbook_chunks(data, on_sheet_done=report):
+            f.write(chunk)
+
+
+class ExportJobManager:
+    """
+    Tracks export jobs for this process.
+
+    At most queue_limit jobs may be queued or running at once; finished jobs
+    are kept for job_ttl seconds so clients can poll for and download them.
+    Direct exports wait up to wait_timeout seconds for an in-flight job.
+    Jobs render in a spawned process pool unless an executor is given.
+    """
+
+    def __init__(
+        self,
+        cache: ExportCache,
+        max_workers: int = 2,
+        queue_limit: int = 16,
+        job_ttl: int = 3600,
+        wait_timeout: float = 30,
+        executor: Optional[Executor] = None
+    ):
+        self.cache = cache
+        self.max_workers = max_workers
+        self.queue_limit = queue_limit
+        self.job_ttl = job_ttl
+        self.wait_timeout = wait_timeout
+        self._jobs: Dict[str, ExportJob] = {}
+        self._active: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[Executor] = executor
+
+    def _get_pool(self) -> Executor:
+        # Workers are spawned rather than forked so they do not inherit the
+        # parent's database connections and threads
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._pool
+
+    def submit(self, project_id: int, project_name: str, cache_key: str, data: Dict[str, Any]) -> Tuple[ExportJob, bool]:
+        """
+        Queue a workbook export, returning (job, created).
+        Joins the in-flight job for the same cache key if there is one, and
+        completes immediately if the export is already cached.
+        Raises ExportQueueFull when the queue is at its limit.
+        """
+        with self._lock:
+            self._purge()
+
+            job_id = self._active.get(cache_key)
+            if job_id is not None:
+                return self._jobs[job_id], False
+
+            job = ExportJob(
+                id=uuid.uuid4().hex,
+                project_id=project_id,
+                project_name=project_name,
+                cache_key=cache_key,
+                total=len(data.get('sections', []))
+            )
+
+            if self.cache.contains(cache_key):
+                job.status = DONE
+                job.finished_at = time.time()
+                job.finished.set()
+                self._jobs[job.id] = job
+                return job, True
+
+            if len(self._active) >= self.queue_limit:
+                raise ExportQueueFull()
+
+            job.tmp_path = self.cache.temp_path()
+            self._jobs[job.id] = job
+            self._active[cache_key] = job.id
+            try:
+                future = self._get_pool().submit(render_workbook_file, data, job.tmp_path, job.progress_path)
+            except Exception:
+                # E.g. a broken or shut down pool: later requests must not join this job
+                del self._jobs[job.id]
+                del self._active[cache_key]
+                discard(job.tmp_path)
+                raise
+
+        future.add_done_callback(lambda f: self._finish(job, f))
+        return job, True
+
+    def prerender(
+        self,
+        project_id: int,
+        project_name: str,
+        cache_key: str,
+        catalog: CatalogSnapshot,
+        sub_areas: List[CatalogSubArea]
+    ) -> None:
+        """
+        Build a workbook ahead of its download, unless it is already cached or
+        being built. Skipped when the queue is full; the export then renders
+        the workbook itself.
+        """
+        if not sub_areas or self.cache.contains(cache_key):
+            return
+        try:
+            self.submit(project_id, project_name, cache_key, build_workbook_data(catalog, sub_areas))
+        except ExportQueueFull:
+            pass
+
+    def wait_for(self, cache_key: str) -> bool:
+        """Wait for the in-flight job building cache_key, if any; True once it has finished"""
+        with self._lock:
+            job_id = self._active.get(cache_key)
+            job = self._jobs.get(job_id) if job_id else None
+        return job is not None and job.wait(self.wait_timeout)
+
+    def _finish(self, job: ExportJob, future: Future) -> None:
+        error = None
+        try:
+            if future.cancelled():
+                raise RuntimeError("Export cancelled")
+            future.result()
+            self.cache.publish(job.cache_key, job.tmp_path)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+            discard(job.tmp_path)
+        discard(job.progress_path)
+
+        with self._lock:
+            job.status = FAILED if error else DONE
+            job.error = error
+            job.finished_at = time.time()
+            self._active.pop(job.cache_key, None)
+        job.finished.set()
+
+    def get(self, job_id: str) -> Optional[ExportJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def progress(self, job: ExportJob) -> Tuple[int, int]:
+        """(sheets written, total sheets) for a job"""
+        if job.status == DONE:
+            return job.total, job.total
+        if not job.active:
+            return 0, job.total
+        # The worker creates the progress file when it picks the job up
+        try:
+            with open(job.progress_path) as f:
+                done = int(f.read() or 0)
+        except (OSError, ValueError):
+            return 0, job.total
+        with self._lock:
+            if job.status == QUEUED:
+                job.status = RUNNING
+        return done, job.total
+
+    def _purge(self) -> None:
+        cutoff = time.time() - self.job_ttl
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if not job.active and job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+    def shutdown(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "queue_limit": self.queue_limit,
+                "active": len(self._active),
+                "jobs": len(self._jobs),
+            }
+
+
+# Shared job manager for workbook exports
+export_jobs = ExportJobManager(
+    cache=workbook_export_cache,
+    max_workers=int(os.getenv("EXPORT_WORKERS", 2)),
+    queue_limit=int(os.getenv("EXPORT_QUEUE_LIMIT", 16)),
+    job_ttl=int(os.getenv("EXPORT_JOB_TTL", 3600)),
+    wait_timeout=float(os.getenv("EXPORT_WAIT_SECONDS", 30))
+)
+
+# Build workbooks in the background when a project's applicability changes
+EXPORT_PRERENDER = os.getenv("EXPORT_PRERENDER", "True").lower() == "true"
@@ -0,0 +1,109 @@
+"""
+Project Store Service
+Diff-based persistence of project answers and applicability.
+Only answer rows that differ from what is stored are written, using bulk
+INSERT ... ON CONFLICT and targeted DELETE ... WHERE x = ANY(...);
+applicability is a single bitset column on the project row.
+Callers own the transaction and commit once.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import any_, delete, literal
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.orm import Session
+from sqlalchemy.types import Integer
+
+from app.models import Project, ProjectAnswer
+from app.services.applicability_bitset import bits_to_bytes, bytes_to_bits, count_bits
+
+
+def empty_write_stats() -> Dict[str, int]:
+    """
+    Write counters of one save: answer rows upserted/deleted, and sub-areas
+    that became applicable (added) or stopped applying (removed), i.e. bits
+    flipped in projects.applicability_bits rather than rows written
+    """
+    return {
+        'answers_upserted': 0,
+        'answers_deleted': 0,
+        'applicability_added': 0,
+        'applicability_removed': 0,
+    }
+
+
+def sync_project_answers(
+    db: Session,
+    project_id: int,
+    answers: Dict[int, Optional[str]],
+    replace: bool,
+    stats: Dict[str, int]
+) -> Tuple[Dict[int, str], List[int]]:
+    """
+    Write the difference between stored and new answers.
+    With replace=True, stored answers missing from `answers` are deleted;
+    otherwise only the given questions change and a None answer deletes.
+    Returns the resulting question_id -> answer map and the changed question ids.
+    """
+    stored = dict(
+        db.query(ProjectAnswer.question_id, ProjectAnswer.answer)
+        .filter(ProjectAnswer.project_id == project_id)
+        .all()
+    )
+
+    upserts = {
+        question_id: answer
+        for question_id, answer in answers.items()
+        if answer is not None and stored.get(question_id) != answer
+    }
+    deletes = [
+        question_id for question_id in stored
+        if (replace and question_id not in answers)
+        or (question_id in answers and answers[question_id] is None)
+    ]
+
+    if upserts:
+        stmt = insert(ProjectAnswer).values([
+            {'project_id': project_id, 'question_id': question_id, 'answer': answer}
+            for question_id, answer in upserts.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[ProjectAnswer.project_id, ProjectAnswer.question_id],
+            set_={'answer': stmt.excluded.answer}
+        )
+        stats['answers_upserted'] += db.execute(stmt).rowcount
+
+    if deletes:
+        stats['answers_deleted'] += db.execute(
+            delete(ProjectAnswer).where(
+                ProjectAnswer.project_id == project_id,
+                ProjectAnswer.question_id == any_(literal(deletes, ARRAY(Integer)))
+            )
+        ).rowcount
+
+    result = {question_id: answer for question_id, answer in stored.items() if question_id not in deletes}
+    result.update(upserts)
+    return result, sorted(set(upserts) | set(deletes))
+
+
+def save_project_applicability(
+    db: Session,
+    project: Project,
+    bits: int,
+    stats: Dict[str, int]
+) -> Tuple[int, int]:
+    """
+    Store a project's applicable sub-areas as a bitset over sub_areas.ordinal.
+    The project row is only updated when the bitset changed.
+    Returns the bitsets of (added, removed) sub-areas.
+    """
+    stored = bytes_to_bits(project.applicability_bits)
+    added = bits & ~stored
+    removed = stored & ~bits
+
+    if added or removed or project.applicability_bits is None:
+        project.applicability_bits = bits_to_bytes(bits)
+        stats['applicability_added'] += count_bits(added)
+        stats['applicability_removed'] += count_bits(removed)
+
+    return added, removed
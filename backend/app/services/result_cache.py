@@ -0,0 +1,117 @@
+"""
+Result Cache Service
+Bounded LRU cache for applicability results keyed by a canonical hash of
+the answer set and the rule/catalog versions it was computed against.
+Entries are partitioned by guide edition, so a change to one edition's
+rules or catalog only drops that edition's results.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with size and TTL eviction.
+
+    Entries are dropped when the cache exceeds max_size (least recently used
+    first) or when they are older than ttl_seconds. Each entry belongs to a
+    partition (e.g. a guide edition); calling sync_version() with a new
+    version for a partition clears that partition's entries.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 3600):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._versions: Dict[Hashable, Hashable] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            stored_at, _, value = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, partition: Hashable = None) -> None:
+        """Store a value, evicting the least recently used entries if full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), partition, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def sync_version(self, version: Hashable, partition: Hashable = None) -> None:
+        """Clear a partition if its rule/catalog version has changed"""
+        with self._lock:
+            if partition in self._versions and version == self._versions[partition]:
+                return
+            stale = [key for key, (_, entry_partition, _) in self._entries.items() if entry_partition == partition]
+            if stale:
+                self.invalidations += 1
+            for key in stale:
+                del self._entries[key]
+            self._versions[partition] = version
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+def answers_cache_key(namespace: str, answers: Dict[Any, Optional[str]], versions: Dict[str, int]) -> str:
+    """
+    Canonical hash of an answer map plus the versions it is evaluated against.
+    Keys are normalized to strings and sorted, and unanswered questions are
+    dropped, so equivalent submissions share a cache entry.
+    """
+    normalized = sorted((str(key), value) for key, value in answers.items() if value is not None)
+    payload = json.dumps(
+        {"ns": namespace, "answers": normalized, "versions": sorted(versions.items())},
+        separators=(',', ':')
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+# Shared cache for applicability results (projects and stateless assessment)
+applicability_cache = ResultCache(
+    max_size=int(os.getenv("RESULT_CACHE_SIZE", 1024)),
+    ttl_seconds=float(os.getenv("RESULT_CACHE_TTL", 3600))
+)
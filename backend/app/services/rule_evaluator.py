@@ -0,0 +1,88 @@
+"""
+Rule Evaluator Service
+Set-based evaluation of applicability rules and their conditions in SQL
+"""
+
+import json
+from collections import defaultdict
+from typing import Dict, List, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+
+# A rule matches when all of its active conditions hold (AND logic), and a
+# sub-area applies when any of its rules match (OR logic).
+#
+# Semantics mirror evaluate_rule(): a missing answer fails the condition, an
+# unknown operator fails it, a NULL comparison (NULL expected_value) passes
+# it, and a rule without conditions always matches.
+_RULE_MATCHES = """
+    COALESCE(bool_and(
+        rc.id IS NULL
+        OR (ans.value IS NOT NULL AND CASE rc.operator
+            WHEN 'equals' THEN ans.value = rc.expected_value
+            WHEN 'not_equals' THEN ans.value <> rc.expected_value
+            WHEN 'contains' THEN ans.value LIKE '%' || rc.expected_value || '%'
+            WHEN 'in' THEN CAST(ans.value AS jsonb) ? rc.expected_value
+            WHEN 'not_in' THEN NOT (CAST(ans.value AS jsonb) ? rc.expected_value)
+            ELSE FALSE
+        END)
+    ), TRUE)
+"""
+
+# Evaluates every active rule in one statement instead of calling the
+# evaluate_rule() plpgsql function once per rule. Conditions are joined
+# against the answers expanded with jsonb_each_text.
+APPLICABLE_SUB_AREAS_SQL = """
+    SELECT DISTINCT ar.sub_area_id
+    FROM applicability_rules ar
+    LEFT JOIN rule_conditions rc
+        ON rc.rule_id = ar.id AND rc.is_active = TRUE
+    LEFT JOIN jsonb_each_text(CAST(:answers AS jsonb)) AS ans(key, value)
+        ON ans.key = rc.question_key
+    WHERE ar.is_active = TRUE AND ar.edition_id = :edition_id
+    GROUP BY ar.id, ar.sub_area_id
+    HAVING """ + _RULE_MATCHES
+
+# Same evaluation for several answer sets at once; :batch is a JSON array
+# of answer objects and results are tagged with their 1-based position
+APPLICABLE_SUB_AREAS_BATCH_SQL = """
+    SELECT DISTINCT b.ord, ar.sub_area_id
+    FROM jsonb_array_elements(CAST(:batch AS jsonb)) WITH ORDINALITY AS b(answers, ord)
+    CROSS JOIN applicability_rules ar
+    LEFT JOIN rule_conditions rc
+        ON rc.rule_id = ar.id AND rc.is_active = TRUE
+    LEFT JOIN LATERAL jsonb_each_text(b.answers) AS ans(key, value)
+        ON ans.key = rc.question_key
+    WHERE ar.is_active = TRUE AND ar.edition_id = :edition_id
+    GROUP BY b.ord, ar.id, ar.sub_area_id
+    HAVING """ + _RULE_MATCHES
+
+
+def evaluate_applicable_sub_areas(db: Session, answers: Dict[str, str], edition_id: int) -> List[str]:
+    """Return ids of an edition's sub-areas with at least one matching rule for the answers"""
+    result = db.execute(
+        text(APPLICABLE_SUB_AREAS_SQL), {"answers": json.dumps(answers), "edition_id": edition_id}
+    )
+    return [row[0] for row in result]
+
+
+def evaluate_applicable_sub_areas_batch(
+    db: Session,
+    answer_sets: Sequence[Dict[str, str]],
+    edition_id: int
+) -> List[List[str]]:
+    """Return an edition's applicable sub-area ids for each answer set, in input order"""
+    if not answer_sets:
+        return []
+
+    result = db.execute(
+        text(APPLICABLE_SUB_AREAS_BATCH_SQL), {"batch": json.dumps(list(answer_sets)), "edition_id": edition_id}
+    )
+
+    sub_area_ids_by_position = defaultdict(list)
+    for position, sub_area_id in result:
+        sub_area_ids_by_position[position].append(sub_area_id)
+
+    return [sub_area_ids_by_position.get(i, []) for i in range(1, len(answer_sets) + 1)]
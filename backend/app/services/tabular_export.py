@@ -0,0 +1,161 @@
+"""
+Tabular Export Service
+Flat exports of a project's scoping results for BI tools: one row per
+(sub-area, indicator of compliance) with section, chapter, LOE and
+deficiency columns, streamed as CSV, JSON Lines or Parquet.
+
+Rows are produced by a generator and encoded in small batches, so an
+export never holds more than one batch in memory. Parquet output needs
+the optional pyarrow package.
+"""
+
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from app.services.catalog import CatalogSnapshot, CatalogSubArea
+from app.services.workbook_generator import deficiency_dicts, deficiency_texts, group_by_section
+from app.services.xlsx_stream import ChunkSink
+
+EXPORT_COLUMNS = [
+    'project_id',
+    'project_name',
+    'chapter_number',
+    'section_id',
+    'section_title',
+    'sub_area_id',
+    'question',
+    'loe_hours',
+    'loe_confidence',
+    'loe_confidence_score',
+    'indicator_id',
+    'indicator_text',
+    'deficiency_codes',
+    'deficiency_determinations',
+    'corrective_actions',
+]
+
+EXPORT_MEDIA_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'jsonl': 'application/x-ndjson',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+BATCH_ROWS = 1000
+
+
+def iter_export_rows(
+    catalog: CatalogSnapshot,
+    sub_areas: List[CatalogSubArea],
+    project_id: int,
+    project_name: str
+) -> Iterator[Dict[str, Any]]:
+    """
+    One row per (sub-area, indicator), in workbook order.
+    Sub-areas without indicators get a single row with empty indicator columns.
+    """
+    for section, section_sub_areas in group_by_section(catalog, sub_areas):
+        for sa in section_sub_areas:
+            deficiency_codes, determinations, corrective_actions = deficiency_texts(deficiency_dicts(sa))
+            base = {
+                'project_id': project_id,
+                'project_name': project_name,
+                'chapter_number': section.chapter_number,
+                'section_id': section.id,
+                'section_title': section.title,
+                'sub_area_id': sa.id,
+                'question': sa.question,
+                'loe_hours': float(sa.loe_hours) if sa.loe_hours is not None else None,
+                'loe_confidence': sa.loe_confidence,
+                'loe_confidence_score': sa.loe_confidence_score,
+                'deficiency_codes': deficiency_codes,
+                'deficiency_determinations': determinations,
+                'corrective_actions': corrective_actions,
+            }
+            for indicator in sa.indicators or [None]:
+                yield {
+                    **base,
+                    'indicator_id': indicator.indicator_id if indicator else None,
+                    'indicator_text': indicator.text if indicator else None,
+                }
+
+
+def _batches(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def iter_csv(rows: Iterable[Dict[str, Any]], batch_rows: int = BATCH_ROWS) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    for batch in _batches(rows, batch_rows):
+        writer.writerows(batch)
+        yield buffer.getvalue().encode('utf-8')
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def iter_jsonl(rows: Iterable[Dict[str, Any]], batch_rows: int = BATCH_ROWS) -> Iterator[bytes]:
+    for batch in _batches(rows, batch_rows):
+        yield ''.join(json.dumps(row) + '\n' for row in batch).encode('utf-8')
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def iter_parquet(rows: Iterable[Dict[str, Any]], batch_rows: int = BATCH_ROWS) -> Iterator[bytes]:
+    """Parquet file streamed one row group per batch (requires pyarrow)"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([
+        ('project_id', pa.int64()),
+        ('project_name', pa.string()),
+        ('chapter_number', pa.int32()),
+        ('section_id', pa.string()),
+        ('section_title', pa.string()),
+        ('sub_area_id', pa.string()),
+        ('question', pa.string()),
+        ('loe_hours', pa.float64()),
+        ('loe_confidence', pa.string()),
+        ('loe_confidence_score', pa.int32()),
+        ('indicator_id', pa.string()),
+        ('indicator_text', pa.string()),
+        ('deficiency_codes', pa.string()),
+        ('deficiency_determinations', pa.string()),
+        ('corrective_actions', pa.string()),
+    ])
+
+    sink = ChunkSink()
+    with pq.ParquetWriter(pa.PythonFile(sink, mode='w'), schema) as writer:
+        for batch in _batches(rows, batch_rows):
+            writer.write_batch(pa.RecordBatch.from_pylist(batch, schema=schema))
+            yield sink.drain()
+    yield sink.drain()
+
+
+EXPORT_WRITERS = {
+    'csv': iter_csv,
+    'jsonl': iter_jsonl,
+    'parquet': iter_parquet,
+}
+
+
+def iter_export(format: str, rows: Iterable[Dict[str, Any]], batch_rows: Optional[int] = None) -> Iterator[bytes]:
+    """Encode export rows in the given format ('csv', 'jsonl' or 'parquet')"""
+    return EXPORT_WRITERS[format](rows, batch_rows or BATCH_ROWS)
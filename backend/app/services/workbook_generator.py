@@ -3,114 +3,193 @@ Excel Workbook Generator Service
 Generates FTA Audit Workbooks from database data
 """
 
+import threading
+from datetime import datetime
 from io import BytesIO
 from openpyxl import Workbook
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+from openpyxl.styles import PatternFill, Font, Alignment, Border, NamedStyle, Side
 from openpyxl.utils import get_column_letter
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from app.models import SubArea, Section, IndicatorOfCompliance, ProjectApplicability, Deficiency
+from app.models import Project
+from app.services.applicability_bitset import decode_ordinals
+from app.services.catalog import CatalogSection, CatalogSnapshot, CatalogSubArea, get_catalog
+from app.services.xlsx_stream import (
+    Cell, CellStyle, Merge, Row, RowBlock, SheetSpec, StyleSheet, stream_xlsx, unique_sheet_titles
+)
+
+
+# Column headers
+WORKBOOK_HEADERS = [
+    'Question',
+    'Indicator of Compliance',
+    'Compliant',
+    'Non-Compliant',
+    'N/A',
+    'Audit Evidence',
+    'Finding of Non-Compliance Code',
+    'Audit Finding Description',
+    'Additional Info',
+    'Required Action'
+]
+
+# Column widths
+COLUMN_WIDTHS = [50, 60, 12, 15, 10, 40, 30, 40, 40, 40]
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Bump whenever the workbook layout changes, so cached exports are regenerated
+WORKBOOK_GENERATOR_VERSION = "2"
+
+
+def _sheet_title(section: Dict[str, Any]) -> str:
+    """Sheet name for a section, including the chapter number if available"""
+    section_title = section.get('title', 'Unknown')
+    chapter_number = section.get('chapter_number')
+    sheet_title = f"{chapter_number}. {section_title}" if chapter_number else section_title
+
+    # Excel sheet names are limited to 31 characters
+    return sheet_title[:31]
+
+
+def _numbered(items: List[str]) -> str:
+    """Join multiple items with blank lines and numbering"""
+    if len(items) > 1:
+        return '\n\n'.join(f"{i}. {item}" for i, item in enumerate(items, 1))
+    return items[0] if items else ''
+
+
+def deficiency_texts(deficiencies: List[Dict[str, Any]]) -> Tuple[str, str, str]:
+    """Deficiency code, determination and corrective action texts for merged cells"""
+    deficiency_codes = []
+    determinations = []
+    corrective_actions = []
+
+    for deficiency in deficiencies:
+        code = deficiency.get('code', '')
+        title = deficiency.get('title', '')
+        if code and title:
+            deficiency_codes.append(f"{code} - {title}")
+        elif code:
+            deficiency_codes.append(code)
+
+        determination = deficiency.get('determination', '')
+        if determination:
+            determinations.append(determination)
+
+        action = deficiency.get('suggested_corrective_action', '')
+        if action:
+            corrective_actions.append(action)
+
+    return _numbered(deficiency_codes), _numbered(determinations), _numbered(corrective_actions)
+
+
+def deficiency_dicts(sa: CatalogSubArea) -> List[Dict[str, Any]]:
+    """A catalog sub-area's deficiencies in the workbook data format"""
+    return [
+        {
+            'code': d.code,
+            'title': d.title,
+            'determination': d.determination,
+            'suggested_corrective_action': d.suggested_corrective_action
+        }
+        for d in sa.deficiencies
+    ]
+
+
+def _workbook_sub_area(sa: CatalogSubArea) -> Dict[str, Any]:
+    """Workbook data for one catalog sub-area"""
+    return {
+        'id': sa.id,
+        'question': sa.question,
+        'indicators_of_compliance': [
+            {'indicator_id': ind.indicator_id, 'text': ind.text}
+            for ind in sa.indicators
+        ],
+        'deficiencies': deficiency_dicts(sa)
+    }
 
 
 def get_project_workbook_data(db: Session, project_id: int) -> Dict[str, Any]:
     """
-    Fetch applicable sub-areas and their indicators for a project from the database.
+    Fetch applicable sub-areas and their indicators for a project.
     Returns data in the format expected by the workbook generator.
     """
-    # Get applicable sub-areas for the project
-    sub_areas = db.query(SubArea).join(
-        ProjectApplicability,
-        SubArea.id == ProjectApplicability.sub_area_id
-    ).filter(
-        ProjectApplicability.project_id == project_id,
-        ProjectApplicability.is_applicable == True
-    ).order_by(SubArea.section_id, SubArea.id).all()
-
-    if not sub_areas:
-        return {"sections": []}
-
-    # Get all sections that have applicable sub-areas
-    section_ids = list(set([sa.section_id for sa in sub_areas]))
-    sections = db.query(Section).filter(Section.id.in_(section_ids)).all()
-
-    # Create a map of section_id to section
-    sections_map = {s.id: s for s in sections}
-
-    # Get all indicators for these sub-areas
-    sub_area_ids = [sa.id for sa in sub_areas]
-    indicators = db.query(IndicatorOfCompliance).filter(
-        IndicatorOfCompliance.sub_area_id.in_(sub_area_ids)
-    ).all()
-
-    # Group indicators by sub_area_id
-    indicators_by_sub_area = {}
-    for indicator in indicators:
-        if indicator.sub_area_id not in indicators_by_sub_area:
-            indicators_by_sub_area[indicator.sub_area_id] = []
-        indicators_by_sub_area[indicator.sub_area_id].append({
-            'indicator_id': indicator.indicator_id,
-            'text': indicator.text
-        })
-
-    # Get all deficiencies for these sub-areas
-    deficiencies = db.query(Deficiency).filter(
-        Deficiency.sub_area_id.in_(sub_area_ids)
-    ).all()
-
-    # Group deficiencies by sub_area_id
-    deficiencies_by_sub_area = {}
-    for deficiency in deficiencies:
-        if deficiency.sub_area_id not in deficiencies_by_sub_area:
-            deficiencies_by_sub_area[deficiency.sub_area_id] = []
-        deficiencies_by_sub_area[deficiency.sub_area_id].append({
-            'code': deficiency.code,
-            'title': deficiency.title,
-            'determination': deficiency.determination,
-            'suggested_corrective_action': deficiency.suggested_corrective_action
-        })
-
-    # Group sub-areas by section
-    sub_areas_by_section = {}
+    # Get applicable sub-areas from the project's bitset and its edition's catalog snapshot
+    edition_id, applicability_bits = db.query(
+        Project.edition_id, Project.applicability_bits
+    ).filter(Project.id == project_id).one()
+    catalog = get_catalog(db, edition_id)
+    sub_areas = catalog.sub_areas_for_ordinals(decode_ordinals(applicability_bits))
+
+    return build_workbook_data(catalog, sub_areas)
+
+
+def group_by_section(
+    catalog: CatalogSnapshot,
+    sub_areas: List[CatalogSubArea]
+) -> List[Tuple[CatalogSection, List[CatalogSubArea]]]:
+    """Applicable sub-areas grouped by section, sections in chapter order"""
+    sub_areas_by_section: Dict[str, List[CatalogSubArea]] = {}
     for sa in sub_areas:
-        if sa.section_id not in sub_areas_by_section:
-            sub_areas_by_section[sa.section_id] = []
-        sub_areas_by_section[sa.section_id].append({
-            'id': sa.id,
-            'question': sa.question,
-            'indicators_of_compliance': indicators_by_sub_area.get(sa.id, []),
-            'deficiencies': deficiencies_by_sub_area.get(sa.id, [])
-        })
-
-    # Build the sections structure
-    sections_list = []
-    for section_id in sorted(sub_areas_by_section.keys(),
-                            key=lambda x: (sections_map[x].chapter_number or 999, x)):
-        section = sections_map[section_id]
-        sections_list.append({
-            'section': {
-                'id': section.id,
-                'title': section.title,
-                'chapter_number': section.chapter_number
-            },
-            'sub_areas': sub_areas_by_section[section_id]
-        })
-
-    return {'sections': sections_list}
+        sub_areas_by_section.setdefault(sa.section_id, []).append(sa)
 
+    return [
+        (catalog.sections[section_id], sub_areas_by_section[section_id])
+        for section_id in sorted(sub_areas_by_section.keys(), key=lambda x: catalog.chapter_rank[x])
+    ]
 
-def create_workbook_bytes(data: Dict[str, Any]) -> BytesIO:
-    """
-    Create Excel workbook with tabs for each section.
-    Returns workbook as BytesIO object.
-    """
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
 
-    # Define styles
+def build_workbook_data(catalog: CatalogSnapshot, sub_areas: List[CatalogSubArea]) -> Dict[str, Any]:
+    """Workbook data for the given applicable sub-areas, grouped by section in chapter order"""
+    return {
+        'sections': [
+            {
+                'section': {
+                    'id': section.id,
+                    'title': section.title,
+                    'chapter_number': section.chapter_number
+                },
+                'sub_areas': [_workbook_sub_area(sa) for sa in section_sub_areas]
+            }
+            for section, section_sub_areas in group_by_section(catalog, sub_areas)
+        ]
+    }
+
+
+def export_filename(project_name: str, label: str, extension: str) -> str:
+    """Download filename: ProjectName-Label-YYYYMMDD-HHMMSS.extension"""
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    # Sanitize project name for filename
+    safe_project_name = "".join(c for c in project_name if c.isalnum() or c in (' ', '-', '_')).strip()
+    return f"{safe_project_name}-{label}-{timestamp}.{extension}"
+
+
+def workbook_filename(project_name: str) -> str:
+    return export_filename(project_name, "Scoping Workbook", "xlsx")
+
+
+# Columns merged across a sub-area's indicator rows, besides the question
+MERGED_COLUMNS = range(3, 11)
+
+# Named styles for openpyxl workbooks: registered once per workbook and
+# referenced by name, so cells share style records instead of carrying
+# their own Font/Alignment/Border objects
+HEADER_STYLE_NAMES = {
+    'Compliant': 'Header Compliant',
+    'Non-Compliant': 'Header Non-Compliant',
+    'N/A': 'Header N/A',
+}
+HEADER_STYLE_NAME = 'Header'
+BODY_STYLE_NAME = 'Body Cell'
+MERGED_BODY_STYLE_NAME = 'Merged Body Cell'
+
+
+def _named_styles() -> List[NamedStyle]:
+    """Fresh named styles for one workbook (a NamedStyle binds to the workbook it is added to)"""
     header_font = Font(bold=True, size=11)
     header_alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    cell_alignment = Alignment(vertical='top', wrap_text=True)
     border = Border(
         left=Side(style='thin'),
         right=Side(style='thin'),
@@ -118,68 +197,54 @@ def create_workbook_bytes(data: Dict[str, Any]) -> BytesIO:
         bottom=Side(style='thin')
     )
 
-    # Define header fills
-    compliant_fill = PatternFill(start_color='90EE90', end_color='90EE90', fill_type='solid')  # Light green
-    non_compliant_fill = PatternFill(start_color='FFB6C1', end_color='FFB6C1', fill_type='solid')  # Light red
-    na_fill = PatternFill(start_color='D3D3D3', end_color='D3D3D3', fill_type='solid')  # Light gray
-    header_fill = PatternFill(start_color='CCE5FF', end_color='CCE5FF', fill_type='solid')  # Light blue
-
-    # Column headers
-    headers = [
-        'Question',
-        'Indicator of Compliance',
-        'Compliant',
-        'Non-Compliant',
-        'N/A',
-        'Audit Evidence',
-        'Finding of Non-Compliance Code',
-        'Audit Finding Description',
-        'Additional Info',
-        'Required Action'
+    def header_style(name: str, color: str) -> NamedStyle:
+        return NamedStyle(
+            name=name,
+            font=header_font,
+            alignment=header_alignment,
+            border=border,
+            fill=PatternFill(start_color=color, end_color=color, fill_type='solid')
+        )
+
+    return [
+        header_style(HEADER_STYLE_NAMES['Compliant'], '90EE90'),  # Light green
+        header_style(HEADER_STYLE_NAMES['Non-Compliant'], 'FFB6C1'),  # Light red
+        header_style(HEADER_STYLE_NAMES['N/A'], 'D3D3D3'),  # Light gray
+        header_style(HEADER_STYLE_NAME, 'CCE5FF'),  # Light blue
+        NamedStyle(name=BODY_STYLE_NAME, alignment=Alignment(vertical='top', wrap_text=True), border=border),
+        NamedStyle(name=MERGED_BODY_STYLE_NAME, border=border),
     ]
 
-    # Column widths
-    column_widths = [50, 60, 12, 15, 10, 40, 30, 40, 40, 40]
+
+def create_workbook_bytes(data: Dict[str, Any]) -> BytesIO:
+    """
+    Create Excel workbook with tabs for each section.
+    Returns workbook as BytesIO object.
+    """
+    wb = Workbook()
+    wb.remove(wb.active)  # Remove default sheet
+
+    # Register styles once; cells reference them by name
+    for style in _named_styles():
+        wb.add_named_style(style)
 
     # Process each section
     sections = data.get('sections', [])
+    # Same titles as the streaming writer gives duplicate or truncated names
+    titles = unique_sheet_titles(_sheet_title(section_data.get('section', {})) for section_data in sections)
 
-    for section_data in sections:
-        section = section_data.get('section', {})
-        section_title = section.get('title', 'Unknown')
-        chapter_number = section.get('chapter_number')
+    for section_data, title in zip(sections, titles):
         sub_areas = section_data.get('sub_areas', [])
 
-        # Create worksheet for this section (truncate title if too long)
-        # Include chapter number in sheet name if available
-        if chapter_number:
-            sheet_title = f"{chapter_number}. {section_title}"
-        else:
-            sheet_title = section_title
-
-        # Excel sheet names are limited to 31 characters
-        sheet_title = sheet_title[:31] if len(sheet_title) > 31 else sheet_title
-        ws = wb.create_sheet(title=sheet_title)
-
-        # Write headers
-        for col_idx, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col_idx, value=header)
-            cell.font = header_font
-            cell.alignment = header_alignment
-            cell.border = border
-
-            # Apply colored fills to compliance columns
-            if header == 'Compliant':
-                cell.fill = compliant_fill
-            elif header == 'Non-Compliant':
-                cell.fill = non_compliant_fill
-            elif header == 'N/A':
-                cell.fill = na_fill
-            else:
-                cell.fill = header_fill
+        # Create worksheet for this section
+        ws = wb.create_sheet(title=title)
+
+        # Write headers, with colored fills on the compliance columns
+        for col_idx, header in enumerate(WORKBOOK_HEADERS, start=1):
+            ws.cell(row=1, column=col_idx, value=header).style = HEADER_STYLE_NAMES.get(header, HEADER_STYLE_NAME)
 
         # Set column widths
-        for col_idx, width in enumerate(column_widths, start=1):
+        for col_idx, width in enumerate(COLUMN_WIDTHS, start=1):
             ws.column_dimensions[get_column_letter(col_idx)].width = width
 
         # Write data
@@ -194,42 +259,7 @@ def create_workbook_bytes(data: Dict[str, Any]) -> BytesIO:
             # Prepend sub_area id to question
             question_with_id = f"{sub_area_id}. {question}" if sub_area_id else question
 
-            # Prepare deficiency data for merged cells
-            deficiency_codes = []
-            determinations = []
-            corrective_actions = []
-
-            for idx, deficiency in enumerate(deficiencies, 1):
-                code = deficiency.get('code', '')
-                title = deficiency.get('title', '')
-                if code and title:
-                    deficiency_codes.append(f"{code} - {title}")
-                elif code:
-                    deficiency_codes.append(code)
-
-                determination = deficiency.get('determination', '')
-                if determination:
-                    determinations.append(determination)
-
-                action = deficiency.get('suggested_corrective_action', '')
-                if action:
-                    corrective_actions.append(action)
-
-            # Join multiple deficiencies with newlines and numbering
-            if len(deficiency_codes) > 1:
-                deficiency_code_text = '\n\n'.join([f"{i}. {code}" for i, code in enumerate(deficiency_codes, 1)])
-            else:
-                deficiency_code_text = deficiency_codes[0] if deficiency_codes else ''
-
-            if len(determinations) > 1:
-                determination_text = '\n\n'.join([f"{i}. {det}" for i, det in enumerate(determinations, 1)])
-            else:
-                determination_text = determinations[0] if determinations else ''
-
-            if len(corrective_actions) > 1:
-                corrective_action_text = '\n\n'.join([f"{i}. {action}" for i, action in enumerate(corrective_actions, 1)])
-            else:
-                corrective_action_text = corrective_actions[0] if corrective_actions else ''
+            deficiency_code_text, determination_text, corrective_action_text = deficiency_texts(deficiencies)
 
             # Get number of indicators for merging
             num_indicators = len(indicators) if indicators else 0
@@ -241,13 +271,10 @@ def create_workbook_bytes(data: Dict[str, Any]) -> BytesIO:
                 ws.merge_cells(start_row=start_row, start_column=1, end_row=end_row, end_column=1)
 
                 # Write question in merged cell
-                cell = ws.cell(row=start_row, column=1, value=question_with_id)
-                cell.alignment = cell_alignment
-                cell.border = border
+                ws.cell(row=start_row, column=1, value=question_with_id).style = BODY_STYLE_NAME
 
                 # Merge columns 3-10 at question level (Compliant, Non-Compliant, N/A, Audit Evidence,
                 # Finding of Non-Compliance Code, Audit Finding Description, Additional Info, Required Action)
-                # We need to apply borders to all cells in merged ranges for proper display
                 merged_columns_data = [
                     (3, ''),  # Compliant
                     (4, ''),  # Non-Compliant
@@ -263,37 +290,25 @@ def create_workbook_bytes(data: Dict[str, Any]) -> BytesIO:
                     ws.merge_cells(start_row=start_row, start_column=col_num, end_row=end_row, end_column=col_num)
 
                     # Set value and formatting on primary cell
-                    cell = ws.cell(row=start_row, column=col_num, value=col_value)
-                    cell.alignment = cell_alignment
-                    cell.border = border
-
-                    # Apply borders to all cells in the merged range
-                    for row_num in range(start_row, end_row + 1):
-                        cell = ws.cell(row=row_num, column=col_num)
-                        cell.border = border
+                    ws.cell(row=start_row, column=col_num, value=col_value).style = BODY_STYLE_NAME
+
+                # Covered cells of the merged ranges (question column included) only
+                # carry borders, so the merged ranges display outlined
+                for row_num in range(start_row + 1, end_row + 1):
+                    for col_num in (1, *MERGED_COLUMNS):
+                        ws.cell(row=row_num, column=col_num).style = MERGED_BODY_STYLE_NAME
             else:
                 # No indicators, just write question normally
-                cell = ws.cell(row=current_row, column=1, value=question_with_id)
-                cell.alignment = cell_alignment
-                cell.border = border
+                ws.cell(row=current_row, column=1, value=question_with_id).style = BODY_STYLE_NAME
 
                 # Add deficiency data to single row
-                cell = ws.cell(row=current_row, column=7, value=deficiency_code_text)
-                cell.alignment = cell_alignment
-                cell.border = border
-
-                cell = ws.cell(row=current_row, column=8, value=determination_text)
-                cell.alignment = cell_alignment
-                cell.border = border
-
-                cell = ws.cell(row=current_row, column=10, value=corrective_action_text)
-                cell.alignment = cell_alignment
-                cell.border = border
+                ws.cell(row=current_row, column=7, value=deficiency_code_text).style = BODY_STYLE_NAME
+                ws.cell(row=current_row, column=8, value=determination_text).style = BODY_STYLE_NAME
+                ws.cell(row=current_row, column=10, value=corrective_action_text).style = BODY_STYLE_NAME
 
                 # Add borders to empty cells in question row
                 for col_idx in [2, 3, 4, 5, 6, 9]:
-                    cell = ws.cell(row=current_row, column=col_idx, value='')
-                    cell.border = border
+                    ws.cell(row=current_row, column=col_idx, value='').style = MERGED_BODY_STYLE_NAME
 
                 current_row += 1
 
@@ -307,15 +322,7 @@ def create_workbook_bytes(data: Dict[str, Any]) -> BytesIO:
                     indicator_with_id = f"{indicator_id}. {indicator_text}" if indicator_id else indicator_text
 
                     # Indicator text
-                    cell = ws.cell(row=current_row, column=2, value=indicator_with_id)
-                    cell.alignment = cell_alignment
-                    cell.border = border
-
-                    # Add borders to merged cells in this row to ensure proper border display
-                    # The merged cells already have their primary cell set with borders,
-                    # but we need to ensure the border appears on the indicator row
-                    # Note: We can't set values on merged cells, but borders should be visible
-                    # from the merge operation above
+                    ws.cell(row=current_row, column=2, value=indicator_with_id).style = BODY_STYLE_NAME
 
                     current_row += 1
 
@@ -330,6 +337,185 @@ def create_workbook_bytes(data: Dict[str, Any]) -> BytesIO:
     return output
 
 
+# Streaming writer styles, matching the openpyxl layout above
+XLSX_STYLES = StyleSheet()
+_HEADER_STYLE = dict(bold=True, horizontal='center', vertical='center', wrap=True, border=True)
+HEADER_STYLE_IDS = {
+    'Compliant': XLSX_STYLES.add(CellStyle(fill='90EE90', **_HEADER_STYLE)),  # Light green
+    'Non-Compliant': XLSX_STYLES.add(CellStyle(fill='FFB6C1', **_HEADER_STYLE)),  # Light red
+    'N/A': XLSX_STYLES.add(CellStyle(fill='D3D3D3', **_HEADER_STYLE)),  # Light gray
+}
+HEADER_STYLE_ID = XLSX_STYLES.add(CellStyle(fill='CCE5FF', **_HEADER_STYLE))  # Light blue
+CELL_STYLE_ID = XLSX_STYLES.add(CellStyle(vertical='top', wrap=True, border=True))
+BORDER_STYLE_ID = XLSX_STYLES.add(CellStyle(border=True))
+
+HEADER_CELLS = [
+    (col_idx, header, HEADER_STYLE_IDS.get(header, HEADER_STYLE_ID))
+    for col_idx, header in enumerate(WORKBOOK_HEADERS, start=1)
+]
+
+
+def sub_area_block(sub_area: Dict[str, Any]) -> Tuple[List[List[Cell]], List[Merge]]:
+    """
+    Lay out one sub-area as rows of cells plus merged ranges, with row
+    numbers relative to the sub-area's first row (0-based).
+    """
+    sub_area_id = sub_area.get('id', '')
+    question = sub_area.get('question', '')
+    indicators = sub_area.get('indicators_of_compliance') or []
+    deficiency_code_text, determination_text, corrective_action_text = deficiency_texts(
+        sub_area.get('deficiencies', [])
+    )
+
+    question_with_id = f"{sub_area_id}. {question}" if sub_area_id else question
+    question_values = {
+        1: question_with_id,
+        7: deficiency_code_text,
+        8: determination_text,
+        10: corrective_action_text,
+    }
+
+    if not indicators:
+        # No indicators: question and deficiency data on a single row
+        return [[
+            (col, question_values.get(col, ''), CELL_STYLE_ID if col in question_values else BORDER_STYLE_ID)
+            for col in range(1, 11)
+        ]], []
+
+    rows = []
+    for idx, indicator in enumerate(indicators):
+        indicator_id = indicator.get('indicator_id', '')
+        indicator_text = indicator.get('text', '')
+        indicator_with_id = f"{indicator_id}. {indicator_text}" if indicator_id else indicator_text
+
+        if idx == 0:
+            # Primary cells of the merged ranges carry the values
+            cells = [(1, question_with_id, CELL_STYLE_ID), (2, indicator_with_id, CELL_STYLE_ID)]
+            cells += [(col, question_values.get(col, ''), CELL_STYLE_ID) for col in MERGED_COLUMNS]
+        else:
+            # Covered cells only carry borders so merged ranges display outlined
+            cells = [(1, None, BORDER_STYLE_ID), (2, indicator_with_id, CELL_STYLE_ID)]
+            cells += [(col, None, BORDER_STYLE_ID) for col in MERGED_COLUMNS]
+        rows.append(cells)
+
+    # Merged like create_workbook_bytes, including the one-row ranges of single-indicator sub-areas
+    last = len(indicators) - 1
+    merges = [(0, col, last, col) for col in (1, *MERGED_COLUMNS)]
+    return rows, merges
+
+
+def _section_rows(sub_areas: List[Dict[str, Any]]) -> Iterator[Row]:
+    """Header row followed by each sub-area's block, offset to its sheet position"""
+    yield 1, HEADER_CELLS, ()
+
+    current_row = 2
+    for sub_area in sub_areas:
+        rows, merges = sub_area_block(sub_area)
+        for offset, cells in enumerate(rows):
+            row_merges = [
+                (current_row + first_row, first_col, current_row + last_row, last_col)
+                for first_row, first_col, last_row, last_col in merges
+                if first_row == offset
+            ]
+            yield current_row + offset, cells, row_merges
+        current_row += len(rows)
+
+
+def _report_done(rows: Iterator[Row], callback: Callable[[], None]) -> Iterator[Row]:
+    yield from rows
+    callback()
+
+
+def iter_workbook_chunks(
+    data: Dict[str, Any],
+    on_sheet_done: Optional[Callable[[int], None]] = None
+) -> Iterator[bytes]:
+    """
+    Stream the workbook for workbook data as .xlsx byte chunks.
+    Same layout as create_workbook_bytes, without building the workbook in memory.
+    on_sheet_done, if given, is called with the number of sheets written so far.
+    """
+    sheets = []
+    for index, section_data in enumerate(data.get('sections', []), start=1):
+        rows = _section_rows(section_data.get('sub_areas', []))
+        if on_sheet_done is not None:
+            rows = _report_done(rows, lambda index=index: on_sheet_done(index))
+        sheets.append(SheetSpec(
+            title=_sheet_title(section_data.get('section', {})),
+            rows=rows,
+            column_widths=COLUMN_WIDTHS,
+            freeze_rows=1
+        ))
+    return stream_xlsx(sheets, XLSX_STYLES)
+
+
+class WorkbookFragments:
+    """
+    Every sub-area's workbook rows pre-rendered for one catalog snapshot
+    (one edition at one catalog version).
+    Sub-area content is static catalog data, so an export only has to place
+    the blocks of the applicable sub-areas one after another.
+    """
+
+    def __init__(self, catalog: CatalogSnapshot):
+        self.version = catalog.version
+        self.header = RowBlock([HEADER_CELLS])
+        self.blocks: Dict[str, RowBlock] = {
+            sa_id: RowBlock(*sub_area_block(_workbook_sub_area(sa)))
+            for sa_id, sa in catalog.sub_areas.items()
+        }
+
+
+# Fragments per guide edition
+_fragments: Dict[Optional[int], WorkbookFragments] = {}
+_fragments_lock = threading.Lock()
+
+
+def get_workbook_fragments(catalog: CatalogSnapshot) -> WorkbookFragments:
+    """Get the pre-rendered fragments for a catalog snapshot, rendering them on first use"""
+    fragments = _fragments.get(catalog.edition_id)
+    if fragments is None or fragments.version != catalog.version:
+        with _fragments_lock:
+            fragments = _fragments.get(catalog.edition_id)
+            if fragments is None or fragments.version != catalog.version:
+                fragments = WorkbookFragments(catalog)
+                _fragments[catalog.edition_id] = fragments
+    return fragments
+
+
+def _fragment_rows(fragments: WorkbookFragments, sub_area_ids: List[str]) -> Iterator:
+    yield fragments.header.place(1)
+
+    current_row = 2
+    for sub_area_id in sub_area_ids:
+        block = fragments.blocks[sub_area_id]
+        yield block.place(current_row)
+        current_row += block.height
+
+
+def iter_prerendered_workbook_chunks(catalog: CatalogSnapshot, sub_areas: List[CatalogSubArea]) -> Iterator[bytes]:
+    """
+    Stream the workbook for the given applicable sub-areas from pre-rendered
+    fragments. Output is identical to iter_workbook_chunks.
+    """
+    fragments = get_workbook_fragments(catalog)
+
+    sub_area_ids_by_section: Dict[str, List[str]] = {}
+    for sa in sub_areas:
+        sub_area_ids_by_section.setdefault(sa.section_id, []).append(sa.id)
+
+    sheets = []
+    for section_id in sorted(sub_area_ids_by_section, key=lambda x: catalog.chapter_rank[x]):
+        section = catalog.sections[section_id]
+        sheets.append(SheetSpec(
+            title=_sheet_title({'title': section.title, 'chapter_number': section.chapter_number}),
+            rows=_fragment_rows(fragments, sub_area_ids_by_section[section_id]),
+            column_widths=COLUMN_WIDTHS,
+            freeze_rows=1
+        ))
+    return stream_xlsx(sheets, XLSX_STYLES)
+
+
 def generate_project_workbook(db: Session, project_id: int) -> BytesIO:
     """
     Main function to generate workbook for a project.
@@ -0,0 +1,266 @@
+"""
+Workbook Import Service
+Reads completed audit workbooks (as produced by the workbook generator) back
+into project findings. The upload is parsed with openpyxl's read-only
+streaming reader and findings are inserted in batches as rows are read, so
+neither the workbook nor its findings are ever held in memory in full.
+
+Rows are mapped back to the catalog through the "{id}. " prefixes the
+generator writes in the Question and Indicator of Compliance columns. A
+row becomes a finding when the reviewer filled a compliance mark, Audit
+Evidence or Additional Info. The generator merges the input columns across
+a sub-area's indicator rows, so input on the question row alone stands for
+the whole sub-area and records a sub-area finding. Once the reviewer has
+unmerged the block and filled the indicator rows below, the question row's
+input belongs to the indicator on that row, like every other indicator
+row's. A sub-area with a single indicator has nothing merged, so its one
+row records an indicator finding.
+
+The import runs in one transaction: if any row fails validation nothing is
+stored and every error is reported with its sheet and row.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+from openpyxl import load_workbook
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.models import Project, ProjectFinding, WorkbookImport
+from app.services.catalog import CatalogSnapshot, CatalogSubArea
+from app.services.workbook_generator import WORKBOOK_HEADERS
+
+# 0-based column positions in the generated layout
+QUESTION_COL = 0
+INDICATOR_COL = 1
+COMPLIANCE_COLS = {2: 'compliant', 3: 'non_compliant', 4: 'na'}
+EVIDENCE_COL = 5
+CODE_COL = 6
+DESCRIPTION_COL = 7
+ADDITIONAL_INFO_COL = 8
+ACTION_COL = 9
+
+# Columns only a reviewer fills in
+INPUT_COLS = (*COMPLIANCE_COLS, EVIDENCE_COL, ADDITIONAL_INFO_COL)
+
+INSERT_BATCH_ROWS = 500
+MAX_REPORTED_ERRORS = 200
+
+
+class WorkbookFormatError(Exception):
+    """Raised when the upload is not a readable .xlsx workbook"""
+
+
+@dataclass
+class RowError:
+    sheet: str
+    row: int
+    message: str
+
+
+@dataclass
+class ImportResult:
+    import_id: Optional[int] = None
+    sheets: int = 0
+    rows_read: int = 0
+    findings: int = 0
+    error_count: int = 0
+    errors: List[RowError] = field(default_factory=list)
+
+    def add_error(self, sheet: str, row: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(RowError(sheet, row, message))
+
+
+def _text(value: Any) -> Optional[str]:
+    """Cell value as stripped text, None when empty"""
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _split_prefix(value: Optional[str]) -> Optional[Tuple[str, str]]:
+    """Split "{id}. {text}" into (id, text)"""
+    if value is None:
+        return None
+    prefix, sep, rest = value.partition('. ')
+    return (prefix, rest) if sep and prefix else None
+
+
+class WorkbookReader:
+    """Streams findings out of a completed workbook, collecting row errors on the result"""
+
+    def __init__(self, catalog: CatalogSnapshot, result: ImportResult):
+        self.catalog = catalog
+        self.result = result
+        self._seen_sub_areas: Set[str] = set()
+
+    def findings(self, file: BinaryIO) -> Iterator[Dict[str, Any]]:
+        try:
+            wb = load_workbook(file, read_only=True, data_only=True)
+        except Exception as e:
+            raise WorkbookFormatError(f"Could not read workbook: {e}") from e
+
+        try:
+            for ws in wb.worksheets:
+                self.result.sheets += 1
+                yield from self._sheet_findings(ws)
+        finally:
+            wb.close()
+
+    def _sheet_findings(self, ws) -> Iterator[Dict[str, Any]]:
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        if [_text(v) for v in header[:len(WORKBOOK_HEADERS)]] != WORKBOOK_HEADERS:
+            self.result.add_error(ws.title, 1, "Header row does not match the scoping workbook layout")
+            return
+
+        sub_area: Optional[CatalogSubArea] = None
+        seen_question = False
+        # Question-row finding, held until the block shows whether it was unmerged
+        pending: Optional[Dict[str, Any]] = None
+        for row_number, values in enumerate(rows, start=2):
+            cells = [_text(v) for v in values[:len(WORKBOOK_HEADERS)]]
+            cells += [None] * (len(WORKBOOK_HEADERS) - len(cells))
+            if not any(cells):
+                continue
+            self.result.rows_read += 1
+
+            question_row = cells[QUESTION_COL] is not None
+            if question_row:
+                if pending is not None:
+                    yield self._question_finding(pending, sub_area)
+                    pending = None
+                sub_area = self._sub_area(ws.title, row_number, cells[QUESTION_COL])
+                seen_question = True
+            elif not seen_question:
+                self.result.add_error(ws.title, row_number, "Row does not follow a question row")
+                continue
+            if sub_area is None:
+                # Rows under an invalid question were reported with the question
+                continue
+
+            if not question_row and pending is not None and any(cells[col] for col in INPUT_COLS):
+                # Input below the question row: the block was unmerged
+                yield pending
+                pending = None
+
+            indicator_id = self._indicator_id(ws.title, row_number, sub_area, cells[INDICATOR_COL])
+            finding = self._finding(ws.title, row_number, sub_area, cells)
+            if finding is None:
+                continue
+            finding['indicator_id'] = indicator_id
+            if question_row:
+                pending = finding
+            else:
+                yield finding
+
+        if pending is not None:
+            yield self._question_finding(pending, sub_area)
+
+    @staticmethod
+    def _question_finding(finding: Dict[str, Any], sub_area: CatalogSubArea) -> Dict[str, Any]:
+        """Question-row finding of a block whose other rows carry no input"""
+        if len(sub_area.indicators) > 1:
+            # Input in the merged cells applies to the whole sub-area
+            finding['indicator_id'] = None
+        return finding
+
+    def _sub_area(self, sheet: str, row: int, question: str) -> Optional[CatalogSubArea]:
+        parsed = _split_prefix(question)
+        sub_area = self.catalog.sub_areas.get(parsed[0]) if parsed else None
+        if sub_area is None:
+            self.result.add_error(sheet, row, f"Question does not start with a known sub-area id: {question[:60]!r}")
+            return None
+        if sub_area.id in self._seen_sub_areas:
+            self.result.add_error(sheet, row, f"Sub-area {sub_area.id} appears more than once")
+            return None
+        self._seen_sub_areas.add(sub_area.id)
+        return sub_area
+
+    def _indicator_id(self, sheet: str, row: int, sub_area: CatalogSubArea, text: Optional[str]) -> Optional[str]:
+        if text is None:
+            return None
+        parsed = _split_prefix(text)
+        if parsed is None or parsed[0] not in {ind.indicator_id for ind in sub_area.indicators}:
+            self.result.add_error(
+                sheet, row, f"Indicator does not start with an indicator id of sub-area {sub_area.id}: {text[:60]!r}"
+            )
+            return None
+        return parsed[0]
+
+    def _finding(self, sheet: str, row: int, sub_area: CatalogSubArea, cells: List[Optional[str]]) -> Optional[Dict[str, Any]]:
+        if not any(cells[col] for col in INPUT_COLS):
+            return None
+
+        marked = [value for col, value in COMPLIANCE_COLS.items() if cells[col]]
+        if len(marked) > 1:
+            self.result.add_error(sheet, row, "More than one of Compliant, Non-Compliant and N/A is marked")
+            return None
+
+        return {
+            'sub_area_id': sub_area.id,
+            'sheet_row': row,
+            'compliance': marked[0] if marked else None,
+            'audit_evidence': cells[EVIDENCE_COL],
+            'finding_code': cells[CODE_COL],
+            'finding_description': cells[DESCRIPTION_COL],
+            'additional_info': cells[ADDITIONAL_INFO_COL],
+            'required_action': cells[ACTION_COL],
+        }
+
+
+def import_workbook(
+    db: Session,
+    project: Project,
+    catalog: CatalogSnapshot,
+    file: BinaryIO,
+    filename: Optional[str] = None
+) -> ImportResult:
+    """
+    Import a completed workbook for a project in one transaction.
+    The catalog must be the snapshot of the project's guide edition.
+    Commits only when every row is valid; otherwise rolls back and returns
+    the errors. Raises WorkbookFormatError for unreadable uploads.
+    """
+    result = ImportResult()
+    workbook_import = WorkbookImport(project_id=project.id, filename=filename)
+    db.add(workbook_import)
+    db.flush()
+
+    reader = WorkbookReader(catalog, result)
+    batch: List[Dict[str, Any]] = []
+
+    def flush_batch() -> None:
+        if batch and not result.error_count:
+            db.execute(insert(ProjectFinding), batch)
+        batch.clear()
+
+    try:
+        for finding in reader.findings(file):
+            finding['import_id'] = workbook_import.id
+            finding['project_id'] = project.id
+            finding['edition_id'] = project.edition_id
+            batch.append(finding)
+            result.findings += 1
+            if len(batch) >= INSERT_BATCH_ROWS:
+                flush_batch()
+        flush_batch()
+    except Exception:
+        db.rollback()
+        raise
+
+    if result.error_count:
+        db.rollback()
+        return result
+
+    workbook_import.rows_read = result.rows_read
+    workbook_import.findings_count = result.findings
+    db.commit()
+    result.import_id = workbook_import.id
+    return result
@@ -0,0 +1,374 @@
+"""
+Streaming XLSX Writer
+Writes a minimal SpreadsheetML package (inline strings, cell styles, column
+widths, merged ranges and frozen header rows) directly into a zip stream,
+one row at a time, yielding compressed chunks as they become available.
+Peak memory is bounded by the chunk size rather than the workbook size.
+"""
+
+import re
+import zipfile
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from xml.sax.saxutils import escape
+
+from openpyxl.utils import get_column_letter
+
+CellValue = Union[str, int, float, None]
+# (column index starting at 1, value, style id)
+Cell = Tuple[int, CellValue, int]
+# (first_row, first_column, last_row, last_column)
+Merge = Tuple[int, int, int, int]
+# (row number starting at 1, cells in column order, merges anchored on this row)
+Row = Tuple[int, Sequence[Cell], Sequence[Merge]]
+
+# Stands in for the row number in pre-rendered rows; stripped from cell text
+# as an illegal XML character, so it can never collide with content
+_ROW_MARK = '\x00'
+
+# Characters not allowed in XML 1.0 documents
+_ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+# Fixed entry timestamp, so the same workbook always streams the same bytes
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+@dataclass(frozen=True)
+class CellStyle:
+    bold: bool = False
+    font_size: int = 11
+    fill: Optional[str] = None          # solid fill RGB, e.g. 'CCE5FF'
+    horizontal: Optional[str] = None
+    vertical: Optional[str] = None
+    wrap: bool = False
+    border: bool = False                # thin border on all sides
+
+
+class StyleSheet:
+    """Registry of cell styles; add() returns the style id used in cells"""
+
+    def __init__(self):
+        self.styles: List[CellStyle] = [CellStyle()]
+
+    def add(self, style: CellStyle) -> int:
+        if style in self.styles:
+            return self.styles.index(style)
+        self.styles.append(style)
+        return len(self.styles) - 1
+
+    def to_xml(self) -> str:
+        fonts = sorted({(s.bold, s.font_size) for s in self.styles}, key=lambda f: (f != (False, 11), f))
+        fills = sorted({s.fill for s in self.styles if s.fill})
+        font_ids = {font: i for i, font in enumerate(fonts)}
+        # Fill ids 0 and 1 are reserved (none, gray125)
+        fill_ids = {fill: i + 2 for i, fill in enumerate(fills)}
+
+        font_xml = ''.join(
+            f'<font>{"<b/>" if bold else ""}<sz val="{size}"/><name val="Calibri"/><family val="2"/></font>'
+            for bold, size in fonts
+        )
+        fill_xml = '<fill><patternFill patternType="none"/></fill><fill><patternFill patternType="gray125"/></fill>' + ''.join(
+            f'<fill><patternFill patternType="solid"><fgColor rgb="FF{fill}"/><bgColor rgb="FF{fill}"/></patternFill></fill>'
+            for fill in fills
+        )
+        thin = ''.join(f'<{side} style="thin"><color auto="1"/></{side}>' for side in ('left', 'right', 'top', 'bottom'))
+        border_xml = f'<border><left/><right/><top/><bottom/><diagonal/></border><border>{thin}<diagonal/></border>'
+
+        xfs = []
+        for s in self.styles:
+            attrs = (
+                f'numFmtId="0" fontId="{font_ids[(s.bold, s.font_size)]}" '
+                f'fillId="{fill_ids.get(s.fill, 0)}" borderId="{1 if s.border else 0}" xfId="0"'
+            )
+            if s.bold or s.font_size != 11:
+                attrs += ' applyFont="1"'
+            if s.fill:
+                attrs += ' applyFill="1"'
+            if s.border:
+                attrs += ' applyBorder="1"'
+            if s.horizontal or s.vertical or s.wrap:
+                alignment = ''.join([
+                    f' horizontal="{s.horizontal}"' if s.horizontal else '',
+                    f' vertical="{s.vertical}"' if s.vertical else '',
+                    ' wrapText="1"' if s.wrap else '',
+                ])
+                xfs.append(f'<xf {attrs} applyAlignment="1"><alignment{alignment}/></xf>')
+            else:
+                xfs.append(f'<xf {attrs}/>')
+
+        return (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+            f'<fonts count="{len(fonts)}">{font_xml}</fonts>'
+            f'<fills count="{len(fills) + 2}">{fill_xml}</fills>'
+            f'<borders count="2">{border_xml}</borders>'
+            '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+            f'<cellXfs count="{len(xfs)}">{"".join(xfs)}</cellXfs>'
+            '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+            '</styleSheet>'
+        )
+
+
+@dataclass(frozen=True)
+class RenderedRows:
+    """Finished row XML and merge references, ready to write into a sheet"""
+    xml: str
+    merges: Sequence[str]
+
+
+class RowBlock:
+    """
+    Rows rendered to XML once, with row numbers left open so the block can
+    be placed at any position: place() only joins strings with the row
+    number and shifts the merge ranges.
+    """
+
+    def __init__(self, rows: Sequence[Sequence[Cell]], merges: Sequence[Merge] = ()):
+        self.height = len(rows)
+        self._segments = [tuple(row_xml(_ROW_MARK, cells).split(_ROW_MARK)) for cells in rows]
+        self._merges = [
+            (get_column_letter(first_col), first_row, get_column_letter(last_col), last_row)
+            for first_row, first_col, last_row, last_col in merges
+        ]
+
+    def place(self, first_row: int) -> RenderedRows:
+        xml = ''.join(str(first_row + i).join(segments) for i, segments in enumerate(self._segments))
+        merges = [
+            f"{first_letter}{first_row + first}:{last_letter}{first_row + last}"
+            for first_letter, first, last_letter, last in self._merges
+        ]
+        return RenderedRows(xml, merges)
+
+
+@dataclass
+class SheetSpec:
+    title: str
+    rows: Iterable[Union[Row, RenderedRows]]
+    column_widths: Sequence[float] = ()
+    freeze_rows: int = 0
+
+
+def cell_ref(row: Union[int, str], column: int) -> str:
+    return f"{get_column_letter(column)}{row}"
+
+
+def escape_text(value: str) -> str:
+    return escape(_ILLEGAL_XML_CHARS.sub('', value))
+
+
+def cell_xml(ref: str, value: CellValue, style_id: int) -> str:
+    """XML for one cell; strings are written inline, empty values keep only the style"""
+    style = f' s="{style_id}"' if style_id else ''
+    if value is None or value == '':
+        return f'<c r="{ref}"{style}/>'
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return f'<c r="{ref}"{style}><v>{value}</v></c>'
+    return f'<c r="{ref}"{style} t="inlineStr"><is><t xml:space="preserve">{escape_text(str(value))}</t></is></c>'
+
+
+def row_xml(row_number: Union[int, str], cells: Sequence[Cell]) -> str:
+    return f'<row r="{row_number}">' + ''.join(
+        cell_xml(cell_ref(row_number, column), value, style_id) for column, value, style_id in cells
+    ) + '</row>'
+
+
+def merge_ref(merge: Merge) -> str:
+    first_row, first_column, last_row, last_column = merge
+    return f"{cell_ref(first_row, first_column)}:{cell_ref(last_row, last_column)}"
+
+
+def sheet_header_xml(column_widths: Sequence[float], freeze_rows: int) -> str:
+    if freeze_rows:
+        top_left = cell_ref(freeze_rows + 1, 1)
+        view = (
+            '<sheetView workbookViewId="0">'
+            f'<pane ySplit="{freeze_rows}" topLeftCell="{top_left}" activePane="bottomLeft" state="frozen"/>'
+            f'<selection pane="bottomLeft" activeCell="{top_left}" sqref="{top_left}"/>'
+            '</sheetView>'
+        )
+    else:
+        view = '<sheetView workbookViewId="0"/>'
+
+    cols = ''.join(
+        f'<col min="{i}" max="{i}" width="{width}" customWidth="1"/>'
+        for i, width in enumerate(column_widths, start=1)
+    )
+
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheetViews>{view}</sheetViews>'
+        '<sheetFormatPr defaultRowHeight="15"/>'
+        + (f'<cols>{cols}</cols>' if cols else '') +
+        '<sheetData>'
+    )
+
+
+def sheet_footer_xml(merges: Sequence[str]) -> str:
+    footer = '</sheetData>'
+    if merges:
+        footer += f'<mergeCells count="{len(merges)}">' + ''.join(
+            f'<mergeCell ref="{ref}"/>' for ref in merges
+        ) + '</mergeCells>'
+    return footer + '</worksheet>'
+
+
+_INVALID_TITLE_CHARS = re.compile(r'[\\/*?:\[\]]')
+
+
+def unique_sheet_titles(titles: Iterable[str]) -> Iterator[str]:
+    """Make sheet titles valid (no []:*?/\\, at most 31 chars) and unique"""
+    seen = set()
+    for title in titles:
+        base = _INVALID_TITLE_CHARS.sub('', title)[:31] or 'Sheet'
+        candidate, n = base, 1
+        while candidate.lower() in seen:
+            suffix = str(n)
+            candidate = base[:31 - len(suffix)] + suffix
+            n += 1
+        seen.add(candidate.lower())
+        yield candidate
+
+
+class ChunkSink:
+    """Write-only, non-seekable file object collecting output for a generator to drain"""
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        self.buffer += data
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def seekable(self) -> bool:
+        return False
+
+    def flush(self):
+        pass
+
+    def close(self):
+        # Buffered data stays available to drain()
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+def _workbook_xml(titles: Sequence[str]) -> str:
+    sheets = ''.join(
+        f'<sheet name="{escape(title, {chr(34): "&quot;"})}" sheetId="{i}" r:id="rId{i}"/>'
+        for i, title in enumerate(titles, start=1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        f'<sheets>{sheets}</sheets></workbook>'
+    )
+
+
+def _workbook_rels_xml(sheet_count: int) -> str:
+    rels = ''.join(
+        f'<Relationship Id="rId{i}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        f'Target="worksheets/sheet{i}.xml"/>'
+        for i in range(1, sheet_count + 1)
+    )
+    rels += (
+        f'<Relationship Id="rId{sheet_count + 1}" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" Target="styles.xml"/>'
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{rels}</Relationships>'
+    )
+
+
+def _content_types_xml(sheet_count: int) -> str:
+    overrides = ''.join(
+        f'<Override PartName="/xl/worksheets/sheet{i}.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        for i in range(1, sheet_count + 1)
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/styles.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+        f'{overrides}</Types>'
+    )
+
+
+def _zip_entry(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time=_ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o600 << 16
+    return info
+
+
+_ROOT_RELS_XML = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/></Relationships>'
+)
+
+
+def stream_xlsx(
+    sheets: Iterable[SheetSpec],
+    styles: StyleSheet,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """
+    Generate an .xlsx file as a sequence of byte chunks.
+    Each sheet's rows (Row tuples or pre-rendered RenderedRows) are consumed
+    lazily and written straight into the compressed zip entry; chunks are yielded once at least chunk_size bytes
+    of compressed output are pending.
+    """
+    sink = ChunkSink()
+    titles = []
+
+    with zipfile.ZipFile(sink, mode='w', compression=zipfile.ZIP_DEFLATED) as zf:
+        sheets = list(sheets)
+        for index, (sheet, title) in enumerate(zip(sheets, unique_sheet_titles(s.title for s in sheets)), start=1):
+            titles.append(title)
+            merges: List[str] = []
+
+            with zf.open(_zip_entry(f'xl/worksheets/sheet{index}.xml'), mode='w', force_zip64=True) as entry:
+                entry.write(sheet_header_xml(sheet.column_widths, sheet.freeze_rows).encode('utf-8'))
+                for row in sheet.rows:
+                    if isinstance(row, RenderedRows):
+                        entry.write(row.xml.encode('utf-8'))
+                        merges.extend(row.merges)
+                    else:
+                        row_number, cells, row_merges = row
+                        entry.write(row_xml(row_number, cells).encode('utf-8'))
+                        merges.extend(merge_ref(merge) for merge in row_merges)
+                    if len(sink.buffer) >= chunk_size:
+                        yield sink.drain()
+                entry.write(sheet_footer_xml(merges).encode('utf-8'))
+
+            if len(sink.buffer) >= chunk_size:
+                yield sink.drain()
+
+        zf.writestr(_zip_entry('xl/styles.xml'), styles.to_xml())
+        zf.writestr(_zip_entry('xl/workbook.xml'), _workbook_xml(titles))
+        zf.writestr(_zip_entry('xl/_rels/workbook.xml.rels'), _workbook_rels_xml(len(titles)))
+        zf.writestr(_zip_entry('_rels/.rels'), _ROOT_RELS_XML)
+        zf.writestr(_zip_entry('[Content_Types].xml'), _content_types_xml(len(titles)))
+
+    yield sink.drain()
@@ -0,0 +1,137 @@
+"""
+Assessment Benchmark
+Compares the per-rule evaluate_rule() path with the set-based evaluation
+query used by POST /api/assess at 1x, 10x and 100x the current rule count.
+
+Rules and conditions are copied into session-local temporary tables that
+shadow the real ones, so the live tables are never modified.
+
+Usage (from the backend directory):
+    python -m benchmarks.assessment_benchmark
+    python -m benchmarks.assessment_benchmark --scales 1 10 100 --repeat 5
+"""
+
+import argparse
+import json
+import statistics
+import time
+from typing import Dict, List
+
+from sqlalchemy import text
+
+from app.database.connection import engine
+from app.services.rule_evaluator import APPLICABLE_SUB_AREAS_SQL
+
+# Previous per-rule path: the evaluate_rule() plpgsql function once per rule
+PER_RULE_SUB_AREAS_SQL = """
+    SELECT DISTINCT ar.sub_area_id
+    FROM applicability_rules ar
+    WHERE ar.is_active = TRUE AND ar.edition_id = :edition_id
+    AND evaluate_rule(ar.id, CAST(:answers AS jsonb))
+"""
+
+# Representative questionnaire profiles (see README "Quick Assessment")
+ANSWER_PROFILES: List[Dict[str, str]] = [
+    {"recipient_type": "all", "has_subrecipients": "yes"},
+    {
+        "recipient_type": "non_state",
+        "federal_assistance_amount": "gte_750k",
+        "has_subrecipients": "yes",
+        "fund_types": "[\"5307\", \"5337\"]",
+        "service_type": "[\"fixed_route\"]"
+    },
+    {
+        "recipient_type": "state",
+        "federal_assistance_amount": "less_750k",
+        "has_subrecipients": "no",
+        "fund_types": "[\"5310\", \"5311\"]",
+        "service_type": "[\"demand_response\"]"
+    },
+]
+
+
+def build_scaled_tables(conn, scale: int) -> int:
+    """Create temp copies of the rule tables replicated `scale` times"""
+    conn.execute(text("DROP TABLE IF EXISTS pg_temp.rule_conditions"))
+    conn.execute(text("DROP TABLE IF EXISTS pg_temp.applicability_rules"))
+
+    offset = conn.execute(text("SELECT COALESCE(MAX(id), 0) + 1 FROM public.applicability_rules")).scalar()
+
+    conn.execute(text("""
+        CREATE TEMP TABLE applicability_rules AS
+        SELECT ar.id + n.i * :offset AS id, ar.edition_id, ar.sub_area_id, ar.is_active
+        FROM public.applicability_rules ar
+        CROSS JOIN generate_series(0, :scale - 1) AS n(i)
+    """), {"offset": offset, "scale": scale})
+    conn.execute(text("""
+        CREATE TEMP TABLE rule_conditions AS
+        SELECT rc.id, rc.rule_id + n.i * :offset AS rule_id, rc.question_key,
+               rc.operator, rc.expected_value, rc.is_active
+        FROM public.rule_conditions rc
+        CROSS JOIN generate_series(0, :scale - 1) AS n(i)
+    """), {"offset": offset, "scale": scale})
+
+    conn.execute(text("ALTER TABLE pg_temp.applicability_rules ADD PRIMARY KEY (id)"))
+    conn.execute(text("CREATE INDEX ON pg_temp.rule_conditions (rule_id)"))
+    conn.execute(text("ANALYZE pg_temp.applicability_rules"))
+    conn.execute(text("ANALYZE pg_temp.rule_conditions"))
+
+    return conn.execute(text("SELECT COUNT(*) FROM pg_temp.applicability_rules")).scalar()
+
+
+def time_query(conn, sql: str, edition_id: int, repeat: int) -> Dict[str, float]:
+    """Run a query for every answer profile and return timing stats in ms"""
+    timings = []
+    results = []
+    for _ in range(repeat):
+        for answers in ANSWER_PROFILES:
+            start = time.perf_counter()
+            rows = conn.execute(text(sql), {"answers": json.dumps(answers), "edition_id": edition_id}).fetchall()
+            timings.append((time.perf_counter() - start) * 1000)
+            results.append(sorted(row[0] for row in rows))
+    return {
+        "median_ms": statistics.median(timings),
+        "max_ms": max(timings),
+        "results": results,
+    }
+
+
+def run(scales: List[int], repeat: int):
+    print("=" * 80)
+    print("ASSESSMENT BENCHMARK - evaluate_rule() vs set-based query")
+    print("=" * 80)
+    print(f"{'Scale':>6} {'Rules':>8} {'Per-rule (ms)':>15} {'Set-based (ms)':>15} {'Speedup':>9}")
+    print("-" * 80)
+
+    with engine.connect() as conn:
+        edition_id = conn.execute(text("SELECT current_guide_edition()")).scalar()
+        for scale in scales:
+            rule_count = build_scaled_tables(conn, scale)
+
+            per_rule = time_query(conn, PER_RULE_SUB_AREAS_SQL, edition_id, repeat)
+            set_based = time_query(conn, APPLICABLE_SUB_AREAS_SQL, edition_id, repeat)
+
+            if per_rule["results"] != set_based["results"]:
+                print(f"✗ Result mismatch at {scale}x")
+
+            speedup = per_rule["median_ms"] / set_based["median_ms"] if set_based["median_ms"] else 0.0
+            print(f"{scale:>5}x {rule_count:>8} {per_rule['median_ms']:>15.2f} "
+                  f"{set_based['median_ms']:>15.2f} {speedup:>8.1f}x")
+
+        conn.rollback()
+
+    print("=" * 80)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark applicability rule evaluation")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100],
+                        help="Rule count multipliers to benchmark")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Repetitions per answer profile")
+    args = parser.parse_args()
+    run(args.scales, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Workbook Benchmark
+Build time of the openpyxl workbook generator on a full-catalog workbook
+(every sub-area applicable), comparing the previous per-cell style objects
+(benchmarks/legacy_workbook_generator.py) with the shared named styles the
+app now uses. Both generators write the same cells, merges and widths.
+
+Usage (from the backend directory):
+    python -m benchmarks.workbook_benchmark
+    python -m benchmarks.workbook_benchmark --repeat 5
+"""
+
+import argparse
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+from app.database.connection import SessionLocal
+from app.services.catalog import get_catalog
+from app.services.workbook_generator import build_workbook_data, create_workbook_bytes
+from benchmarks import legacy_workbook_generator
+
+
+def full_catalog_data() -> Dict[str, Any]:
+    """Workbook data with every sub-area in the catalog applicable"""
+    db = SessionLocal()
+    try:
+        catalog = get_catalog(db)
+    finally:
+        db.close()
+    return build_workbook_data(catalog, list(catalog.sub_areas.values()))
+
+
+def time_workbook(data: Dict[str, Any], generate: Callable, repeat: int) -> Dict[str, float]:
+    """Median build-and-save time and the size of the workbook"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = generate(data)
+        timings.append(time.perf_counter() - start)
+    return {"build_s": statistics.median(timings), "bytes": len(output.getvalue())}
+
+
+def run(repeat: int):
+    data = full_catalog_data()
+    sub_area_count = sum(len(section['sub_areas']) for section in data['sections'])
+
+    print("=" * 80)
+    print("WORKBOOK BENCHMARK - per-cell style objects vs named styles")
+    print(f"{len(data['sections'])} sheets, {sub_area_count} sub-areas, median of {repeat} runs")
+    print("=" * 80)
+    print(f"{'Variant':<10} {'Build (ms)':>12} {'Size (KB)':>10}")
+    print("-" * 80)
+
+    results: List[Dict[str, float]] = []
+    variants = (("per-cell", legacy_workbook_generator.create_workbook_bytes), ("named", create_workbook_bytes))
+    for label, generate in variants:
+        result = time_workbook(data, generate, repeat)
+        results.append(result)
+        print(f"{label:<10} {result['build_s'] * 1000:>12.1f} {result['bytes'] / 1024:>10.1f}")
+
+    per_cell, named = results
+    print("-" * 80)
+    print(f"Speedup: {per_cell['build_s'] / named['build_s']:.1f}x")
+    print("=" * 80)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark openpyxl workbook cell styling")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per variant")
+    args = parser.parse_args()
+    run(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,260 @@
+"""
+Workbook Generation Benchmark
+Wall time, peak Python memory and output size of each workbook generator
+backend on synthetic catalogs at 1x, 10x and 100x the real one.
+
+The synthetic catalog is built from docs/FTA_Complete_Extraction.json (no
+database needed): every section and sub-area, with its indicators and
+deficiencies, is replicated `scale` times under suffixed ids, and every
+sub-area is applicable, as in a full-catalog export.
+
+Backends:
+    openpyxl   create_workbook_bytes() - openpyxl workbook built in memory
+    stream     iter_workbook_chunks() - streamed from workbook data
+    fragments  iter_prerendered_workbook_chunks() - streamed from pre-rendered
+               sub-area fragments; the fragments are rendered once per catalog
+               version, before measuring, as they are at API startup
+
+Peak memory is measured with tracemalloc in a separate run from the timed
+ones, so tracing overhead does not distort the wall times. It covers Python
+allocations only, not the process RSS.
+
+Results are written as JSON (one record per backend and scale) so runs from
+different releases can be compared.
+
+Usage (from the backend directory):
+    python -m benchmarks.workbook_generation_benchmark
+    python -m benchmarks.workbook_generation_benchmark --scales 1 10 --backends stream fragments
+    python -m benchmarks.workbook_generation_benchmark --output results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import time
+import tracemalloc
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import openpyxl
+
+from app.services.catalog import (
+    CatalogDeficiency,
+    CatalogIndicator,
+    CatalogSection,
+    CatalogSnapshot,
+    CatalogSubArea
+)
+from app.services.workbook_generator import (
+    WORKBOOK_GENERATOR_VERSION,
+    build_workbook_data,
+    create_workbook_bytes,
+    get_workbook_fragments,
+    iter_prerendered_workbook_chunks,
+    iter_workbook_chunks
+)
+
+EXTRACTION_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'docs', 'FTA_Complete_Extraction.json'
+)
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), 'results')
+
+
+def load_extraction(path: str = EXTRACTION_PATH) -> Dict[str, Any]:
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def synthetic_catalog(extraction: Dict[str, Any], scale: int) -> CatalogSnapshot:
+    """
+    Catalog with every extracted section replicated `scale` times.
+    Duplicate sub-area ids in the extraction get "_N" suffixes, as the loader
+    does; copy N > 1 gets a "~N" suffix on its section and sub-area ids.
+    """
+    sections: List[CatalogSection] = []
+    sub_areas: List[CatalogSubArea] = []
+    ordinal = 0
+
+    for copy in range(scale):
+        suffix = f"~{copy + 1}" if copy else ""
+        id_counter: Dict[str, int] = defaultdict(int)
+
+        for index, section_data in enumerate(extraction['sections']):
+            section = section_data['section']
+            section_id = section['id'] + suffix
+            sub_area_ids = []
+
+            for sa in section_data.get('sub_areas', []):
+                id_counter[sa['id']] += 1
+                sub_area_id = sa['id'] if id_counter[sa['id']] == 1 else f"{sa['id']}_{id_counter[sa['id']]}"
+                sub_area_id += suffix
+                sub_area_ids.append(sub_area_id)
+
+                sub_areas.append(CatalogSubArea(
+                    id=sub_area_id,
+                    section_id=section_id,
+                    ordinal=ordinal,
+                    question=sa.get('question', ''),
+                    basic_requirement=sa.get('basic_requirement'),
+                    applicability=sa.get('applicability'),
+                    detailed_explanation=sa.get('detailed_explanation'),
+                    instructions_for_reviewer=sa.get('instructions_for_reviewer'),
+                    loe_hours=None,
+                    loe_confidence=None,
+                    loe_confidence_score=None,
+                    loe_reasoning=None,
+                    indicators=tuple(
+                        CatalogIndicator(
+                            id=i, sub_area_id=sub_area_id,
+                            indicator_id=ind.get('indicator_id', ''), text=ind.get('text', '')
+                        )
+                        for i, ind in enumerate(sa.get('indicators_of_compliance') or [])
+                    ),
+                    deficiencies=tuple(
+                        CatalogDeficiency(
+                            id=i, sub_area_id=sub_area_id,
+                            code=d.get('code', ''), title=d.get('title', ''),
+                            determination=d.get('determination'),
+                            suggested_corrective_action=d.get('suggested_corrective_action')
+                        )
+                        for i, d in enumerate(sa.get('deficiencies') or [])
+                    )
+                ))
+                ordinal += 1
+
+            sections.append(CatalogSection(
+                id=section_id,
+                title=section.get('title', section['id']),
+                page_range=section.get('page_range'),
+                purpose=section.get('purpose'),
+                chapter_number=copy * len(extraction['sections']) + index + 1,
+                sub_area_ids=tuple(sub_area_ids)
+            ))
+
+    return CatalogSnapshot(sections, sub_areas, version=scale)
+
+
+def _drain(chunks) -> int:
+    return sum(len(chunk) for chunk in chunks)
+
+
+def run_openpyxl(catalog: CatalogSnapshot) -> int:
+    data = build_workbook_data(catalog, list(catalog.sub_areas.values()))
+    return len(create_workbook_bytes(data).getvalue())
+
+
+def run_stream(catalog: CatalogSnapshot) -> int:
+    data = build_workbook_data(catalog, list(catalog.sub_areas.values()))
+    return _drain(iter_workbook_chunks(data))
+
+
+def run_fragments(catalog: CatalogSnapshot) -> int:
+    return _drain(iter_prerendered_workbook_chunks(catalog, list(catalog.sub_areas.values())))
+
+
+BACKENDS: Dict[str, Callable[[CatalogSnapshot], int]] = {
+    'openpyxl': run_openpyxl,
+    'stream': run_stream,
+    'fragments': run_fragments,
+}
+
+
+def measure(fn: Callable[[CatalogSnapshot], int], catalog: CatalogSnapshot, repeat: int) -> Dict[str, Any]:
+    """Median wall time over `repeat` runs, then one traced run for peak memory"""
+    timings = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        size = fn(catalog)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        fn(catalog)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_s_median": statistics.median(timings),
+        "wall_s_min": min(timings),
+        "peak_traced_bytes": peak,
+        "output_bytes": size,
+    }
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "openpyxl": openpyxl.__version__,
+        "workbook_generator_version": WORKBOOK_GENERATOR_VERSION,
+    }
+
+
+def run(scales: List[int], backends: List[str], repeat: int, output: Optional[str]) -> Dict[str, Any]:
+    extraction = load_extraction()
+    results = []
+
+    print("=" * 88)
+    print("WORKBOOK GENERATION BENCHMARK")
+    print("=" * 88)
+    print(f"{'Scale':>6} {'Sub-areas':>10} {'Backend':<10} {'Wall (ms)':>12} {'Peak (MB)':>10} {'Size (KB)':>10}")
+    print("-" * 88)
+
+    for scale in scales:
+        catalog = synthetic_catalog(extraction, scale)
+        counts: Tuple[int, int, int] = (
+            len(catalog.sub_areas),
+            sum(len(sa.indicators) for sa in catalog.sub_areas.values()),
+            sum(len(sa.deficiencies) for sa in catalog.sub_areas.values()),
+        )
+        if 'fragments' in backends:
+            get_workbook_fragments(catalog)
+        for backend in backends:
+            result = measure(BACKENDS[backend], catalog, repeat)
+            results.append({
+                "backend": backend,
+                "scale": scale,
+                "sub_areas": counts[0],
+                "indicators": counts[1],
+                "deficiencies": counts[2],
+                "repeat": repeat,
+                **result,
+            })
+            print(f"{scale:>5}x {counts[0]:>10} {backend:<10} {result['wall_s_median'] * 1000:>12.1f} "
+                  f"{result['peak_traced_bytes'] / 2**20:>10.1f} {result['output_bytes'] / 1024:>10.1f}")
+
+    print("=" * 88)
+
+    report = {"environment": environment(), "results": results}
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        output = os.path.join(RESULTS_DIR, f"workbook_generation-{stamp}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {output}")
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark workbook generation time, memory and size")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100],
+                        help="Catalog size multipliers to benchmark")
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=list(BACKENDS),
+                        help="Generator backends to run")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Timed runs per backend and scale")
+    parser.add_argument("--output", default=None,
+                        help="Results file (default: benchmarks/results/workbook_generation-<timestamp>.json)")
+    args = parser.parse_args()
+    run(args.scales, args.backends, args.repeat, args.output)
+
+
+if __name__ == "__main__":
+    main()
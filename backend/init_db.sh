@@ -49,6 +49,14 @@ CREATE TABLE IF NOT EXISTS deficiencies (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE TABLE IF NOT EXISTS governing_directives (
+    id SERIAL PRIMARY KEY,
+    sub_area_id VARCHAR(50) NOT NULL REFERENCES sub_areas(id) ON DELETE CASCADE,
+    reference VARCHAR(255),
+    text TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE TABLE IF NOT EXISTS projects (
     id SERIAL PRIMARY KEY,
     name VARCHAR(255) NOT NULL,
@@ -87,15 +95,356 @@ CREATE TABLE IF NOT EXISTS project_answers (
     UNIQUE(project_id, question_id)
 );
 
-CREATE TABLE IF NOT EXISTS project_applicability (
+-- Condition-based rules (database/questionnaire_schema.sql), evaluated in SQL by
+-- the assessment endpoints; rules written by scripts/populate_applicability_rules.py
+-- have conditions instead of a question_id
+ALTER TABLE applicability_rules ADD COLUMN IF NOT EXISTS rule_description TEXT;
+ALTER TABLE applicability_rules ADD COLUMN IF NOT EXISTS priority INTEGER DEFAULT 0;
+ALTER TABLE applicability_rules ADD COLUMN IF NOT EXISTS is_active BOOLEAN DEFAULT TRUE;
+ALTER TABLE applicability_rules ALTER COLUMN question_id DROP NOT NULL;
+ALTER TABLE applicability_rules ALTER COLUMN required_answer DROP NOT NULL;
+
+CREATE TABLE IF NOT EXISTS rule_conditions (
+    id SERIAL PRIMARY KEY,
+    rule_id INTEGER NOT NULL REFERENCES applicability_rules(id) ON DELETE CASCADE,
+    question_key VARCHAR(50) NOT NULL,
+    operator VARCHAR(20) NOT NULL,
+    expected_value VARCHAR(255),
+    is_active BOOLEAN DEFAULT TRUE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS idx_rule_conditions_rule ON rule_conditions(rule_id);
+
+-- Chapter numbers of the sections (filled by scripts/add_chapter_numbers.py)
+ALTER TABLE sections ADD COLUMN IF NOT EXISTS chapter_number INTEGER;
+
+-- Project applicability is stored as a bitset over sub_areas.ordinal
+-- (bit N = byte N / 8, bit N % 8 from the least significant bit, as read by get_bit)
+CREATE SEQUENCE IF NOT EXISTS sub_area_ordinal_seq MINVALUE 0 START WITH 0;
+ALTER TABLE sub_areas ADD COLUMN IF NOT EXISTS ordinal INTEGER;
+ALTER TABLE projects ADD COLUMN IF NOT EXISTS applicability_bits BYTEA;
+
+-- Assign ordinals to sub-areas that have none, in id order after the current maximum
+WITH numbered AS (
+    SELECT id, row_number() OVER (ORDER BY id) - 1 AS rn
+    FROM sub_areas
+    WHERE ordinal IS NULL
+)
+UPDATE sub_areas sa
+SET ordinal = (SELECT COALESCE(MAX(ordinal) + 1, 0) FROM sub_areas) + numbered.rn
+FROM numbered
+WHERE sa.id = numbered.id;
+
+SELECT setval('sub_area_ordinal_seq', (SELECT COALESCE(MAX(ordinal), -1) + 1 FROM sub_areas), false);
+ALTER TABLE sub_areas ALTER COLUMN ordinal SET DEFAULT nextval('sub_area_ordinal_seq');
+CREATE UNIQUE INDEX IF NOT EXISTS idx_sub_areas_ordinal ON sub_areas(ordinal);
+
+-- Convert a legacy project_applicability table: pack its rows into
+-- projects.applicability_bits and keep the rows as project_applicability_rows
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_class WHERE relname = 'project_applicability' AND relkind = 'r') THEN
+        WITH bytes AS (
+            SELECT pa.project_id, sa.ordinal / 8 AS byte_index, bit_or(1 << (sa.ordinal % 8)) AS byte_value
+            FROM project_applicability pa
+            JOIN sub_areas sa ON sa.id = pa.sub_area_id
+            WHERE pa.is_applicable
+            GROUP BY pa.project_id, sa.ordinal / 8
+        ), packed AS (
+            SELECT extent.project_id,
+                   decode(string_agg(lpad(to_hex(COALESCE(bytes.byte_value, 0)), 2, '0'), '' ORDER BY gs.i), 'hex') AS bits
+            FROM (SELECT project_id, MAX(byte_index) AS max_index FROM bytes GROUP BY project_id) extent
+            CROSS JOIN LATERAL generate_series(0, extent.max_index) AS gs(i)
+            LEFT JOIN bytes ON bytes.project_id = extent.project_id AND bytes.byte_index = gs.i
+            GROUP BY extent.project_id
+        )
+        UPDATE projects p
+        SET applicability_bits = packed.bits
+        FROM packed
+        WHERE p.id = packed.project_id AND p.applicability_bits IS NULL;
+
+        ALTER TABLE project_applicability RENAME TO project_applicability_rows;
+    END IF;
+END;
+$$;
+
+-- Read-only compatibility view with one row per applicable sub-area
+CREATE OR REPLACE VIEW project_applicability AS
+SELECT p.id AS project_id, sa.id AS sub_area_id, true AS is_applicable
+FROM projects p
+JOIN sub_areas sa
+    ON sa.ordinal < length(p.applicability_bits) * 8
+    AND get_bit(p.applicability_bits, sa.ordinal) = 1
+WHERE p.applicability_bits IS NOT NULL;
+
+-- Version counters used to invalidate in-process caches; bumped by
+-- statement-level triggers whenever rules or catalog tables change (per
+-- edition, see guide editions below)
+CREATE TABLE IF NOT EXISTS catalog_versions (
+    name VARCHAR(50) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 1,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+INSERT INTO catalog_versions (name)
+VALUES ('applicability_rules'), ('catalog')
+ON CONFLICT (name) DO NOTHING;
+
+-- Each counter is bumped at most once per transaction, however many statements it runs
+ALTER TABLE catalog_versions ADD COLUMN IF NOT EXISTS bumped_txid BIGINT;
+
+CREATE OR REPLACE FUNCTION bump_catalog_version() RETURNS TRIGGER AS $$
+BEGIN
+    -- TRUNCATE also bumps the per-edition counters of the group
+    UPDATE catalog_versions
+    SET version = version + 1, bumped_txid = txid_current(), updated_at = CURRENT_TIMESTAMP
+    WHERE (name = TG_ARGV[0] OR (TG_OP = 'TRUNCATE' AND name LIKE TG_ARGV[0] || ':%'))
+    AND bumped_txid IS DISTINCT FROM txid_current();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    v_table TEXT;
+    v_group TEXT;
+BEGIN
+    FOR v_table, v_group IN
+        SELECT * FROM (VALUES
+            ('applicability_rules', 'applicability_rules'),
+            ('rule_conditions', 'applicability_rules'),
+            ('sections', 'catalog'),
+            ('sub_areas', 'catalog'),
+            ('indicators_of_compliance', 'catalog'),
+            ('deficiencies', 'catalog')
+        ) AS t(table_name, version_group)
+    LOOP
+        IF to_regclass(v_table) IS NOT NULL THEN
+            EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_version ON %I', v_table, v_table);
+            EXECUTE format(
+                'CREATE TRIGGER trg_%s_version AFTER TRUNCATE ON %I '
+                'FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version(%L)',
+                v_table, v_table, v_group
+            );
+        END IF;
+    END LOOP;
+END;
+$$;
+
+-- Content hashes of the last loaded extraction, used by scripts/load_fta_data.py
+-- to write only the sections, sub-areas, indicator lists and deficiency lists that changed
+CREATE TABLE IF NOT EXISTS catalog_content_hashes (
+    entity VARCHAR(20) NOT NULL,
+    key VARCHAR(50) NOT NULL,
+    content_hash CHAR(64) NOT NULL,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (entity, key)
+);
+
+-- Completed audit workbooks uploaded back by reviewers, and the findings read from them
+CREATE TABLE IF NOT EXISTS workbook_imports (
     id SERIAL PRIMARY KEY,
     project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
-    sub_area_id VARCHAR(50) NOT NULL REFERENCES sub_areas(id) ON DELETE CASCADE,
-    is_applicable BOOLEAN DEFAULT true,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    UNIQUE(project_id, sub_area_id)
+    filename VARCHAR(255),
+    rows_read INTEGER NOT NULL DEFAULT 0,
+    findings_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS project_findings (
+    id SERIAL PRIMARY KEY,
+    import_id INTEGER NOT NULL REFERENCES workbook_imports(id) ON DELETE CASCADE,
+    project_id INTEGER NOT NULL REFERENCES projects(id) ON DELETE CASCADE,
+    sub_area_id VARCHAR(50) NOT NULL REFERENCES sub_areas(id),
+    indicator_id VARCHAR(50),
+    sheet_row INTEGER,
+    compliance VARCHAR(20),
+    audit_evidence TEXT,
+    finding_code TEXT,
+    finding_description TEXT,
+    additional_info TEXT,
+    required_action TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_project_findings_import_id ON project_findings(import_id);
+CREATE INDEX IF NOT EXISTS idx_project_findings_project_sub_area ON project_findings(project_id, sub_area_id);
+
+-- Guide editions: each Comprehensive Review Guide edition has its own catalog
+-- rows and applicability rules, keyed by (edition_id, id), and every project is
+-- pinned to the edition it is scoped against. Existing rows belong to FY2025.
+CREATE TABLE IF NOT EXISTS guide_editions (
+    id SERIAL PRIMARY KEY,
+    code VARCHAR(20) NOT NULL UNIQUE,
+    title VARCHAR(255) NOT NULL,
+    source_document VARCHAR(255),
+    extraction_date TIMESTAMP,
+    is_current BOOLEAN NOT NULL DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
+CREATE UNIQUE INDEX IF NOT EXISTS idx_guide_editions_current ON guide_editions(is_current) WHERE is_current;
+
+INSERT INTO guide_editions (code, title, source_document, is_current)
+SELECT 'FY2025', 'FY2025 Comprehensive Review Guide', 'Fiscal Year 2025 FTA Comprehensive Review Guide', TRUE
+WHERE NOT EXISTS (SELECT 1 FROM guide_editions);
+
+-- Edition of rows inserted without one (new projects, scripts written before editions)
+CREATE OR REPLACE FUNCTION current_guide_edition() RETURNS INTEGER AS $$
+    SELECT id FROM guide_editions WHERE is_current
+$$ LANGUAGE sql STABLE;
+
+DO $$
+DECLARE
+    v_table TEXT;
+BEGIN
+    FOREACH v_table IN ARRAY ARRAY[
+        'sections', 'sub_areas', 'indicators_of_compliance', 'deficiencies',
+        'governing_directives', 'applicability_rules', 'projects', 'project_findings'
+    ]
+    LOOP
+        EXECUTE format('ALTER TABLE %I ADD COLUMN IF NOT EXISTS edition_id INTEGER REFERENCES guide_editions(id)', v_table);
+        EXECUTE format('UPDATE %I SET edition_id = current_guide_edition() WHERE edition_id IS NULL', v_table);
+        EXECUTE format('ALTER TABLE %I ALTER COLUMN edition_id SET NOT NULL', v_table);
+        IF v_table <> 'project_findings' THEN
+            EXECUTE format('ALTER TABLE %I ALTER COLUMN edition_id SET DEFAULT current_guide_edition()', v_table);
+        END IF;
+    END LOOP;
+
+    -- Re-key the catalog on (edition_id, id); dropping the old keys drops the foreign keys on them
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'sub_areas_edition_pkey') THEN
+        ALTER TABLE sections DROP CONSTRAINT sections_pkey CASCADE;
+        ALTER TABLE sub_areas DROP CONSTRAINT sub_areas_pkey CASCADE;
+        ALTER TABLE sections ADD CONSTRAINT sections_edition_pkey PRIMARY KEY (edition_id, id);
+        ALTER TABLE sub_areas ADD CONSTRAINT sub_areas_edition_pkey PRIMARY KEY (edition_id, id);
+        ALTER TABLE sub_areas ADD CONSTRAINT sub_areas_section_fkey
+            FOREIGN KEY (edition_id, section_id) REFERENCES sections(edition_id, id) ON DELETE CASCADE;
+
+        FOREACH v_table IN ARRAY ARRAY[
+            'indicators_of_compliance', 'deficiencies', 'governing_directives', 'applicability_rules'
+        ]
+        LOOP
+            EXECUTE format(
+                'ALTER TABLE %I ADD CONSTRAINT %I FOREIGN KEY (edition_id, sub_area_id) '
+                'REFERENCES sub_areas(edition_id, id) ON DELETE CASCADE',
+                v_table, v_table || '_sub_area_fkey'
+            );
+        END LOOP;
+        ALTER TABLE project_findings ADD CONSTRAINT project_findings_sub_area_fkey
+            FOREIGN KEY (edition_id, sub_area_id) REFERENCES sub_areas(edition_id, id);
+
+        ALTER TABLE applicability_rules DROP CONSTRAINT IF EXISTS applicability_rules_sub_area_id_question_id_key;
+        ALTER TABLE applicability_rules ADD CONSTRAINT applicability_rules_edition_sub_area_question_key
+            UNIQUE (edition_id, sub_area_id, question_id);
+    END IF;
+
+    -- Loader content hashes are kept per edition
+    ALTER TABLE catalog_content_hashes ADD COLUMN IF NOT EXISTS edition_id INTEGER REFERENCES guide_editions(id) ON DELETE CASCADE;
+    UPDATE catalog_content_hashes SET edition_id = current_guide_edition() WHERE edition_id IS NULL;
+    ALTER TABLE catalog_content_hashes ALTER COLUMN edition_id SET NOT NULL;
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'catalog_content_hashes_edition_pkey') THEN
+        ALTER TABLE catalog_content_hashes DROP CONSTRAINT IF EXISTS catalog_content_hashes_pkey;
+        ALTER TABLE catalog_content_hashes ADD CONSTRAINT catalog_content_hashes_edition_pkey
+            PRIMARY KEY (edition_id, entity, key);
+    END IF;
+END;
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_projects_edition_id ON projects(edition_id);
+
+-- Per-edition counters ('catalog:<edition_id>' and 'applicability_rules:<edition_id>'),
+-- bumped once per transaction for the editions a statement's rows belong to,
+-- so loading one edition leaves the cached catalogs, engines and results of
+-- the others valid. Inserts, updates and deletes bump only these counters;
+-- the group counters above are bumped by TRUNCATE.
+INSERT INTO catalog_versions (name)
+SELECT v_group || ':' || id FROM guide_editions, unnest(ARRAY['catalog', 'applicability_rules']) AS v_group
+ON CONFLICT (name) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION bump_named_version(p_name TEXT) RETURNS VOID AS $$
+    INSERT INTO catalog_versions (name, bumped_txid)
+    VALUES (p_name, txid_current())
+    ON CONFLICT (name) DO UPDATE
+    SET version = catalog_versions.version + 1, bumped_txid = EXCLUDED.bumped_txid, updated_at = CURRENT_TIMESTAMP
+    WHERE catalog_versions.bumped_txid IS DISTINCT FROM EXCLUDED.bumped_txid;
+$$ LANGUAGE sql;
+
+DROP FUNCTION IF EXISTS bump_edition_catalog_version() CASCADE;
+
+CREATE OR REPLACE FUNCTION bump_edition_versions() RETURNS TRIGGER AS $$
+DECLARE
+    v_rows TEXT;
+    v_edition_id INTEGER;
+BEGIN
+    -- TG_ARGV[0] is the version group; the statement's rows are in the
+    -- old_rows / new_rows transition tables
+    FOREACH v_rows IN ARRAY CASE TG_OP
+        WHEN 'INSERT' THEN ARRAY['new_rows']
+        WHEN 'DELETE' THEN ARRAY['old_rows']
+        ELSE ARRAY['old_rows', 'new_rows']
+    END
+    LOOP
+        FOR v_edition_id IN EXECUTE CASE TG_TABLE_NAME
+            -- Conditions belong to the edition of their rule
+            WHEN 'rule_conditions' THEN format(
+                'SELECT DISTINCT r.edition_id FROM %I c JOIN applicability_rules r ON r.id = c.rule_id', v_rows
+            )
+            ELSE format('SELECT DISTINCT edition_id FROM %I', v_rows)
+        END
+        LOOP
+            PERFORM bump_named_version(TG_ARGV[0] || ':' || v_edition_id);
+        END LOOP;
+    END LOOP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DO $$
+DECLARE
+    v_table TEXT;
+    v_group TEXT;
+BEGIN
+    FOR v_table, v_group IN
+        SELECT * FROM (VALUES
+            ('applicability_rules', 'applicability_rules'),
+            ('rule_conditions', 'applicability_rules'),
+            ('sections', 'catalog'),
+            ('sub_areas', 'catalog'),
+            ('indicators_of_compliance', 'catalog'),
+            ('deficiencies', 'catalog')
+        ) AS t(table_name, version_group)
+    LOOP
+        -- A trigger with transition tables handles a single event
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_edition_insert ON %I', v_table, v_table);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_edition_insert AFTER INSERT ON %I '
+            'REFERENCING NEW TABLE AS new_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION bump_edition_versions(%L)',
+            v_table, v_table, v_group
+        );
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_edition_update ON %I', v_table, v_table);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_edition_update AFTER UPDATE ON %I '
+            'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION bump_edition_versions(%L)',
+            v_table, v_table, v_group
+        );
+        EXECUTE format('DROP TRIGGER IF EXISTS trg_%s_edition_delete ON %I', v_table, v_table);
+        EXECUTE format(
+            'CREATE TRIGGER trg_%s_edition_delete AFTER DELETE ON %I '
+            'REFERENCING OLD TABLE AS old_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION bump_edition_versions(%L)',
+            v_table, v_table, v_group
+        );
+    END LOOP;
+END;
+$$;
+
+-- Adding an edition or changing the current one refreshes the API's edition list
+DROP TRIGGER IF EXISTS trg_guide_editions_version ON guide_editions;
+CREATE TRIGGER trg_guide_editions_version AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON guide_editions
+FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version('catalog');
+
 -- Insert sample questions if table is empty
 INSERT INTO questionnaire_questions (question_number, question_text, category)
 VALUES
@@ -0,0 +1,117 @@
+"""
+Packing of projects.applicability_bits, checked against PostgreSQL get_bit
+"""
+
+import pytest
+from sqlalchemy import text
+
+from app.services.applicability_bitset import bits_to_bytes, bytes_to_bits, decode_ordinals, encode_ordinals
+from app.services.applicability_engine import ApplicabilityEngine
+
+# Ordinals at both ends of bytes and across several byte boundaries
+ORDINAL_SETS = [
+    [],
+    [0],
+    [7],
+    [8],
+    [0, 7, 8, 15, 16],
+    [6, 7, 8, 9],
+    [3, 63, 64, 65, 127, 128, 1000],
+]
+
+
+@pytest.mark.parametrize("ordinals", ORDINAL_SETS)
+def test_round_trip(ordinals):
+    data = encode_ordinals(ordinals)
+    assert decode_ordinals(data) == ordinals
+    assert bits_to_bytes(bytes_to_bits(data)) == data
+    assert len(data) == (max(ordinals) // 8 + 1 if ordinals else 0)
+
+
+def test_bit_order():
+    # Little-endian bytes, least significant bit first within each byte
+    assert encode_ordinals([0]) == b'\x01'
+    assert encode_ordinals([7]) == b'\x80'
+    assert encode_ordinals([8]) == b'\x00\x01'
+    assert encode_ordinals([1, 9, 23]) == b'\x02\x02\x80'
+
+
+def test_engine_round_trip():
+    ordinals = {"L1": 0, "L2": 7, "L3": 8, "F1": 15, "F2": 16, "F3": 130}
+    engine = ApplicabilityEngine([(sub_area_id, [(3, "yes")]) for sub_area_id in ordinals], ordinals=ordinals)
+
+    for sub_area_ids in (["L1"], ["L2", "L3"], ["F1", "F2", "F3"], list(ordinals)):
+        data = bits_to_bytes(engine.encode(sub_area_ids))
+        assert decode_ordinals(data) == sorted(ordinals[sa_id] for sa_id in sub_area_ids)
+        assert sorted(engine.decode(bytes_to_bits(data))) == sorted(sub_area_ids)
+
+    data = bits_to_bytes(engine.evaluate({3: "yes"}))
+    assert data[0] == 0b10000001 and data[1] == 0b10000001 and data[2] == 0b00000001
+    assert len(data) == 17 and data[16] == 0b00000100
+
+
+def test_null_and_empty_mean_no_sub_areas():
+    assert bytes_to_bits(None) == 0
+    assert bytes_to_bits(b'') == 0
+    assert decode_ordinals(None) == []
+
+
+@pytest.mark.parametrize("ordinals", [ordinals for ordinals in ORDINAL_SETS if ordinals])
+def test_matches_get_bit(database, ordinals):
+    with database.connect() as connection:
+        set_bits = connection.execute(
+            text(
+                "SELECT array_agg(n ORDER BY n) FROM generate_series(0, length(:bits) * 8 - 1) AS n "
+                "WHERE get_bit(:bits, n) = 1"
+            ),
+            {"bits": encode_ordinals(ordinals)}
+        ).scalar()
+    assert set_bits == ordinals
+
+
+def test_project_applicability_view(db):
+    # Put the seed sub-areas on both sides of a byte boundary and past the next one
+    ordinals = {"L1": 7, "L2": 8, "F1": 17}
+    # Moved out of the way first, as ordinals are unique
+    db.execute(text("UPDATE sub_areas SET ordinal = -1 - ordinal"))
+    for sub_area_id, ordinal in ordinals.items():
+        db.execute(text("UPDATE sub_areas SET ordinal = :ordinal WHERE id = :id"), {"ordinal": ordinal, "id": sub_area_id})
+    project_id = db.execute(
+        text("INSERT INTO projects (name, applicability_bits) VALUES ('Bits', :bits) RETURNING id"),
+        {"bits": encode_ordinals([ordinals["L1"], ordinals["F1"]])}
+    ).scalar()
+
+    applicable = db.execute(
+        text("SELECT sub_area_id FROM project_applicability WHERE project_id = :id ORDER BY sub_area_id"),
+        {"id": project_id}
+    ).scalars().all()
+    db.rollback()
+
+    assert applicable == ["F1", "L1"]
+
+
+def test_stored_bits_match_get_bit(client, db):
+    ordinals = {"L1": 7, "L2": 8, "F1": 17}
+    db.execute(text("UPDATE sub_areas SET ordinal = -1 - ordinal"))
+    for sub_area_id, ordinal in ordinals.items():
+        db.execute(text("UPDATE sub_areas SET ordinal = :ordinal WHERE id = :id"), {"ordinal": ordinal, "id": sub_area_id})
+    db.commit()
+
+    project = client.post("/api/projects", json={"name": "Bits"}).json()
+    response = client.post(f"/api/projects/{project['id']}/answers", json={"answers": {"1": "all", "3": "yes"}})
+    assert response.status_code == 200
+
+    stored = bytes(db.execute(
+        text("SELECT applicability_bits FROM projects WHERE id = :id"), {"id": project["id"]}
+    ).scalar())
+    set_in_postgres = db.execute(
+        text(
+            "SELECT s.id FROM sub_areas s JOIN projects p ON p.id = :id "
+            "WHERE s.ordinal < length(p.applicability_bits) * 8 AND get_bit(p.applicability_bits, s.ordinal) = 1"
+        ),
+        {"id": project["id"]}
+    ).scalars().all()
+
+    engine = ApplicabilityEngine.from_db(db, edition_id=1)
+    assert sorted(engine.decode(bytes_to_bits(stored))) == sorted(set_in_postgres) == ["L1", "L2"]
+    assert decode_ordinals(stored) == [ordinals["L1"], ordinals["L2"]]
@@ -0,0 +1,103 @@
+"""
+Compiled applicability engine, checked against a direct evaluation of each rule
+"""
+
+import itertools
+
+from sqlalchemy import text
+
+from app.services.applicability_engine import ApplicabilityEngine
+
+RULES = [
+    ("L1", [(1, "all")]),
+    # AND across conditions, with question 1 semantics inside a compound rule
+    ("L2", [(1, "state"), (3, "yes")]),
+    ("L3", [(3, "yes"), (6, "5307"), (6, "5337")]),
+    # OR across a sub-area's rules
+    ("L3", [(2, "over_1m")]),
+    # No conditions: always applicable
+    ("F1", []),
+    ("F2", [(1, "non_state")]),
+    # Question 1 answers other than all/state/non_state never match
+    ("F3", [(1, "other")]),
+    # A required answer containing a comma matches the full answer
+    ("F4", [(6, "5307,5337")]),
+    ("F5", [(2, "over_1m"), (3, "no")]),
+]
+
+ANSWER_CHOICES = {
+    1: [None, "all", "state", "non_state"],
+    2: [None, "over_1m", "under_1m"],
+    3: [None, "yes", "no"],
+    6: [None, "5307", "5337", "5307,5337", "5310"],
+}
+
+
+def _condition_holds(question_id, required_answer, answers):
+    answer = answers.get(question_id)
+    if answer is None:
+        return False
+    if question_id == 1:
+        return (
+            required_answer == "all"
+            or (answer in ("state", "non_state") and required_answer == answer)
+            or (answer == "all" and required_answer in ("state", "non_state"))
+        )
+    return required_answer in answer.split(",") or answer == required_answer
+
+
+def _per_rule(rules, answers):
+    return sorted({
+        sub_area_id for sub_area_id, conditions in rules
+        if all(_condition_holds(question_id, required, answers) for question_id, required in conditions)
+    })
+
+
+def _answer_sets():
+    for values in itertools.product(*ANSWER_CHOICES.values()):
+        yield {question_id: answer for question_id, answer in zip(ANSWER_CHOICES, values) if answer is not None}
+
+
+def test_matches_per_rule_evaluation():
+    engine = ApplicabilityEngine(RULES)
+    for answers in _answer_sets():
+        assert sorted(engine.applicable_sub_area_ids(answers)) == _per_rule(RULES, answers), answers
+
+
+def test_compound_rules():
+    engine = ApplicabilityEngine(RULES)
+
+    assert sorted(engine.applicable_sub_area_ids({})) == ["F1"]
+    assert sorted(engine.applicable_sub_area_ids({1: "all", 3: "yes"})) == ["F1", "F2", "L1", "L2"]
+    # Both multi-select answers are needed, not one of them twice
+    assert "L3" not in engine.applicable_sub_area_ids({3: "yes", 6: "5307"})
+    assert "L3" in engine.applicable_sub_area_ids({3: "yes", 6: "5337,5307"})
+
+
+def test_affected_sub_areas():
+    engine = ApplicabilityEngine(RULES)
+
+    def affected(*question_ids):
+        return sorted(engine.decode(engine.affected_sub_areas(question_ids)))
+
+    assert affected(3) == ["F5", "L2", "L3"]
+    assert affected(6) == ["F4", "L3"]
+    assert affected(1, 2) == ["F2", "F3", "F5", "L1", "L2", "L3"]
+    # Rules without conditions depend on no question
+    assert affected() == []
+
+
+def test_from_db_skips_inactive_and_condition_only_rules(db):
+    db.execute(text(
+        "INSERT INTO applicability_rules (sub_area_id, question_id, required_answer, is_active) "
+        "VALUES ('F1', 1, 'all', FALSE)"
+    ))
+    # Condition-only rule of POST /api/assess, without conditions it always matches there
+    db.execute(text("INSERT INTO applicability_rules (sub_area_id) VALUES ('L2')"))
+
+    engine = ApplicabilityEngine.from_db(db, edition_id=1)
+    db.rollback()
+
+    assert engine.rule_count == 3
+    assert engine.applicable_sub_area_ids({1: "all"}) == ["L1"]
+    assert sorted(engine.applicable_sub_area_ids({1: "all", 2: "over_1m", 3: "yes"})) == ["F1", "L1", "L2"]
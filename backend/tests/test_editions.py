@@ -0,0 +1,248 @@
+"""
+Guide editions: projects pinned to their edition, per-edition version
+counters and caches, and rules inherited by a new edition
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+from app.services.applicability_engine import engine_version, get_applicability_engine
+from app.services.catalog_version import edition_versions, get_catalog_versions
+from app.services.result_cache import ResultCache, applicability_cache
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "scripts"))
+
+from fta_extraction import content_hash  # noqa: E402
+from guide_diff import build_changeset, read_edition  # noqa: E402
+from load_fta_data import LIST_TABLES, SUB_AREA, inherit_from, load_changeset, make_current  # noqa: E402
+
+# FY2026 (id 2): the FY2025 catalog with reworded questions, without rules
+FY2026_CATALOG_SQL = """
+INSERT INTO guide_editions (code, title) VALUES ('FY2026', 'FY2026 Comprehensive Review Guide');
+
+INSERT INTO sections (edition_id, id, title, page_range, purpose, chapter_number)
+SELECT 2, id, title, page_range, purpose, chapter_number FROM sections WHERE edition_id = 1;
+
+INSERT INTO sub_areas (edition_id, id, section_id, question, basic_requirement)
+SELECT 2, id, section_id, question || ' (FY2026)', basic_requirement FROM sub_areas WHERE edition_id = 1 ORDER BY ordinal;
+
+INSERT INTO indicators_of_compliance (edition_id, sub_area_id, indicator_id, text)
+SELECT 2, sub_area_id, indicator_id, text FROM indicators_of_compliance WHERE edition_id = 1 ORDER BY id;
+"""
+
+
+def _execute(database, statements, fn=None):
+    """Run SQL (and then fn(cursor)) in one committed transaction, as the loader does"""
+    raw = database.raw_connection()
+    try:
+        cursor = raw.cursor()
+        if statements:
+            cursor.execute(statements)
+        result = fn(cursor) if fn else None
+        raw.commit()
+        return result
+    finally:
+        raw.close()
+
+
+def _fetch(database, query):
+    return _execute(database, None, lambda cursor: (cursor.execute(query), cursor.fetchall())[1])
+
+
+@pytest.fixture
+def fy2026(catalog_db):
+    """Seed catalog plus an FY2026 edition inheriting FY2025's rules"""
+    return _execute(catalog_db, FY2026_CATALOG_SQL, lambda cursor: inherit_from(cursor, 2, 1))
+
+
+def _rules(database, edition_id):
+    return _fetch(database, f"""
+        SELECT r.sub_area_id, r.question_id, r.required_answer, r.rule_description, r.priority, r.is_active,
+               array_agg(c.question_key || '=' || c.expected_value ORDER BY c.id) FILTER (WHERE c.id IS NOT NULL)
+        FROM applicability_rules r
+        LEFT JOIN rule_conditions c ON c.rule_id = r.id
+        WHERE r.edition_id = {edition_id}
+        GROUP BY r.id
+        ORDER BY r.sub_area_id
+    """)
+
+
+def test_inherit_copies_rules_with_conditions(catalog_db):
+    _execute(catalog_db, "UPDATE applicability_rules SET priority = 5, is_active = FALSE WHERE sub_area_id = 'L2'")
+
+    # Three sub-areas estimated, three rules copied
+    assert _execute(catalog_db, FY2026_CATALOG_SQL, lambda cursor: inherit_from(cursor, 2, 1)) == (3, 3)
+
+    assert _rules(catalog_db, 2) == _rules(catalog_db, 1)
+    assert _rules(catalog_db, 2)[2] == (
+        "L2", 3, "yes", "Recipients with subrecipients", 5, False, ["has_subrecipients=yes"]
+    )
+    # Copied conditions hang off the copied rules; the source keeps its own
+    assert _fetch(catalog_db, """
+        SELECT r.edition_id, count(*) FROM rule_conditions c JOIN applicability_rules r ON r.id = c.rule_id
+        GROUP BY r.edition_id ORDER BY r.edition_id
+    """) == [(1, 2), (2, 2)]
+
+    # Inheriting again keeps the rules the edition already has
+    assert _execute(catalog_db, None, lambda cursor: inherit_from(cursor, 2, 1)) == (0, 0)
+    assert _fetch(catalog_db, "SELECT count(*) FROM rule_conditions") == [(4,)]
+
+
+def test_inherit_renamed_sub_area(catalog_db):
+    # FY2026 renumbers L2 as L3
+    _execute(catalog_db, FY2026_CATALOG_SQL + """
+        DELETE FROM sub_areas WHERE edition_id = 2 AND id = 'L2';
+        INSERT INTO sub_areas (edition_id, id, section_id, question) VALUES (2, 'L3', 'LEGAL', 'Are subrecipients eligible?');
+    """)
+
+    copied = _execute(catalog_db, None, lambda cursor: inherit_from(cursor, 2, 1, {"L3": "L2"}))
+
+    assert copied == (1, 1)
+    assert [rule[0] for rule in _rules(catalog_db, 2)] == ["L3"]
+    assert _rules(catalog_db, 2)[0][-1] == ["has_subrecipients=yes"]
+
+
+def _renumbered(catalog, renames, removed):
+    """A catalog (in read_edition()'s shape) with sub-areas renumbered ({old id: new id}) and removed"""
+    def rekey(entity, key, rows):
+        if entity == SUB_AREA:
+            rows = (renames.get(key, key), *rows[1:])
+        else:
+            rows = [(renames.get(key, key), *row[1:]) for row in rows]
+        return renames.get(key, key), (content_hash(rows), rows)
+
+    return {
+        entity: dict(
+            rekey(entity, key, rows) if entity in (SUB_AREA, *LIST_TABLES) else (key, (hash_, rows))
+            for key, (hash_, rows) in parts.items()
+            if key not in removed or entity not in (SUB_AREA, *LIST_TABLES)
+        )
+        for entity, parts in catalog.items()
+    }
+
+
+def test_changeset_for_new_edition(catalog_db, tmp_path):
+    _execute(catalog_db, """
+        UPDATE applicability_rules SET priority = 5 WHERE sub_area_id = 'L2';
+        INSERT INTO catalog_content_hashes (edition_id, entity, key, content_hash)
+        SELECT 1, entity, key, repeat('0', 64)
+        FROM (VALUES ('section', 'LEGAL'), ('section', 'FM'), ('sub_area', 'L1'), ('sub_area', 'L2'),
+                     ('indicators', 'L2'), ('sub_area', 'F1')) AS h(entity, key);
+    """)
+    old = _execute(catalog_db, None, lambda cursor: read_edition(cursor, 1))
+    # FY2026 renumbers L2 as L3 and drops F1
+    new = _renumbered(old, {"L2": "L3"}, {"F1"})
+    changeset = build_changeset({"edition": "FY2025"}, old, {"edition": "FY2026"}, new)
+    assert [(record["op"], record["id"]) for record in changeset["sub_areas"]] == [("rename", "L3"), ("remove", "F1")]
+    path = tmp_path / "fy2026-changeset.json"
+    path.write_text(json.dumps(changeset))
+
+    # Without --prune: the renumbered and removed sub-areas are not copied into the new edition
+    load_changeset(str(path), current=True)
+
+    assert _fetch(catalog_db, "SELECT id FROM sub_areas WHERE edition_id = 2 ORDER BY id") == [("L1",), ("L3",)]
+    assert _fetch(catalog_db, """
+        SELECT sub_area_id, count(*) FROM indicators_of_compliance WHERE edition_id = 2 GROUP BY sub_area_id ORDER BY 1
+    """) == [("L1", 2), ("L3", 1)]
+    assert _fetch(catalog_db, "SELECT count(*) FROM deficiencies WHERE edition_id = 2") == [(1,)]
+    # Content hashes are cloned for the copied parts only (L3's come from the changeset)
+    assert _fetch(catalog_db, "SELECT DISTINCT key FROM catalog_content_hashes WHERE edition_id = 2 ORDER BY 1") == [
+        ("FM",), ("L1",), ("L3",), ("LEGAL",)
+    ]
+    # Cloned and carried-over rules keep every column and their conditions
+    assert _rules(catalog_db, 2) == [
+        ("L1", 1, "all", "Applies to all recipients", 0, True, None),
+        ("L3", 3, "yes", "Recipients with subrecipients", 5, True, ["has_subrecipients=yes"]),
+    ]
+    assert _rules(catalog_db, 1) == [
+        ("F1", 2, "over_1m", "Recipients over the single audit threshold", 0, True, ["federal_expenditure=over_1m"]),
+        ("L1", 1, "all", "Applies to all recipients", 0, True, None),
+        ("L2", 3, "yes", "Recipients with subrecipients", 5, True, ["has_subrecipients=yes"]),
+    ]
+    assert _fetch(catalog_db, "SELECT is_current FROM guide_editions ORDER BY id") == [(False,), (True,)]
+
+
+def test_projects_stay_on_their_edition(client, catalog_db, fy2026):
+    answers = {"answers": {"1": "all", "3": "yes"}}
+    old = client.post("/api/projects", json={"name": "FY2025 project"}).json()
+    client.post(f"/api/projects/{old['id']}/answers", json=answers)
+
+    # FY2026 drops subrecipient eligibility from scoping and becomes current
+    _execute(catalog_db, "UPDATE applicability_rules SET required_answer = 'never' WHERE edition_id = 2 AND sub_area_id = 'L2'")
+    _execute(catalog_db, None, lambda cursor: make_current(cursor, 2))
+
+    new = client.post("/api/projects", json={"name": "FY2026 project"}).json()
+    assert (old["edition_id"], new["edition_id"]) == (1, 2)
+
+    old_result = client.post(f"/api/projects/{old['id']}/answers", json=answers).json()
+    new_result = client.post(f"/api/projects/{new['id']}/answers", json=answers).json()
+    assert [sa["sub_area_id"] for sa in old_result["applicable_sub_areas"]] == ["L1", "L2"]
+    assert [sa["sub_area_id"] for sa in new_result["applicable_sub_areas"]] == ["L1"]
+    assert new_result["applicable_sub_areas"][0]["question"].endswith("(FY2026)")
+
+    assessed = client.post("/api/assess?edition=FY2025", json={"answers": {"1": "all"}}).json()
+    assert [sa["question"] for sa in assessed["applicable_sub_areas"]] == ["Is the recipient eligible?"]
+
+
+def test_writes_bump_only_their_edition(db, catalog_db, fy2026):
+    before = get_catalog_versions(db)
+    db.rollback()
+
+    # Multi-row statements in one transaction bump each counter once
+    _execute(catalog_db, """
+        UPDATE applicability_rules SET priority = priority + 1 WHERE edition_id = 2;
+        UPDATE rule_conditions SET expected_value = expected_value
+        WHERE rule_id IN (SELECT id FROM applicability_rules WHERE edition_id = 2);
+        UPDATE indicators_of_compliance SET text = text || '.' WHERE edition_id = 2;
+    """)
+    after = get_catalog_versions(db)
+
+    assert edition_versions(after, 1) == edition_versions(before, 1)
+    assert {name: after[name] - before[name] for name in ("applicability_rules:2", "catalog:2")} == {
+        "applicability_rules:2": 1, "catalog:2": 1
+    }
+    # Group counters are left for TRUNCATE and edition changes
+    assert (after["applicability_rules"], after["catalog"]) == (before["applicability_rules"], before["catalog"])
+    assert engine_version(after, 1) == engine_version(before, 1)
+
+    # A deleted condition is found through its rule's edition
+    _execute(catalog_db, "DELETE FROM rule_conditions WHERE rule_id IN (SELECT id FROM applicability_rules WHERE edition_id = 1)")
+    assert get_catalog_versions(db)["applicability_rules:1"] == after["applicability_rules:1"] + 1
+
+
+def test_edition_caches_survive_other_editions_changes(db, client, catalog_db, fy2026):
+    engine = get_applicability_engine(db, 1, engine_version(get_catalog_versions(db), 1))
+    answers = {"answers": {"1": "all", "3": "yes"}}
+    client.post("/api/assess?edition=FY2025", json=answers)
+    client.post("/api/assess?edition=FY2026", json=answers)
+    assert applicability_cache.stats()["size"] == 2
+
+    _execute(catalog_db, "UPDATE applicability_rules SET priority = 1 WHERE edition_id = 2")
+    db.rollback()
+    versions = get_catalog_versions(db)
+
+    hits = applicability_cache.stats()["hits"]
+    client.post("/api/assess?edition=FY2025", json=answers)
+    client.post("/api/assess?edition=FY2026", json=answers)
+    # FY2025's result is reused; FY2026's is recomputed
+    assert applicability_cache.stats()["hits"] == hits + 1
+    assert applicability_cache.stats()["size"] == 2
+    assert get_applicability_engine(db, 1, engine_version(versions, 1)) is engine
+    assert get_applicability_engine(db, 2, engine_version(versions, 2)).version == engine_version(versions, 2)
+
+
+def test_result_cache_partitions():
+    cache = ResultCache()
+    cache.sync_version(("v", 1), partition=1)
+    cache.sync_version(("v", 1), partition=2)
+    cache.set("one", "result 1", partition=1)
+    cache.set("two", "result 2", partition=2)
+
+    cache.sync_version(("v", 1), partition=1)
+    cache.sync_version(("v", 2), partition=2)
+
+    assert (cache.get("one"), cache.get("two")) == ("result 1", None)
+    assert cache.stats()["invalidations"] == 1
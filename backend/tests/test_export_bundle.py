@@ -0,0 +1,150 @@
+"""
+Workbook bundles: the streamed ZIP and the project selection of POST /api/projects/export-bundle
+"""
+
+import io
+import zipfile
+from concurrent.futures import Executor, Future
+
+import openpyxl
+import pytest
+
+from app.routers import projects as projects_router
+from app.services.applicability_bitset import encode_ordinals
+from app.services.export_bundle import BundleMember, BundleWriter
+from app.services.export_cache import ExportCache
+from app.services.export_jobs import ExportJobManager, ExportTimeout
+
+
+class InlineExecutor(Executor):
+    """Runs each job as it is submitted"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def submit(self, fn, *args, **kwargs):
+        self.calls += 1
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+@pytest.fixture
+def executor():
+    return InlineExecutor()
+
+
+@pytest.fixture
+def writer(tmp_path, executor):
+    cache = ExportCache(str(tmp_path / "exports"), max_bytes=10 * 1024 * 1024)
+    return BundleWriter(jobs=ExportJobManager(cache, executor=executor), cache=cache, chunk_size=1024)
+
+
+def _member(catalog, project_id, name, ordinals):
+    return BundleMember(
+        project_id=project_id,
+        project_name=name,
+        applicability_bits=encode_ordinals(ordinals),
+        cache_key=f"bundle-{project_id}",
+        catalog=catalog
+    )
+
+
+def _sheet_titles(data: bytes):
+    return openpyxl.load_workbook(io.BytesIO(data), read_only=True).sheetnames
+
+
+def test_bundle_zip(writer, executor, sample_catalog):
+    members = [
+        _member(sample_catalog, 1, "Alpha", [0, 1]),
+        _member(sample_catalog, 2, "Beta", [2]),
+        _member(sample_catalog, 3, "Alpha", [0, 1, 2]),
+    ]
+    chunks = list(writer.iter_chunks(members))
+
+    assert len(chunks) > 1
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+        names = zf.namelist()
+        assert len(names) == 3
+        assert names[0].startswith("Alpha-Scoping Workbook-")
+        assert names[1].startswith("Beta-Scoping Workbook-")
+        # Same project name: de-duplicated within the archive
+        assert names[2].endswith(" (2).xlsx")
+        assert all(info.compress_type == zipfile.ZIP_STORED for info in zf.infolist())
+        sheets = [_sheet_titles(zf.read(name)) for name in names]
+    assert [len(titles) for titles in sheets] == [1, 1, 2]
+    assert executor.calls == 3
+
+
+def test_bundle_reuses_cached_workbooks(writer, executor, sample_catalog):
+    member = _member(sample_catalog, 1, "Alpha", [0])
+    first = b"".join(writer.iter_chunks([member]))
+    second = b"".join(writer.iter_chunks([member]))
+
+    assert executor.calls == 1
+    with zipfile.ZipFile(io.BytesIO(first)) as a, zipfile.ZipFile(io.BytesIO(second)) as b:
+        assert a.read(a.namelist()[0]) == b.read(b.namelist()[0])
+
+
+class StalledExecutor(Executor):
+    """Accepts jobs and never runs them"""
+
+    def submit(self, fn, *args, **kwargs):
+        return Future()
+
+
+def test_bundle_aborts_when_a_job_stalls(tmp_path, sample_catalog):
+    cache = ExportCache(str(tmp_path / "exports"), max_bytes=10 * 1024 * 1024)
+    jobs = ExportJobManager(cache, wait_timeout=0.05, executor=StalledExecutor())
+    writer = BundleWriter(jobs=jobs, cache=cache, chunk_size=1024)
+
+    with pytest.raises(ExportTimeout):
+        b"".join(writer.iter_chunks([_member(sample_catalog, 1, "Alpha", [0])]))
+
+
+@pytest.fixture
+def bundle_client(client, monkeypatch, writer):
+    monkeypatch.setattr(projects_router, "BundleWriter", lambda: writer)
+    for name, review_type, answers in [
+        ("Alpha_1", "triennial", {"1": "all"}),
+        ("Alpha%2", "triennial", {"1": "all", "3": "yes"}),
+        ("AlphaX1", "state", {"1": "all"}),
+        ("Unscoped", "state", None),
+    ]:
+        project = client.post("/api/projects", json={"name": name, "review_type": review_type}).json()
+        if answers:
+            client.post(f"/api/projects/{project['id']}/answers", json={"answers": answers})
+    return client
+
+
+def _bundle_projects(client, selection):
+    response = client.post("/api/projects/export-bundle", json=selection)
+    if response.status_code != 200:
+        return response.status_code
+    with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
+        names = sorted(name.split("-Scoping Workbook-")[0] for name in zf.namelist())
+    assert response.headers["x-export-count"] == str(len(names))
+    return names
+
+
+def test_bundle_selection(bundle_client):
+    assert _bundle_projects(bundle_client, {"project_ids": [1, 3]}) == ["AlphaX1", "Alpha_1"]
+    assert _bundle_projects(bundle_client, {"review_type": "triennial"}) == ["Alpha2", "Alpha_1"]
+    # Projects without applicable sub-areas are left out
+    assert _bundle_projects(bundle_client, {"review_type": "state"}) == ["AlphaX1"]
+    assert _bundle_projects(bundle_client, {"project_ids": [1, 2], "review_type": "state"}) == 400
+
+
+def test_bundle_name_filter_is_literal(bundle_client):
+    assert _bundle_projects(bundle_client, {"name_contains": "alpha"}) == ["Alpha2", "AlphaX1", "Alpha_1"]
+    # LIKE wildcards in the filter match only themselves
+    assert _bundle_projects(bundle_client, {"name_contains": "_"}) == ["Alpha_1"]
+    assert _bundle_projects(bundle_client, {"name_contains": "%"}) == ["Alpha2"]
+    assert _bundle_projects(bundle_client, {"name_contains": "a%2"}) == ["Alpha2"]
+    assert _bundle_projects(bundle_client, {"name_contains": "\\"}) == 400
+
+
+@pytest.mark.parametrize("selection", [{}, {"project_ids": []}, {"name_contains": ""}])
+def test_bundle_rejects_empty_selection(bundle_client, selection):
+    response = bundle_client.post("/api/projects/export-bundle", json=selection)
+    assert response.status_code == 422
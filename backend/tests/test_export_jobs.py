@@ -0,0 +1,195 @@
+"""
+Background export jobs: the job manager on a stub executor, and the export-jobs API
+"""
+
+import os
+from concurrent.futures import Executor, Future
+
+import pytest
+
+from app.routers import export_jobs as export_jobs_router
+from app.services.export_cache import ExportCache
+from app.services.export_jobs import (
+    DONE, FAILED, QUEUED, RUNNING, ExportJobManager, ExportQueueFull
+)
+from app.services.workbook_generator import build_workbook_data
+
+
+class StubExecutor(Executor):
+    """Holds submitted calls until the test runs them, in the calling thread"""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.pending.append((future, fn, args, kwargs))
+        return future
+
+    def run_next(self, error=None):
+        future, fn, args, kwargs = self.pending.pop(0)
+        future.set_running_or_notify_cancel()
+        try:
+            if error is not None:
+                raise error
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+
+@pytest.fixture
+def executor():
+    return StubExecutor()
+
+
+@pytest.fixture
+def manager(tmp_path, executor):
+    cache = ExportCache(str(tmp_path / "exports"), max_bytes=10 * 1024 * 1024)
+    return ExportJobManager(cache, queue_limit=2, executor=executor)
+
+
+@pytest.fixture
+def data(sample_catalog):
+    return build_workbook_data(sample_catalog, list(sample_catalog.sub_areas.values()))
+
+
+def test_duplicate_jobs_coalesce(manager, executor, data):
+    job, created = manager.submit(1, "Project", "key-1", data)
+    same_job, same_created = manager.submit(1, "Project", "key-1", data)
+    other_job, other_created = manager.submit(2, "Other", "key-2", data)
+
+    assert created and not same_created and other_created
+    assert same_job is job
+    assert other_job is not job
+    assert len(executor.pending) == 2
+
+
+def test_queue_limit(manager, executor, data):
+    manager.submit(1, "One", "key-1", data)
+    manager.submit(2, "Two", "key-2", data)
+
+    with pytest.raises(ExportQueueFull):
+        manager.submit(3, "Three", "key-3", data)
+    # Joining an in-flight job does not need a queue slot
+    assert manager.submit(1, "One", "key-1", data)[1] is False
+
+    executor.run_next()
+    job, created = manager.submit(3, "Three", "key-3", data)
+    assert created and job.status == QUEUED
+
+
+def test_progress_and_completion(manager, executor, data):
+    job, _ = manager.submit(1, "Project", "key-1", data)
+    assert job.total == 2
+    assert (job.status, manager.progress(job)) == (QUEUED, (0, 2))
+
+    # A worker reports the sheets it has written in the progress file
+    with open(job.progress_path, "w") as f:
+        f.write("1")
+    assert manager.progress(job) == (1, 2)
+    assert job.status == RUNNING
+
+    executor.run_next()
+    assert job.status == DONE and job.wait(0)
+    assert manager.progress(job) == (2, 2)
+    assert manager.wait_for("key-1") is False
+    assert not os.path.exists(job.tmp_path)
+    with manager.cache.open("key-1") as f:
+        assert f.read(2) == b"PK"
+    assert manager.stats()["active"] == 0
+
+
+def test_cached_export_completes_immediately(manager, executor, data):
+    job, _ = manager.submit(1, "Project", "key-1", data)
+    executor.run_next()
+
+    again, created = manager.submit(1, "Project", "key-1", data)
+    assert created and again is not job
+    assert again.status == DONE
+    assert executor.pending == []
+
+
+def test_failed_job(manager, executor, data):
+    job, _ = manager.submit(1, "Project", "key-1", data)
+    executor.run_next(error=RuntimeError("worker died"))
+
+    assert job.status == FAILED and job.error == "worker died"
+    assert manager.progress(job) == (0, 2)
+    assert not manager.cache.contains("key-1")
+    assert not os.path.exists(job.tmp_path)
+    # A new request starts a new job
+    assert manager.submit(1, "Project", "key-1", data)[1] is True
+
+
+def test_submit_failure_leaves_no_job(manager, executor, data, monkeypatch):
+    def broken_pool(*args, **kwargs):
+        raise RuntimeError("pool is shut down")
+    monkeypatch.setattr(executor, "submit", broken_pool)
+
+    with pytest.raises(RuntimeError):
+        manager.submit(1, "Project", "key-1", data)
+
+    assert manager.stats()["active"] == manager.stats()["jobs"] == 0
+    assert os.listdir(manager.cache.directory) == []
+    # The next request does not join the failed submission
+    monkeypatch.undo()
+    job, created = manager.submit(1, "Project", "key-1", data)
+    assert created and executor.pending
+
+
+@pytest.fixture
+def api_manager(monkeypatch, manager):
+    monkeypatch.setattr(export_jobs_router, "export_jobs", manager)
+    monkeypatch.setattr(export_jobs_router, "workbook_export_cache", manager.cache)
+    return manager
+
+
+def _scoped_project(client, name, answers=None):
+    project = client.post("/api/projects", json={"name": name}).json()
+    client.post(f"/api/projects/{project['id']}/answers", json={"answers": answers or {"1": "all"}})
+    return project
+
+
+def test_export_job_api(client, api_manager, executor):
+    project = _scoped_project(client, "Project")
+
+    response = client.post(f"/api/projects/{project['id']}/export-jobs")
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == QUEUED
+    assert response.headers["location"] == job["download_url"]
+
+    # The same export joins the queued job
+    assert client.post(f"/api/projects/{project['id']}/export-jobs").json()["job_id"] == job["job_id"]
+
+    response = client.get(job["download_url"])
+    assert response.status_code == 202
+    assert (response.json()["sheets_done"], response.json()["sheets_total"]) == (0, 1)
+
+    executor.run_next()
+    response = client.get(job["download_url"])
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    )
+    assert response.content[:2] == b"PK"
+
+    assert client.get("/api/export-jobs/unknown").status_code == 404
+
+
+def test_export_job_api_queue_full_and_failure(client, api_manager, executor):
+    # Different applicability, so three different exports
+    projects = [
+        _scoped_project(client, "All", {"1": "all"}),
+        _scoped_project(client, "Subrecipients", {"1": "all", "3": "yes"}),
+        _scoped_project(client, "Single audit", {"1": "all", "2": "over_1m"}),
+    ]
+    jobs = [client.post(f"/api/projects/{p['id']}/export-jobs") for p in projects]
+
+    assert [response.status_code for response in jobs] == [202, 202, 503]
+    assert jobs[2].headers["retry-after"] == "5"
+
+    executor.run_next(error=RuntimeError("worker died"))
+    response = client.get(jobs[0].json()["download_url"])
+    assert response.status_code == 500
+    assert "worker died" in response.json()["detail"]
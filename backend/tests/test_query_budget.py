@@ -0,0 +1,97 @@
+"""
+SQL budgets (statements and rows fetched) of the API endpoints
+"""
+
+from app.services.catalog import CatalogSnapshot
+
+
+def test_get_sections_loads_catalog_once(client, query_budget):
+    # First request: versions, editions, then one statement per catalog table
+    with query_budget(statements=6, max_repeats=1):
+        response = client.get("/api/sections")
+    assert response.status_code == 200
+    assert [section["id"] for section in response.json()] == ["FM", "LEGAL"]
+
+    # Later requests are served from the catalog snapshot; the one statement
+    # reads the version counters (two groups, plus FY2025's rules and catalog)
+    with query_budget(statements=1, rows=4):
+        response = client.get("/api/sections")
+    assert response.status_code == 200
+
+
+def test_get_sub_area_from_snapshot(client, query_budget):
+    client.get("/api/sections")
+
+    with query_budget(statements=1, rows=4):
+        response = client.get("/api/sub-areas/L1")
+    assert response.status_code == 200
+    assert [indicator["indicator_id"] for indicator in response.json()["indicators"]] == ["a.", "b."]
+
+
+def _create_project(client, name, answers=None):
+    project = client.post("/api/projects", json={"name": name}).json()
+    if answers is not None:
+        client.post(f"/api/projects/{project['id']}/answers", json={"answers": answers})
+    return project
+
+
+def test_catalog_snapshot_fetches_each_row_once(db, query_budget):
+    # 4 indicators, 2 deficiencies, 3 sub-areas, 2 sections: no joined or lazy loads
+    with query_budget(statements=4, rows=11, max_repeats=1):
+        catalog = CatalogSnapshot.from_db(db, 1)
+    assert [indicator.indicator_id for indicator in catalog.sub_areas["L1"].indicators] == ["a.", "b."]
+    assert catalog.sections["LEGAL"].sub_area_ids == ("L1", "L2")
+
+
+def test_get_projects(client, query_budget):
+    for i in range(3):
+        _create_project(client, f"Project {i}", {"1": "all"})
+
+    with query_budget(statements=1, rows=3) as stats:
+        response = client.get("/api/projects")
+    assert len(response.json()) == 3
+    # The applicability bitset is not part of the response
+    assert "applicability_bits" not in next(iter(stats.statement_counts))
+
+
+def test_project_endpoints(client, query_budget):
+    project = _create_project(client, "Project", {"1": "all", "3": "yes"})
+    client.get("/api/sections")
+
+    with query_budget(statements=1, rows=1):
+        assert client.get(f"/api/projects/{project['id']}").status_code == 200
+
+    # Project row and versions; sub-areas come from the catalog snapshot
+    with query_budget(statements=2, rows=5):
+        response = client.get(f"/api/projects/{project['id']}/applicable-sub-areas")
+    assert [sa["sub_area_id"] for sa in response.json()["applicable_sub_areas"]] == ["L1", "L2"]
+
+    with query_budget(statements=2, rows=5):
+        response = client.get(f"/api/projects/{project['id']}/loe-summary")
+    assert response.json()["total_indicators"] == 3
+
+    # Answers are not loaded to be deleted one by one (ON DELETE CASCADE)
+    with query_budget(statements=2, rows=2):
+        assert client.delete(f"/api/projects/{project['id']}").status_code == 204
+
+
+def test_answer_write_stats(client):
+    project = _create_project(client, "Project")
+
+    response = client.post(f"/api/projects/{project['id']}/answers", json={"answers": {"1": "all", "3": "yes"}})
+    # applicability_added/removed count sub-areas switched on/off in the bitset, not rows
+    assert response.json()["write_stats"] == {
+        "answers_upserted": 2, "answers_deleted": 0, "applicability_added": 2, "applicability_removed": 0
+    }
+
+    # Unchanged answers write nothing
+    response = client.patch(f"/api/projects/{project['id']}/answers", json={"answers": {"1": "all"}})
+    assert response.json()["write_stats"] == {
+        "answers_upserted": 0, "answers_deleted": 0, "applicability_added": 0, "applicability_removed": 0
+    }
+
+    response = client.patch(f"/api/projects/{project['id']}/answers", json={"answers": {"3": None, "2": "over_1m"}})
+    assert response.json()["write_stats"] == {
+        "answers_upserted": 1, "answers_deleted": 1, "applicability_added": 1, "applicability_removed": 1
+    }
+    assert (response.json()["added_sub_areas"], response.json()["removed_sub_areas"]) == (["F1"], ["L2"])
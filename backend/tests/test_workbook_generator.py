@@ -0,0 +1,71 @@
+"""
+Workbook generator: the named-style path against the frozen per-cell
+generator, and pre-rendered fragments against the streaming writer
+"""
+
+import dataclasses
+
+import openpyxl
+
+from app.services.catalog import CatalogSnapshot
+from app.services.workbook_generator import (
+    build_workbook_data,
+    create_workbook_bytes,
+    get_workbook_fragments,
+    iter_prerendered_workbook_chunks,
+    iter_workbook_chunks
+)
+from benchmarks import legacy_workbook_generator
+
+
+def _contents(output):
+    wb = openpyxl.load_workbook(output)
+    return {
+        ws.title: (
+            [[cell.value for cell in row] for row in ws.iter_rows()],
+            sorted(str(merged) for merged in ws.merged_cells.ranges)
+        )
+        for ws in wb.worksheets
+    }
+
+
+def test_named_styles_match_per_cell_layout(sample_catalog):
+    data = build_workbook_data(sample_catalog, list(sample_catalog.sub_areas.values()))
+
+    named = _contents(create_workbook_bytes(data))
+    per_cell = _contents(legacy_workbook_generator.create_workbook_bytes(data))
+
+    assert named == per_cell
+    assert list(named) == ["1. Legal", "2. Financial Management and Cap"]
+
+
+def _snapshot(catalog, version, **questions):
+    """Copy of the sample catalog under its own edition id, with some questions changed"""
+    sub_areas = [
+        dataclasses.replace(sa, question=questions.get(sa.id, sa.question)) for sa in catalog.sub_areas.values()
+    ]
+    return CatalogSnapshot(catalog.sections.values(), sub_areas, version=version, edition_id=99)
+
+
+def test_prerendered_chunks_match_streamed(sample_catalog):
+    catalog = _snapshot(sample_catalog, 1)
+    for sub_area_ids in (["L1", "L2", "F1"], ["L2", "F1"], ["L1"]):
+        sub_areas = [catalog.sub_areas[sa_id] for sa_id in sub_area_ids]
+        data = build_workbook_data(catalog, sub_areas)
+
+        assert b''.join(iter_prerendered_workbook_chunks(catalog, sub_areas)) == b''.join(iter_workbook_chunks(data))
+
+
+def test_fragments_rebuilt_on_catalog_version_change(sample_catalog):
+    v1 = _snapshot(sample_catalog, 1)
+    fragments = get_workbook_fragments(v1)
+    assert get_workbook_fragments(_snapshot(sample_catalog, 1)) is fragments
+
+    v2 = _snapshot(sample_catalog, 2, L1="Is the recipient still eligible?")
+    rebuilt = get_workbook_fragments(v2)
+    assert rebuilt is not fragments and rebuilt.version == 2
+    assert "L1. Is the recipient still eligible?" in rebuilt.blocks["L1"].place(2).xml
+
+    sub_areas = list(v2.sub_areas.values())
+    streamed = b''.join(iter_workbook_chunks(build_workbook_data(v2, sub_areas)))
+    assert b''.join(iter_prerendered_workbook_chunks(v2, sub_areas)) == streamed
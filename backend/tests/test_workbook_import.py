@@ -0,0 +1,151 @@
+"""
+Workbook import: reading findings back out of generated workbooks, row
+validation, and POST /api/projects/{id}/workbook-import
+"""
+
+import io
+
+import openpyxl
+import pytest
+
+from app.models import ProjectFinding, WorkbookImport
+from app.services.workbook_generator import build_workbook_data, create_workbook_bytes
+from app.services.workbook_import import ImportResult, WorkbookFormatError, WorkbookReader
+
+LEGAL = "1. Legal"
+FM = "2. Financial Management and Cap"
+
+# Sheet rows of the generated layout: L1 (a., b.) on rows 2-3 and L2 (a.)
+# on row 4 of the Legal sheet; F1 (a.) on row 2 of the FM sheet
+L1_QUESTION_ROW, L1_B_ROW, L2_ROW, F1_ROW = 2, 3, 4, 2
+
+
+def _workbook(catalog, fill):
+    """Generated workbook for the whole catalog, edited by `fill(wb)` as a reviewer would"""
+    data = build_workbook_data(catalog, list(catalog.sub_areas.values()))
+    wb = openpyxl.load_workbook(create_workbook_bytes(data))
+    fill(wb)
+    output = io.BytesIO()
+    wb.save(output)
+    output.seek(0)
+    return output
+
+
+def _unmerge_l1(ws):
+    for merged in [str(r) for r in ws.merged_cells.ranges if r.min_row == L1_QUESTION_ROW and r.min_col > 2]:
+        ws.unmerge_cells(merged)
+
+
+def _read(catalog, file):
+    result = ImportResult()
+    findings = list(WorkbookReader(catalog, result).findings(file))
+    return findings, result
+
+
+def _keys(findings):
+    return sorted((f['sub_area_id'], f['indicator_id'] or '', f['compliance'] or '') for f in findings)
+
+
+def test_merged_input_records_sub_area_finding(sample_catalog):
+    def fill(wb):
+        wb[LEGAL].cell(L1_QUESTION_ROW, 4).value = "X"
+        wb[LEGAL].cell(L1_QUESTION_ROW, 6).value = "Policy on file"
+        wb[LEGAL].cell(L2_ROW, 3).value = "X"
+
+    findings, result = _read(sample_catalog, _workbook(sample_catalog, fill))
+
+    assert result.error_count == 0
+    assert (result.sheets, result.rows_read) == (2, 4)
+    # L1's merged cells cover both indicators; L2's single row is its indicator's
+    assert _keys(findings) == [("L1", "", "non_compliant"), ("L2", "a.", "compliant")]
+    l1 = next(f for f in findings if f['sub_area_id'] == "L1")
+    assert l1['audit_evidence'] == "Policy on file"
+    assert l1['finding_code'].startswith("L1-1 ")
+
+
+def test_unmerged_input_records_indicator_findings(sample_catalog):
+    def fill(wb):
+        ws = wb[LEGAL]
+        _unmerge_l1(ws)
+        ws.cell(L1_QUESTION_ROW, 3).value = "X"
+        ws.cell(L1_B_ROW, 5).value = "X"
+        ws.cell(L1_B_ROW, 9).value = "Not applicable to this recipient"
+
+    findings, result = _read(sample_catalog, _workbook(sample_catalog, fill))
+
+    assert result.error_count == 0
+    # The question row's input belongs to indicator a. on that row
+    assert _keys(findings) == [("L1", "a.", "compliant"), ("L1", "b.", "na")]
+    assert [f['sheet_row'] for f in findings] == [L1_QUESTION_ROW, L1_B_ROW]
+
+
+def test_row_errors(sample_catalog):
+    def fill(wb):
+        ws = wb[LEGAL]
+        _unmerge_l1(ws)
+        ws.cell(L1_QUESTION_ROW, 3).value = "X"
+        ws.cell(L1_QUESTION_ROW, 4).value = "X"
+        ws.cell(L1_B_ROW, 2).value = "z. Not an indicator of L1"
+        ws.cell(L2_ROW, 1).value = "L9. Unknown sub-area"
+        wb[FM].cell(1, 6).value = "Evidence"
+
+    findings, result = _read(sample_catalog, _workbook(sample_catalog, fill))
+
+    errors = [(e.sheet, e.row, e.message.split(":")[0]) for e in result.errors]
+    assert errors == [
+        (LEGAL, L1_QUESTION_ROW, "More than one of Compliant, Non-Compliant and N/A is marked"),
+        (LEGAL, L1_B_ROW, "Indicator does not start with an indicator id of sub-area L1"),
+        (LEGAL, L2_ROW, "Question does not start with a known sub-area id"),
+        (FM, 1, "Header row does not match the scoping workbook layout"),
+    ]
+    assert result.error_count == 4
+
+
+def test_unreadable_upload(sample_catalog):
+    with pytest.raises(WorkbookFormatError):
+        _read(sample_catalog, io.BytesIO(b"not a workbook"))
+
+
+def _upload(client, project_id, file):
+    return client.post(
+        f"/api/projects/{project_id}/workbook-import",
+        files={"file": ("review.xlsx", file, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")}
+    )
+
+
+def test_import_api(client, db, sample_catalog):
+    project = client.post("/api/projects", json={"name": "Project"}).json()
+
+    def fill(wb):
+        wb[LEGAL].cell(L1_QUESTION_ROW, 4).value = "X"
+        wb[FM].cell(F1_ROW, 9).value = "Single audit was late"
+
+    response = _upload(client, project["id"], _workbook(sample_catalog, fill))
+    assert response.status_code == 201
+    body = response.json()
+    assert (body["sheets"], body["findings_imported"], body["error_count"]) == (2, 2, 0)
+
+    stored = db.query(ProjectFinding).filter(ProjectFinding.import_id == body["import_id"]).all()
+    assert _keys([vars(f) for f in stored]) == [("F1", "a.", ""), ("L1", "", "non_compliant")]
+    assert {f.edition_id for f in stored} == {1}
+
+
+def test_import_api_rejects_invalid_rows(client, db, sample_catalog):
+    project = client.post("/api/projects", json={"name": "Project"}).json()
+
+    def fill(wb):
+        wb[LEGAL].cell(L2_ROW, 3).value = "X"
+        wb[FM].cell(F1_ROW, 3).value = "X"
+        wb[FM].cell(F1_ROW, 5).value = "X"
+
+    response = _upload(client, project["id"], _workbook(sample_catalog, fill))
+    assert response.status_code == 422
+    body = response.json()
+    assert body["import_id"] is None and body["findings_imported"] == 0
+    assert [(e["sheet"], e["row"]) for e in body["errors"]] == [(FM, F1_ROW)]
+    # Nothing is stored, not even the valid L2 row
+    assert db.query(WorkbookImport).count() == 0
+    assert db.query(ProjectFinding).count() == 0
+
+    assert _upload(client, project["id"], io.BytesIO(b"not a workbook")).status_code == 400
+    assert _upload(client, 999, _workbook(sample_catalog, lambda wb: None)).status_code == 404
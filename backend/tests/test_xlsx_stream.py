@@ -0,0 +1,76 @@
+"""
+Streaming XLSX writer: workbooks streamed by iter_workbook_chunks read back
+with openpyxl the same as the openpyxl-built create_workbook_bytes output
+"""
+
+import copy
+import io
+
+import openpyxl
+
+from app.services.workbook_generator import build_workbook_data, create_workbook_bytes, iter_workbook_chunks
+from app.services.xlsx_stream import unique_sheet_titles
+
+
+def _contents(output):
+    wb = openpyxl.load_workbook(output)
+    return [
+        (
+            ws.title,
+            ws.freeze_panes,
+            [[cell.value for cell in row] for row in ws.iter_rows()],
+            sorted(str(merged) for merged in ws.merged_cells.ranges)
+        )
+        for ws in wb.worksheets
+    ]
+
+
+def _catalog_data(catalog):
+    """Sample catalog workbook data, plus sections whose titles collide once truncated"""
+    data = build_workbook_data(catalog, list(catalog.sub_areas.values()))
+    legal, fm = data['sections']
+
+    # A sub-area without indicators takes the single-row layout
+    no_indicators = copy.deepcopy(legal['sub_areas'][1])
+    no_indicators.update(id="L9", indicators_of_compliance=[])
+
+    data['sections'] += [
+        {'section': dict(legal['section']), 'sub_areas': [no_indicators]},
+        {'section': dict(fm['section']), 'sub_areas': fm['sub_areas']},
+        {'section': dict(fm['section'], title="Financial Management and Capacity Planning"),
+         'sub_areas': fm['sub_areas']},
+        {'section': {'title': "Legal: Subrecipients [draft]?", 'chapter_number': None},
+         'sub_areas': legal['sub_areas']},
+    ]
+    return data
+
+
+def test_streamed_workbook_matches_openpyxl(sample_catalog):
+    data = _catalog_data(sample_catalog)
+
+    built = _contents(create_workbook_bytes(data))
+    streamed = _contents(io.BytesIO(b''.join(iter_workbook_chunks(data))))
+
+    assert streamed == built
+    assert [title for title, *_ in streamed] == [
+        "1. Legal",
+        "2. Financial Management and Cap",
+        "1. Legal1",
+        "2. Financial Management and Ca1",
+        "2. Financial Management and Ca2",
+        "Legal Subrecipients draft",
+    ]
+    assert {freeze for _, freeze, *_ in streamed} == {"A2"}
+
+    legal_rows, legal_merges = streamed[0][2], streamed[0][3]
+    assert legal_rows[1][0] == "L1. Is the recipient eligible?"
+    assert {"A2:A3", "J2:J3", "A4", "J4"} <= set(legal_merges)
+    # An indicator-less sub-area is a single unmerged row
+    assert streamed[2][3] == []
+
+
+def test_unique_sheet_titles():
+    titles = ["Legal", "legal", "a" * 40, "a" * 35, "[Draft]: Review?", ""]
+    assert list(unique_sheet_titles(titles)) == [
+        "Legal", "legal1", "a" * 31, "a" * 30 + "1", "Draft Review", "Sheet"
+    ]
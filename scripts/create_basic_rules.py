@@ -19,7 +19,7 @@ recipient_type_q = cursor.fetchone()[0]
 # Get all sub-areas that have "All recipients" applicability
 cursor.execute("""
     SELECT id FROM sub_areas
-    WHERE applicability ILIKE '%all recipients%'
+    WHERE edition_id = current_guide_edition() AND applicability ILIKE '%all recipients%'
 """)
 all_recipient_sub_areas = cursor.fetchall()
 
@@ -33,7 +33,7 @@ for (sub_area_id,) in all_recipient_sub_areas:
         cursor.execute("""
             INSERT INTO applicability_rules (sub_area_id, question_id, required_answer, rule_type)
             VALUES (%s, %s, %s, 'include')
-            ON CONFLICT (sub_area_id, question_id) DO NOTHING
+            ON CONFLICT (edition_id, sub_area_id, question_id) DO NOTHING
         """, (sub_area_id, recipient_type_q, answer))
         rules_created += 1
 
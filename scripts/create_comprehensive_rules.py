@@ -18,7 +18,7 @@ def create_rule(cursor, sub_area_id, question_number, required_answer):
         SELECT %s, id, %s, 'include'
         FROM questionnaire_questions
         WHERE question_number = %s
-        ON CONFLICT (sub_area_id, question_id) DO NOTHING
+        ON CONFLICT (edition_id, sub_area_id, question_id) DO NOTHING
     """, (sub_area_id, required_answer, question_number))
 
 def map_applicability_to_rules(applicability_text, sub_area_id, cursor):
@@ -261,13 +261,14 @@ def main():
     print("=" * 80)
 
     # First, clear existing rules to start fresh
-    cursor.execute("DELETE FROM applicability_rules")
+    cursor.execute("DELETE FROM applicability_rules WHERE edition_id = current_guide_edition()")
     print("✓ Cleared existing rules")
 
     # Get all sub-areas with their applicability
     cursor.execute("""
         SELECT id, applicability
         FROM sub_areas
+        WHERE edition_id = current_guide_edition()
         ORDER BY id
     """)
 
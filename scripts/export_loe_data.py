@@ -92,7 +92,9 @@ def update_loe_data():
     for sub_area_id, hours, confidence, score, reasoning in loe_updates:
         try:
             # Check if sub-area exists
-            cursor.execute("SELECT id FROM sub_areas WHERE id = %s", (sub_area_id,))
+            cursor.execute(
+                "SELECT id FROM sub_areas WHERE edition_id = current_guide_edition() AND id = %s", (sub_area_id,)
+            )
             if cursor.fetchone():
                 cursor.execute("""
                     UPDATE sub_areas
@@ -101,7 +103,7 @@ def update_loe_data():
                         loe_confidence_score = %s,
                         loe_reasoning = %s,
                         updated_at = CURRENT_TIMESTAMP
-                    WHERE id = %s
+                    WHERE edition_id = current_guide_edition() AND id = %s
                 """, (hours, confidence, score, reasoning, sub_area_id))
                 updated_count += 1
                 print(f"✓ Updated {sub_area_id}: {hours}h ({confidence})")
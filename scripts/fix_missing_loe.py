@@ -6,6 +6,8 @@ import psycopg2
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+from fta_extraction import iter_extraction
+
 load_dotenv()
 
 client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
@@ -68,38 +70,31 @@ Respond in JSON format only:
         print(f"Failed to parse JSON. Response was: {response_text}")
         raise
 
-# Load FTA data
-fta_file = os.path.join(os.path.dirname(__file__), '..', 'docs', 'FTA_Complete_Extraction.json')
-with open(fta_file, 'r') as f:
-    fta_data = json.load(f)
-
-# Find DBE section and DBE1 sub-area
+# Find DBE section and DBE1 sub-area; the extraction is only read up to it
 conn = get_db_connection()
 cursor = conn.cursor()
 
-for section in fta_data['sections']:
-    if section['section']['id'] == 'DBE':
-        for sub_area in section.get('sub_areas', []):
-            if sub_area['id'] == 'DBE1':
-                print(f"Analyzing {sub_area['id']}...")
-                loe_data = analyze_sub_area_loe(sub_area)
-                print(f"Result: {loe_data['hours']} hrs ({loe_data['confidence_level']} confidence)")
-
-                # Update database
-                cursor.execute("""
-                    UPDATE sub_areas
-                    SET loe_hours = %s, loe_confidence = %s, loe_confidence_score = %s, loe_reasoning = %s
-                    WHERE id = %s
-                """, (
-                    loe_data['hours'],
-                    loe_data['confidence_level'],
-                    loe_data['confidence_score'],
-                    loe_data['reasoning'],
-                    'DBE1'
-                ))
-                conn.commit()
-                print("✓ Database updated")
-                break
+for section, sub_area in iter_extraction():
+    if section['id'] == 'DBE' and sub_area and sub_area['id'] == 'DBE1':
+        print(f"Analyzing {sub_area['id']}...")
+        loe_data = analyze_sub_area_loe(sub_area)
+        print(f"Result: {loe_data['hours']} hrs ({loe_data['confidence_level']} confidence)")
+
+        # Update database
+        cursor.execute("""
+            UPDATE sub_areas
+            SET loe_hours = %s, loe_confidence = %s, loe_confidence_score = %s, loe_reasoning = %s
+            WHERE edition_id = current_guide_edition() AND id = %s
+        """, (
+            loe_data['hours'],
+            loe_data['confidence_level'],
+            loe_data['confidence_score'],
+            loe_data['reasoning'],
+            'DBE1'
+        ))
+        conn.commit()
+        print("✓ Database updated")
+        break
 
 cursor.close()
 conn.close()
@@ -0,0 +1,265 @@
+"""
+Shared reader for docs/FTA_Complete_Extraction.json
+
+Streams the extraction rather than loading it whole. Sub-areas are parsed one
+at a time and yielded with their section in document order, so memory stays
+bounded by the largest sub-area however large the file (combined editions or
+programs). As they are read, sub-areas get the unique ids the database uses:
+an id that appears more than once gets a sequential suffix ("F7", "F7_2", ...).
+
+Also derives the guide edition code from the extraction metadata, and
+normalizes each section, sub-area, indicator list, deficiency list and
+governing directive list to the column values the loaders write, and hashes
+those values so a loader can tell which of them changed since the last load.
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+EXTRACTION_PATH = os.path.join(os.path.dirname(__file__), '..', 'docs', 'FTA_Complete_Extraction.json')
+
+SECTION_COLUMNS = ('id', 'title', 'page_range', 'purpose')
+SUB_AREA_COLUMNS = (
+    'id', 'section_id', 'question', 'basic_requirement',
+    'applicability', 'detailed_explanation', 'instructions_for_reviewer'
+)
+INDICATOR_COLUMNS = ('sub_area_id', 'indicator_id', 'text')
+DEFICIENCY_COLUMNS = ('sub_area_id', 'code', 'title', 'determination', 'suggested_corrective_action')
+DIRECTIVE_COLUMNS = ('sub_area_id', 'reference', 'text')
+
+# Characters read from the extraction file at a time
+CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+
+
+class _JSONStream:
+    """
+    Pull parser over a JSON text file: steps through objects and arrays one
+    member at a time and decodes the values the caller asks for with
+    raw_decode(), reading the file in chunks as needed.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int = CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Append at least size more characters (fewer at end of file) to the unread part; False at end of file"""
+        if self.eof:
+            return False
+        data = self.f.read(max(size, self.chunk_size))
+        if not data:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    def peek(self) -> str:
+        """Next non-whitespace character, without consuming it; '' at end of file"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self._fill(self.chunk_size):
+                return self.buffer[self.pos:self.pos + 1]
+
+    def expect(self, char: str) -> None:
+        if self.peek() != char:
+            raise self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete value"""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Most likely cut off at the end of the buffer. Doubling what is
+                # buffered keeps a value spanning many chunks from being
+                # re-decoded once per chunk.
+                if not self._fill(len(self.buffer) - self.pos):
+                    raise
+                continue
+            # A number or literal that ends with the buffer may continue in the next chunk
+            if end == len(self.buffer) and self.buffer[end - 1] not in '}]"' and self._fill(self.chunk_size):
+                continue
+            self.pos = end
+            return value
+
+    def members(self) -> Iterator[str]:
+        """Keys of the object that starts here; the caller consumes each member's value before the next"""
+        self.expect('{')
+        if self.peek() == '}':
+            self.pos += 1
+            return
+        while True:
+            if self.peek() != '"':
+                raise self.error("Expecting property name enclosed in double quotes")
+            key = self.value()
+            self.expect(':')
+            yield key
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect('}')
+                return
+
+    def items(self) -> Iterator[int]:
+        """Indexes of the array that starts here; the caller consumes each element before the next"""
+        self.expect('[')
+        if self.peek() == ']':
+            self.pos += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            if self.peek() == ',':
+                self.pos += 1
+            else:
+                self.expect(']')
+                return
+
+
+def _iter_section(
+    stream: _JSONStream,
+    id_counter: Dict[str, int]
+) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """Pairs for the section object that starts here, giving each sub-area its unique id as it is parsed"""
+    section: Optional[Dict[str, Any]] = None
+    pending: List[Dict[str, Any]] = []
+    yielded = False
+
+    for key in stream.members():
+        if key == 'section':
+            section = stream.value()
+            # Sub-areas listed before the section header waited for it
+            for sub_area in pending:
+                yielded = True
+                yield section, sub_area
+            pending = []
+        elif key == 'sub_areas' and stream.peek() == '[':
+            for _ in stream.items():
+                sub_area = stream.value()
+                if not sub_area:
+                    continue
+                original_id = sub_area['id']
+                id_counter[original_id] += 1
+                sub_area['original_id'] = original_id
+                if id_counter[original_id] > 1:
+                    sub_area['id'] = f"{original_id}_{id_counter[original_id]}"
+                if section is None:
+                    pending.append(sub_area)
+                else:
+                    yielded = True
+                    yield section, sub_area
+        else:
+            # Issues, references, weblinks, notes: not loaded
+            stream.value()
+
+    if section is None:
+        raise stream.error("Expecting a 'section' member in each section")
+    if not yielded:
+        yield section, None
+
+
+def iter_extraction(
+    path: str = EXTRACTION_PATH,
+    metadata: Optional[Dict[str, Any]] = None
+) -> Iterator[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """
+    Yield (section, sub_area) in document order, parsing one sub-area at a
+    time. Each sub-area has its unique id in 'id' and the id from the
+    extraction in 'original_id'; the sub-areas of a section share one section
+    dict. A section without sub-areas is yielded once as (section, None).
+
+    Top-level members other than 'sections' ('metadata') are stored in the
+    metadata dict, if one is given, as they are parsed: before the first pair
+    when they precede 'sections' in the file, as in the extractor's output.
+    """
+    id_counter: Dict[str, int] = defaultdict(int)
+    with open(path, 'r', encoding='utf-8') as f:
+        stream = _JSONStream(f)
+        for key in stream.members():
+            if key == 'sections':
+                for _ in stream.items():
+                    yield from _iter_section(stream, id_counter)
+            else:
+                value = stream.value()
+                if metadata is not None:
+                    metadata[key] = value
+        if stream.peek():
+            raise stream.error("Extra data")
+
+
+def edition_code(metadata: Dict[str, Any]) -> Optional[str]:
+    """Edition code from the source document name, e.g. "Fiscal Year 2025 ..." -> "FY2025" """
+    match = re.search(r'Fiscal Year (\d{4})', metadata.get('source_document') or '', re.IGNORECASE)
+    return f"FY{match.group(1)}" if match else None
+
+
+def section_row(section: Dict[str, Any]) -> Tuple:
+    return (section['id'], section['title'], section.get('page_range'), section.get('purpose'))
+
+
+def sub_area_row(section_id: str, sub_area: Dict[str, Any]) -> Tuple:
+    return (
+        sub_area['id'],
+        section_id,
+        sub_area.get('question'),
+        sub_area.get('basic_requirement'),
+        sub_area.get('applicability'),
+        sub_area.get('detailed_explanation'),
+        sub_area.get('instructions_for_reviewer')
+    )
+
+
+def indicator_rows(sub_area: Dict[str, Any]) -> List[Tuple]:
+    """Indicators of compliance, skipping empty entries and entries without an id or text"""
+    return [
+        (sub_area['id'], indicator['indicator_id'], indicator['text'])
+        for indicator in sub_area.get('indicators_of_compliance') or []
+        if indicator and indicator.get('indicator_id') and indicator.get('text')
+    ]
+
+
+def deficiency_rows(sub_area: Dict[str, Any]) -> List[Tuple]:
+    """Deficiencies, skipping empty entries"""
+    return [
+        (
+            sub_area['id'],
+            deficiency.get('code') or '',
+            deficiency.get('title') or '',
+            deficiency.get('determination'),
+            deficiency.get('suggested_corrective_action')
+        )
+        for deficiency in sub_area.get('deficiencies') or []
+        if deficiency
+    ]
+
+
+def directive_rows(sub_area: Dict[str, Any]) -> List[Tuple]:
+    """Governing directives, skipping entries with neither a reference nor text"""
+    return [
+        (sub_area['id'], directive.get('reference'), directive.get('text'))
+        for directive in sub_area.get('governing_directives') or []
+        if directive and (directive.get('reference') or directive.get('text'))
+    ]
+
+
+def content_hash(value: Any) -> str:
+    """SHA-256 of a canonical JSON encoding of the given rows"""
+    encoded = json.dumps(value, ensure_ascii=False, separators=(',', ':'), sort_keys=True)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
@@ -117,7 +117,7 @@ def generate_all_loe():
         SELECT id, question, basic_requirement, applicability,
                detailed_explanation, instructions_for_reviewer
         FROM sub_areas
-        WHERE loe_hours IS NULL OR loe_hours = 0
+        WHERE edition_id = current_guide_edition() AND (loe_hours IS NULL OR loe_hours = 0)
         ORDER BY id
     """)
 
@@ -155,7 +155,7 @@ def generate_all_loe():
                         loe_confidence_score = %s,
                         loe_reasoning = %s,
                         updated_at = CURRENT_TIMESTAMP
-                    WHERE id = %s
+                    WHERE edition_id = current_guide_edition() AND id = %s
                 """, (
                     loe_data['hours'],
                     loe_data['confidence_level'],
@@ -0,0 +1,483 @@
+"""
+Structural diff between two FTA Comprehensive Review Guide editions
+
+Compares two catalogs, each read from an extraction JSON file or from an
+edition already loaded in the database, and writes a machine-readable
+changeset that load_fta_data.py --changeset applies.
+
+Sub-areas are matched in three passes:
+  1. by id: equal content hashes mean unchanged, otherwise modified
+  2. by content: an unmatched sub-area whose content (ignoring its id and
+     section) is identical to an unmatched one on the other side was renumbered
+  3. by text similarity (difflib, over the words of the question and basic
+     requirement) for sub-areas renumbered and edited at once; each new
+     sub-area is compared with the few old ones sharing the most words, and
+     pairs scoring at least --threshold are matched best-first
+Whatever is left over was added or removed. Sections are matched by id.
+
+For every changed sub-area the changeset lists the changed fields (including
+the applicability text), which indicators, deficiencies and governing
+directives were added, removed or changed, and the full new content of each
+changed part with its old and new content hash - the hashes load_fta_data.py
+keeps in catalog_content_hashes - so it can be applied without the extraction.
+
+Usage:
+    python guide_diff.py OLD NEW                      # print a summary
+    python guide_diff.py FY2025 fy2026.json -o fy2026-changeset.json
+    python guide_diff.py FY2025 FY2026 --threshold 0.7 -o changeset.json
+
+OLD and NEW are extraction JSON files or guide edition codes in the database.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from datetime import datetime, timezone
+from difflib import SequenceMatcher
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from fta_extraction import (
+    SECTION_COLUMNS,
+    SUB_AREA_COLUMNS,
+    content_hash,
+    edition_code
+)
+from load_fta_data import (
+    CHANGESET_FORMAT,
+    CHANGESET_VERSION,
+    DEFICIENCIES,
+    DIRECTIVES,
+    ENTITIES,
+    INDICATORS,
+    LIST_TABLES,
+    ROW_TABLES,
+    SECTION,
+    SUB_AREA,
+    get_db_connection,
+    get_edition_id,
+    read_extraction
+)
+
+DEFAULT_THRESHOLD = 0.6
+# Similarity is only computed for the pairs with the highest word overlap
+SIMILARITY_CANDIDATES = 3
+
+WORD_RE = re.compile(r'\w+')
+
+# Parts of a sub-area, each with its own content hash
+SUB_AREA_PARTS = (SUB_AREA, *LIST_TABLES)
+
+# Field that identifies an item within a sub-area's list, for item-level changes
+LIST_ITEM_KEYS = {
+    INDICATORS: 'indicator_id',
+    DEFICIENCIES: 'code',
+    DIRECTIVES: 'reference',
+}
+
+Catalog = Dict[str, Dict[str, Tuple[str, Any]]]
+
+
+# ---------------------------------------------------------------------------
+# Sources: extraction files and database editions, both in the loader's shape
+# ({entity: {key: (hash, rows)}}, see load_fta_data.read_extraction)
+# ---------------------------------------------------------------------------
+
+def read_edition(cursor, edition_id: int) -> Catalog:
+    """An edition's catalog as stored, in document order"""
+    catalog: Catalog = {entity: {} for entity in ENTITIES}
+
+    cursor.execute(f"""
+        SELECT {', '.join(SECTION_COLUMNS)} FROM sections
+        WHERE edition_id = %s ORDER BY chapter_number NULLS LAST, id
+    """, (edition_id,))
+    for row in cursor.fetchall():
+        catalog[SECTION][row[0]] = (content_hash(row), tuple(row))
+
+    cursor.execute(f"""
+        SELECT {', '.join(SUB_AREA_COLUMNS)} FROM sub_areas
+        WHERE edition_id = %s ORDER BY ordinal, id
+    """, (edition_id,))
+    for row in cursor.fetchall():
+        catalog[SUB_AREA][row[0]] = (content_hash(row), tuple(row))
+
+    for entity, (table, columns) in LIST_TABLES.items():
+        rows_by_sub_area: Dict[str, List[Tuple]] = {key: [] for key in catalog[SUB_AREA]}
+        cursor.execute(f"SELECT {', '.join(columns)} FROM {table} WHERE edition_id = %s ORDER BY id", (edition_id,))
+        for row in cursor.fetchall():
+            rows_by_sub_area.setdefault(row[0], []).append(tuple(row))
+        catalog[entity] = {key: (content_hash(rows), rows) for key, rows in rows_by_sub_area.items()}
+
+    return catalog
+
+
+def load_source(spec: str) -> Tuple[Dict[str, Any], Catalog]:
+    """Catalog of an extraction file, or of a database edition given by code"""
+    if os.path.exists(spec) or spec.lower().endswith('.json'):
+        metadata, catalog = read_extraction(spec)
+        return {
+            'source': os.path.basename(spec),
+            'edition': edition_code(metadata),
+            'source_document': metadata.get('source_document'),
+            'extraction_date': metadata.get('extraction_date'),
+        }, catalog
+
+    code = spec.strip().upper()
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cursor:
+            edition_id = get_edition_id(cursor, code)
+            if edition_id is None:
+                raise SystemExit(f"Not an extraction file or a loaded guide edition: {spec}")
+            cursor.execute(
+                "SELECT source_document, extraction_date FROM guide_editions WHERE id = %s", (edition_id,)
+            )
+            source_document, extraction_date = cursor.fetchone()
+            catalog = read_edition(cursor, edition_id)
+    finally:
+        conn.close()
+    return {
+        'source': 'database',
+        'edition': code,
+        'source_document': source_document,
+        'extraction_date': extraction_date.isoformat() if extraction_date else None,
+    }, catalog
+
+
+# ---------------------------------------------------------------------------
+# Matching
+# ---------------------------------------------------------------------------
+
+def fingerprint(catalog: Catalog, key: str) -> str:
+    """Hash of a sub-area's content without its id and section, to recognize renumbered sub-areas"""
+    return content_hash([
+        catalog[SUB_AREA][key][1][2:],
+        *([row[1:] for row in catalog[entity][key][1]] for entity in LIST_TABLES)
+    ])
+
+
+def similarity_words(catalog: Catalog, key: str) -> List[str]:
+    """Lower-cased words of a sub-area's question and basic requirement"""
+    row = dict(zip(SUB_AREA_COLUMNS, catalog[SUB_AREA][key][1]))
+    return WORD_RE.findall(f"{row['question'] or ''} {row['basic_requirement'] or ''}".lower())
+
+
+def _unchanged(old: Catalog, new: Catalog, old_key: str, new_key: str) -> bool:
+    return all(old[entity][old_key][0] == new[entity][new_key][0] for entity in SUB_AREA_PARTS)
+
+
+def match_sub_areas(
+    old: Catalog,
+    new: Catalog,
+    threshold: float = DEFAULT_THRESHOLD
+) -> Tuple[List[Tuple[str, str, str, Optional[float]]], List[str], List[str]]:
+    """
+    Pair old and new sub-areas as (old_id, new_id, match, similarity), with
+    match 'id', 'content' or 'similarity'. Returns (pairs, added, removed),
+    new and old ids in document order.
+    """
+    pairs: List[Tuple[str, str, str, Optional[float]]] = [
+        (key, key, 'id', None) for key in new[SUB_AREA] if key in old[SUB_AREA]
+    ]
+    unmatched_old = [key for key in old[SUB_AREA] if key not in new[SUB_AREA]]
+    unmatched_new = [key for key in new[SUB_AREA] if key not in old[SUB_AREA]]
+
+    # Identical content under a new id
+    by_fingerprint: Dict[str, List[str]] = {}
+    for key in unmatched_old:
+        by_fingerprint.setdefault(fingerprint(old, key), []).append(key)
+    remaining_new = []
+    for key in unmatched_new:
+        candidates = by_fingerprint.get(fingerprint(new, key))
+        if candidates:
+            pairs.append((candidates.pop(0), key, 'content', 1.0))
+        else:
+            remaining_new.append(key)
+    matched_old = {old_key for old_key, _, match, _ in pairs if match == 'content'}
+    remaining_old = [key for key in unmatched_old if key not in matched_old]
+
+    # Renumbered and edited: best text similarity first. Word-set overlap
+    # picks a few candidates per sub-area, and only those get the (much
+    # slower) word-sequence comparison.
+    scored = []
+    old_words = {key: similarity_words(old, key) for key in remaining_old}
+    old_sets = {key: set(words) for key, words in old_words.items()}
+    for new_key in remaining_new:
+        words = similarity_words(new, new_key)
+        word_set = set(words)
+        overlaps = sorted(
+            ((len(word_set & old_set) / (len(word_set | old_set) or 1), old_key)
+             for old_key, old_set in old_sets.items()),
+            reverse=True
+        )[:SIMILARITY_CANDIDATES]
+        matcher = SequenceMatcher(None)
+        matcher.set_seq2(words)
+        for _, old_key in overlaps:
+            matcher.set_seq1(old_words[old_key])
+            if matcher.real_quick_ratio() < threshold or matcher.quick_ratio() < threshold:
+                continue
+            score = matcher.ratio()
+            if score >= threshold:
+                scored.append((score, old_key, new_key))
+
+    taken_old, taken_new = set(), set()
+    for score, old_key, new_key in sorted(scored, key=lambda s: -s[0]):
+        if old_key in taken_old or new_key in taken_new:
+            continue
+        taken_old.add(old_key)
+        taken_new.add(new_key)
+        pairs.append((old_key, new_key, 'similarity', round(score, 4)))
+
+    order = {key: position for position, key in enumerate(new[SUB_AREA])}
+    pairs.sort(key=lambda pair: order[pair[1]])
+    added = [key for key in remaining_new if key not in taken_new]
+    removed = [key for key in remaining_old if key not in taken_old]
+    return pairs, added, removed
+
+
+# ---------------------------------------------------------------------------
+# Changes
+# ---------------------------------------------------------------------------
+
+def _field_changes(columns: Sequence[str], old_row: Sequence[Any], new_row: Sequence[Any]) -> Dict[str, Any]:
+    """Changed columns other than the id: {column: {'old': ..., 'new': ...}}"""
+    return {
+        column: {'old': old_value, 'new': new_value}
+        for column, old_value, new_value in zip(columns[1:], old_row[1:], new_row[1:])
+        if old_value != new_value
+    }
+
+
+def _item_keys(entity: str, rows: Sequence[Sequence[Any]]) -> List[str]:
+    """Item identifiers of a list, numbered when an identifier repeats"""
+    _, columns = LIST_TABLES[entity]
+    position = columns.index(LIST_ITEM_KEYS[entity])
+    seen: Dict[str, int] = {}
+    keys = []
+    for index, row in enumerate(rows):
+        key = str(row[position] or f"#{index + 1}")
+        seen[key] = seen.get(key, 0) + 1
+        keys.append(key if seen[key] == 1 else f"{key}~{seen[key]}")
+    return keys
+
+
+def _list_changes(entity: str, old_rows: Sequence[Sequence[Any]], new_rows: Sequence[Sequence[Any]]) -> Dict[str, List[str]]:
+    """Items added, removed and changed between two versions of a sub-area's list"""
+    old_items = dict(zip(_item_keys(entity, old_rows), (row[1:] for row in old_rows)))
+    new_items = dict(zip(_item_keys(entity, new_rows), (row[1:] for row in new_rows)))
+    changes = {
+        'added': [key for key in new_items if key not in old_items],
+        'removed': [key for key in old_items if key not in new_items],
+        'changed': [key for key in new_items if key in old_items and new_items[key] != old_items[key]],
+    }
+    if not any(changes.values()):
+        # Same items in a different order
+        changes['reordered'] = True
+    return changes
+
+
+def encode_rows(entity: str, rows: Any) -> Any:
+    """Rows as JSON objects; list rows without their sub_area_id"""
+    if entity in ROW_TABLES:
+        return dict(zip(ROW_TABLES[entity][1], rows))
+    return [dict(zip(LIST_TABLES[entity][1][1:], row[1:])) for row in rows]
+
+
+def _content(entity: str, old: Optional[Tuple[str, Any]], new: Optional[Tuple[str, Any]]) -> Dict[str, Any]:
+    content: Dict[str, Any] = {}
+    if old is not None:
+        content['old_hash'] = old[0]
+    if new is not None:
+        content['new_hash'] = new[0]
+        content['rows'] = encode_rows(entity, new[1])
+    return content
+
+
+def sub_area_change(
+    old: Catalog,
+    new: Catalog,
+    old_key: Optional[str],
+    new_key: Optional[str],
+    match: Optional[str] = None,
+    similarity: Optional[float] = None
+) -> Optional[Dict[str, Any]]:
+    """Change record for a pair of sub-areas (either side None for added/removed); None when unchanged"""
+    if old_key is None:
+        record: Dict[str, Any] = {'op': 'add', 'id': new_key}
+    elif new_key is None:
+        record = {'op': 'remove', 'id': old_key}
+    elif old_key == new_key:
+        if _unchanged(old, new, old_key, new_key):
+            return None
+        record = {'op': 'modify', 'id': new_key, 'match': match}
+    else:
+        record = {'op': 'rename', 'id': new_key, 'old_id': old_key, 'match': match}
+        if similarity is not None and match == 'similarity':
+            record['similarity'] = similarity
+
+    record['section_id'] = (new if new_key else old)[SUB_AREA][new_key or old_key][1][1]
+    if old_key and new_key:
+        record['fields'] = _field_changes(SUB_AREA_COLUMNS, old[SUB_AREA][old_key][1], new[SUB_AREA][new_key][1])
+        # Compared without the sub_area_id, so a renumbered sub-area's unchanged lists are not reported
+        record['lists'] = {
+            entity: _list_changes(entity, old[entity][old_key][1], new[entity][new_key][1])
+            for entity in LIST_TABLES
+            if [row[1:] for row in old[entity][old_key][1]] != [row[1:] for row in new[entity][new_key][1]]
+        }
+
+    # Content of each part that has to be written: every part under a new id,
+    # only the changed parts of a sub-area modified in place
+    record['content'] = {}
+    for entity in SUB_AREA_PARTS:
+        old_part = old[entity][old_key] if old_key else None
+        new_part = new[entity][new_key] if new_key else None
+        if record['op'] == 'modify' and old_part[0] == new_part[0]:
+            continue
+        record['content'][entity] = _content(entity, old_part, new_part)
+    return record
+
+
+def section_changes(old: Catalog, new: Catalog) -> List[Dict[str, Any]]:
+    changes = []
+    for key, new_section in new[SECTION].items():
+        old_section = old[SECTION].get(key)
+        if old_section is None:
+            changes.append({'op': 'add', 'id': key, 'content': _content(SECTION, None, new_section)})
+        elif old_section[0] != new_section[0]:
+            changes.append({
+                'op': 'modify',
+                'id': key,
+                'fields': _field_changes(SECTION_COLUMNS, old_section[1], new_section[1]),
+                'content': _content(SECTION, old_section, new_section),
+            })
+    for key, old_section in old[SECTION].items():
+        if key not in new[SECTION]:
+            changes.append({'op': 'remove', 'id': key, 'content': _content(SECTION, old_section, None)})
+    return changes
+
+
+def diff_catalogs(old: Catalog, new: Catalog, threshold: float = DEFAULT_THRESHOLD) -> Dict[str, Any]:
+    """Section and sub-area change records plus a summary"""
+    pairs, added, removed = match_sub_areas(old, new, threshold)
+
+    sub_areas = []
+    order = {key: position for position, key in enumerate(new[SUB_AREA])}
+    new_records = [
+        (order[new_key], sub_area_change(old, new, old_key, new_key, match, similarity))
+        for old_key, new_key, match, similarity in pairs
+    ] + [(order[key], sub_area_change(old, new, None, key)) for key in added]
+    sub_areas.extend(record for _, record in sorted(new_records, key=lambda r: r[0]) if record is not None)
+    sub_areas.extend(sub_area_change(old, new, key, None) for key in removed)
+
+    sections = section_changes(old, new)
+
+    ops = [record['op'] for record in sub_areas]
+    summary = {
+        'sections': {
+            op: sum(1 for record in sections if record['op'] == op) for op in ('add', 'modify', 'remove')
+        },
+        'sub_areas': {
+            'add': ops.count('add'),
+            'modify': ops.count('modify'),
+            'rename': ops.count('rename'),
+            'remove': ops.count('remove'),
+            'unchanged': len(pairs) - ops.count('modify') - ops.count('rename'),
+        },
+        'applicability_changed': [
+            record['id'] for record in sub_areas if 'applicability' in record.get('fields', {})
+        ],
+        **{
+            f"{entity}_changed": [record['id'] for record in sub_areas if entity in record.get('lists', {})]
+            for entity in LIST_TABLES
+        },
+    }
+    summary['sections']['unchanged'] = len(new[SECTION]) - summary['sections']['add'] - summary['sections']['modify']
+    return {'summary': summary, 'sections': sections, 'sub_areas': sub_areas}
+
+
+def build_changeset(
+    old_info: Dict[str, Any],
+    old: Catalog,
+    new_info: Dict[str, Any],
+    new: Catalog,
+    threshold: float = DEFAULT_THRESHOLD
+) -> Dict[str, Any]:
+    return {
+        'format': CHANGESET_FORMAT,
+        'format_version': CHANGESET_VERSION,
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'old': old_info,
+        'new': new_info,
+        'threshold': threshold,
+        **diff_catalogs(old, new, threshold),
+    }
+
+
+# ---------------------------------------------------------------------------
+
+def print_summary(changeset: Dict[str, Any], elapsed: float, out=sys.stdout) -> None:
+    summary = changeset['summary']
+    old, new = changeset['old'], changeset['new']
+    print("=" * 80, file=out)
+    print(f"GUIDE DIFF: {old['edition'] or old['source']} → {new['edition'] or new['source']}", file=out)
+    print("=" * 80, file=out)
+    sections = summary['sections']
+    print(f"  Sections   {sections['add']:>4} added, {sections['modify']:>4} modified, "
+          f"{sections['remove']:>4} removed, {sections['unchanged']:>4} unchanged", file=out)
+    sub_areas = summary['sub_areas']
+    print(f"  Sub-areas  {sub_areas['add']:>4} added, {sub_areas['modify']:>4} modified, "
+          f"{sub_areas['rename']:>4} renumbered, {sub_areas['remove']:>4} removed, "
+          f"{sub_areas['unchanged']:>4} unchanged", file=out)
+
+    for label, key in (
+        ('Applicability text changed', 'applicability_changed'),
+        ('Indicators changed', f'{INDICATORS}_changed'),
+        ('Deficiencies changed', f'{DEFICIENCIES}_changed'),
+        ('Governing directives changed', f'{DIRECTIVES}_changed'),
+    ):
+        if summary[key]:
+            print(f"\n  {label} ({len(summary[key])}): {', '.join(summary[key])}", file=out)
+
+    renames = [record for record in changeset['sub_areas'] if record['op'] == 'rename']
+    if renames:
+        print("\n  Renumbered:", file=out)
+        for record in renames:
+            how = 'same content' if record['match'] == 'content' else f"similarity {record['similarity']:.2f}"
+            print(f"    {record['old_id']:<12} → {record['id']:<12} ({how})", file=out)
+    print(f"\n  Diffed in {elapsed * 1000:.0f} ms", file=out)
+    print("=" * 80, file=out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Diff two guide editions and write a changeset")
+    parser.add_argument("old", help="Old edition: extraction JSON file or loaded edition code (e.g. FY2025)")
+    parser.add_argument("new", help="New edition: extraction JSON file or loaded edition code")
+    parser.add_argument("-o", "--output", default=None,
+                        help="Write the changeset JSON here ('-' for stdout)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Minimum text similarity to match renumbered sub-areas (default {DEFAULT_THRESHOLD})")
+    args = parser.parse_args()
+
+    old_info, old = load_source(args.old)
+    new_info, new = load_source(args.new)
+
+    start = time.perf_counter()
+    changeset = build_changeset(old_info, old, new_info, new, args.threshold)
+    elapsed = time.perf_counter() - start
+
+    if args.output == '-':
+        json.dump(changeset, sys.stdout, indent=2, ensure_ascii=False, default=str)
+        print_summary(changeset, elapsed, out=sys.stderr)
+        return
+
+    print_summary(changeset, elapsed)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(changeset, f, indent=2, ensure_ascii=False, default=str)
+        print(f"Changeset written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
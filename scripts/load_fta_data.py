@@ -1,12 +1,80 @@
 """
 Load FTA sections and sub-areas data from JSON file into the database
+
+Incremental: a content hash of every section, sub-area, indicator list,
+deficiency list and governing directive list is kept in
+catalog_content_hashes, and only what changed since the last load is
+written. Sections and sub-areas are upserted; a changed list replaces that
+sub-area's rows. A list whose row count in the database no longer matches
+the extraction is reloaded even if its hash is unchanged.
+
+With --bulk, every extracted row is instead streamed with COPY FROM STDIN
+into temporary staging tables, compared with the live tables in SQL, and
+merged with set-based statements: a handful of round trips in total
+however large the catalog, for full reloads over high-latency links.
+Bulk mode compares actual table contents rather than stored hashes, and
+records the hashes for later incremental loads.
+
+Every load targets one guide edition, named by --edition or derived from
+the extraction's source document ("Fiscal Year 2025 ..." -> FY2025), and
+only reads and writes that edition's rows, so a new edition's guide is
+loaded alongside the old one. An edition that does not exist yet is
+created; --current makes it the edition new projects use, and
+--inherit-from copies LOE estimates and applicability rules (with their
+conditions) onto its sub-areas from the sub-areas with the same id in an
+earlier edition.
+
+With --changeset, a changeset written by guide_diff.py is applied instead
+of an extraction: only the parts it lists are written, after checking that
+each still holds the changeset's old (or already its new) content hash, and
+renumbered sub-areas keep the LOE estimate and applicability rules of their
+old id. A changeset for an edition that is not loaded yet starts it as a
+copy of the edition the changeset was diffed from, leaving out the sub-areas
+and sections the changeset removes or renumbers.
+
+Everything runs in one transaction. Sub-areas and sections that are no
+longer in the extraction are reported, and only deleted with --prune.
+The edition's catalog version is bumped once when anything was written,
+so API caches are invalidated only by loads that change that catalog.
+
+Usage:
+    python load_fta_data.py               # load what changed
+    python load_fta_data.py --dry-run     # report what would change
+    python load_fta_data.py --full        # rewrite everything, ignoring stored hashes
+    python load_fta_data.py --bulk        # stage everything with COPY and merge in SQL
+    python load_fta_data.py --prune       # also delete sub-areas and sections no longer extracted
+    python load_fta_data.py --file fy2026.json --edition FY2026 --inherit-from FY2025 --current
+    python load_fta_data.py --changeset fy2026-changeset.json --current
 """
 
-import psycopg2
+import argparse
+import io
 import json
 import os
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import psycopg2
+from psycopg2.extras import execute_values
 from dotenv import load_dotenv
 
+from fta_extraction import (
+    DEFICIENCY_COLUMNS,
+    DIRECTIVE_COLUMNS,
+    EXTRACTION_PATH,
+    INDICATOR_COLUMNS,
+    SECTION_COLUMNS,
+    SUB_AREA_COLUMNS,
+    content_hash,
+    deficiency_rows,
+    directive_rows,
+    edition_code,
+    indicator_rows,
+    iter_extraction,
+    section_row,
+    sub_area_row
+)
+
 load_dotenv()
 
 # Use DATABASE_URL if available (for Render), otherwise construct from individual vars
@@ -14,126 +82,865 @@ DATABASE_URL = os.getenv('DATABASE_URL')
 if not DATABASE_URL:
     DATABASE_URL = f"postgresql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}@{os.getenv('DB_HOST', 'localhost')}:{os.getenv('DB_PORT', '5432')}/{os.getenv('DB_NAME', 'fta_review')}"
 
+SECTION = 'section'
+SUB_AREA = 'sub_area'
+INDICATORS = 'indicators'
+DEFICIENCIES = 'deficiencies'
+DIRECTIVES = 'directives'
+
+# Entities stored one row per key: (table, columns); the first column is the key
+ROW_TABLES = {
+    SECTION: ('sections', SECTION_COLUMNS),
+    SUB_AREA: ('sub_areas', SUB_AREA_COLUMNS),
+}
+# Entities stored as a list of rows per sub-area: (table, columns); the first column is sub_area_id
+LIST_TABLES = {
+    INDICATORS: ('indicators_of_compliance', INDICATOR_COLUMNS),
+    DEFICIENCIES: ('deficiencies', DEFICIENCY_COLUMNS),
+    DIRECTIVES: ('governing_directives', DIRECTIVE_COLUMNS),
+}
+ENTITIES = (*ROW_TABLES, *LIST_TABLES)
+
+LIST_ROWS = {
+    INDICATORS: indicator_rows,
+    DEFICIENCIES: deficiency_rows,
+    DIRECTIVES: directive_rows,
+}
+
+# Changesets written by guide_diff.py
+CHANGESET_FORMAT = 'fta-guide-changeset'
+CHANGESET_VERSION = 1
+
+# Reviewed data that is not in the extraction, copied between editions
+LOE_COLUMNS = ('loe_hours', 'loe_confidence', 'loe_confidence_score', 'loe_reasoning')
+RULE_COLUMNS = ('question_id', 'required_answer', 'rule_type', 'rule_description', 'priority', 'is_active')
+CONDITION_COLUMNS = ('question_key', 'operator', 'expected_value', 'is_active')
+
+# Pairs every sub-area of %(edition_id)s with the sub-area of the same id (see copy_rules())
+SAME_ID_MATCHES = "(SELECT id, id FROM sub_areas WHERE edition_id = %(edition_id)s) AS m(new_id, old_id)"
+
+PAGE_SIZE = 1000
+
+
 def get_db_connection():
     return psycopg2.connect(DATABASE_URL)
 
-def load_data():
-    """Load sections and sub-areas from JSON file"""
-    json_path = os.path.join(os.path.dirname(__file__), '..', 'docs', 'FTA_Complete_Extraction.json')
 
-    with open(json_path, 'r') as f:
-        data = json.load(f)
+def read_extraction(path: str) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Tuple[str, Any]]]]:
+    """
+    Extraction metadata, and the extracted catalog as {entity: {key: (hash, rows)}}
+    in document order. Sections are keyed by section id; sub-areas and their
+    lists by unique sub-area id. Rows do not include the edition. The
+    extraction is streamed, so only these rows are kept, not the parsed file.
+    """
+    metadata: Dict[str, Any] = {}
+    catalog: Dict[str, Dict[str, Tuple[str, Any]]] = {entity: {} for entity in ENTITIES}
 
-    conn = get_db_connection()
-    cursor = conn.cursor()
+    previous = None
+    for section, sub_area in iter_extraction(path, metadata):
+        if section is not previous:
+            row = section_row(section)
+            catalog[SECTION][section['id']] = (content_hash(row), row)
+            previous = section
+        if sub_area is None:
+            continue
+
+        row = sub_area_row(section['id'], sub_area)
+        catalog[SUB_AREA][sub_area['id']] = (content_hash(row), row)
+        for entity, list_rows in LIST_ROWS.items():
+            rows = list_rows(sub_area)
+            catalog[entity][sub_area['id']] = (content_hash(rows), rows)
+
+    return metadata.get('metadata', {}), catalog
+
+
+def _changed(plan, entity) -> List[str]:
+    return plan[entity]['added'] + plan[entity]['updated']
+
+
+def _with_edition(edition_id: int, rows: Iterable[Sequence[Any]]) -> List[Tuple]:
+    return [(edition_id, *row) for row in rows]
+
+
+def _upsert_sql(table: str, columns: Sequence[str], source: str) -> str:
+    """INSERT ... ON CONFLICT on the edition and the first column, updating the rest; source leads with edition_id"""
+    updates = ',\n            '.join(f"{column} = EXCLUDED.{column}" for column in columns[1:])
+    return f"""
+        INSERT INTO {table} (edition_id, {', '.join(columns)})
+        {source}
+        ON CONFLICT (edition_id, {columns[0]}) DO UPDATE SET
+            {updates},
+            updated_at = CURRENT_TIMESTAMP
+    """
+
+
+# ---------------------------------------------------------------------------
+# Incremental mode: compare stored hashes, write changed keys with batched statements
+# ---------------------------------------------------------------------------
+
+def read_database(cursor, edition_id: int) -> Dict[str, Any]:
+    """Stored hashes, existing ids and per-sub-area list row counts of an edition"""
+    cursor.execute(
+        "SELECT entity, key, content_hash FROM catalog_content_hashes WHERE edition_id = %s", (edition_id,)
+    )
+    hashes: Dict[str, Dict[str, str]] = {entity: {} for entity in ENTITIES}
+    for entity, key, digest in cursor.fetchall():
+        hashes.setdefault(entity, {})[key] = digest
+
+    ids = {}
+    for entity, (table, columns) in ROW_TABLES.items():
+        cursor.execute(f"SELECT {columns[0]} FROM {table} WHERE edition_id = %s", (edition_id,))
+        ids[entity] = [row[0] for row in cursor.fetchall()]
+
+    counts = {}
+    for entity, (table, _) in LIST_TABLES.items():
+        cursor.execute(
+            f"SELECT sub_area_id, COUNT(*) FROM {table} WHERE edition_id = %s GROUP BY sub_area_id", (edition_id,)
+        )
+        counts[entity] = Counter(dict(cursor.fetchall()))
+
+    return {'hashes': hashes, 'ids': ids, 'counts': counts}
+
+
+def plan_changes(catalog, database, full: bool = False) -> Dict[str, Dict[str, List[str]]]:
+    """
+    Keys to write per entity: 'added' (not in the database), 'updated'
+    (hash changed, row count drifted, or --full) and 'unchanged'; plus
+    'removed' sections and sub-areas that are no longer extracted.
+    """
+    plan = {}
+    for entity in ENTITIES:
+        stored = database['hashes'][entity]
+        if entity in ROW_TABLES:
+            existing = set(database['ids'][entity])
+            removed = [key for key in database['ids'][entity] if key not in catalog[entity]]
+        else:
+            existing = set(database['ids'][SUB_AREA])
+            removed = []
+        counts = database['counts'].get(entity)
+
+        changes = {'added': [], 'updated': [], 'unchanged': [], 'removed': removed}
+        for key, (digest, rows) in catalog[entity].items():
+            if key not in existing:
+                changes['added'].append(key)
+            elif full or stored.get(key) != digest or (counts is not None and counts[key] != len(rows)):
+                changes['updated'].append(key)
+            else:
+                changes['unchanged'].append(key)
+        plan[entity] = changes
+    return plan
+
+
+def apply_changes(cursor, edition_id: int, catalog, plan, prune: bool = False) -> None:
+    """Write planned changes and their hashes to an edition; the caller owns the transaction"""
+    for entity, (table, columns) in ROW_TABLES.items():
+        keys = _changed(plan, entity)
+        if keys:
+            execute_values(
+                cursor, _upsert_sql(table, columns, "VALUES %s"),
+                _with_edition(edition_id, (catalog[entity][key][1] for key in keys)), page_size=PAGE_SIZE
+            )
+
+    for entity, (table, columns) in LIST_TABLES.items():
+        keys = _changed(plan, entity)
+        if not keys:
+            continue
+        cursor.execute(f"DELETE FROM {table} WHERE edition_id = %s AND sub_area_id = ANY(%s)", (edition_id, keys))
+        rows = _with_edition(edition_id, (row for key in keys for row in catalog[entity][key][1]))
+        if rows:
+            execute_values(
+                cursor, f"INSERT INTO {table} (edition_id, {', '.join(columns)}) VALUES %s", rows, page_size=PAGE_SIZE
+            )
+
+    if prune:
+        prune_removed(cursor, edition_id, plan)
+
+    hash_rows = [
+        (edition_id, entity, key, catalog[entity][key][0])
+        for entity in ENTITIES for key in _changed(plan, entity)
+    ]
+    if hash_rows:
+        execute_values(cursor, """
+            INSERT INTO catalog_content_hashes (edition_id, entity, key, content_hash)
+            VALUES %s
+            ON CONFLICT (edition_id, entity, key) DO UPDATE SET
+                content_hash = EXCLUDED.content_hash,
+                updated_at = CURRENT_TIMESTAMP
+        """, hash_rows, page_size=PAGE_SIZE)
+
+
+def prune_removed(cursor, edition_id: int, plan) -> None:
+    """Delete an edition's sub-areas and sections that are no longer extracted, with their hashes"""
+    removed_sub_areas = plan[SUB_AREA]['removed']
+    removed_sections = plan[SECTION]['removed']
+    if removed_sub_areas:
+        cursor.execute("DELETE FROM sub_areas WHERE edition_id = %s AND id = ANY(%s)", (edition_id, removed_sub_areas))
+        cursor.execute(
+            "DELETE FROM catalog_content_hashes WHERE edition_id = %s AND entity <> %s AND key = ANY(%s)",
+            (edition_id, SECTION, removed_sub_areas)
+        )
+    if removed_sections:
+        cursor.execute("DELETE FROM sections WHERE edition_id = %s AND id = ANY(%s)", (edition_id, removed_sections))
+        cursor.execute(
+            "DELETE FROM catalog_content_hashes WHERE edition_id = %s AND entity = %s AND key = ANY(%s)",
+            (edition_id, SECTION, removed_sections)
+        )
+
+
+# ---------------------------------------------------------------------------
+# Bulk mode: COPY everything into staging tables, diff and merge in SQL
+# ---------------------------------------------------------------------------
+
+def _copy_text(value: Any) -> str:
+    """A value in COPY text format"""
+    if value is None:
+        return '\\N'
+    return (str(value).replace('\\', '\\\\').replace('\t', '\\t')
+            .replace('\n', '\\n').replace('\r', '\\r'))
+
+
+def copy_rows(cursor, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> None:
+    """Stream rows into a table with COPY FROM STDIN"""
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(_copy_text(value) for value in row))
+        buffer.write('\n')
+    buffer.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+
+
+def stage_catalog(cursor, catalog) -> None:
+    """
+    Create stage_<table> temp tables (dropped at commit) shaped like the live
+    tables (without the edition column) and COPY the whole extraction into
+    them. List rows carry a position in document order.
+    """
+    for entity, (table, columns) in ROW_TABLES.items():
+        cursor.execute(
+            f"CREATE TEMP TABLE stage_{table} ON COMMIT DROP AS "
+            f"SELECT {', '.join(columns)} FROM {table} WITH NO DATA"
+        )
+        copy_rows(cursor, f"stage_{table}", columns, (row for _, row in catalog[entity].values()))
+
+    for entity, (table, columns) in LIST_TABLES.items():
+        cursor.execute(
+            f"CREATE TEMP TABLE stage_{table} ON COMMIT DROP AS "
+            f"SELECT 0 AS position, {', '.join(columns)} FROM {table} WITH NO DATA"
+        )
+        rows = (row for _, list_rows in catalog[entity].values() for row in list_rows)
+        copy_rows(cursor, f"stage_{table}", ('position', *columns),
+                  ((position, *row) for position, row in enumerate(rows)))
+
+    cursor.execute(
+        "CREATE TEMP TABLE stage_catalog_content_hashes ON COMMIT DROP AS "
+        "SELECT entity, key, content_hash FROM catalog_content_hashes WITH NO DATA"
+    )
+    copy_rows(cursor, "stage_catalog_content_hashes", ('entity', 'key', 'content_hash'),
+              ((entity, key, digest) for entity in ENTITIES for key, (digest, _) in catalog[entity].items()))
+
+    for table, _ in (*ROW_TABLES.values(), *LIST_TABLES.values()):
+        cursor.execute(f"ANALYZE stage_{table}")
+
+
+def plan_staged_changes(cursor, edition_id: int, catalog, full: bool = False) -> Dict[str, Dict[str, List[str]]]:
+    """Same plan as plan_changes(), computed by comparing staged and the edition's live rows in SQL"""
+    params = {'edition_id': edition_id}
+    plan = {}
+    for entity, (table, columns) in ROW_TABLES.items():
+        key = columns[0]
+        compared = 'TRUE' if full else (
+            f"(s.{', s.'.join(columns[1:])}) IS DISTINCT FROM (t.{', t.'.join(columns[1:])})"
+        )
+        cursor.execute(f"""
+            SELECT s.{key}, t.{key} IS NULL
+            FROM stage_{table} s
+            LEFT JOIN {table} t ON t.edition_id = %(edition_id)s AND t.{key} = s.{key}
+            WHERE t.{key} IS NULL OR {compared}
+        """, params)
+        flagged = dict(cursor.fetchall())
+        cursor.execute(f"""
+            SELECT t.{key} FROM {table} t
+            WHERE t.edition_id = %(edition_id)s
+            AND NOT EXISTS (SELECT 1 FROM stage_{table} s WHERE s.{key} = t.{key})
+            ORDER BY t.{key}
+        """, params)
+        plan[entity] = {
+            'added': [k for k in catalog[entity] if flagged.get(k) is True],
+            'updated': [k for k in catalog[entity] if flagged.get(k) is False],
+            'unchanged': [k for k in catalog[entity] if k not in flagged],
+            'removed': [row[0] for row in cursor.fetchall()],
+        }
+
+    added_sub_areas = set(plan[SUB_AREA]['added'])
+    for entity, (table, columns) in LIST_TABLES.items():
+        if full:
+            changed = set(catalog[entity])
+        else:
+            # Rows numbered within each sub-area, so reordering a list is a change too
+            values = ', '.join(columns[1:])
+            cursor.execute(f"""
+                SELECT DISTINCT sub_area_id FROM (
+                    (SELECT sub_area_id, row_number() OVER (PARTITION BY sub_area_id ORDER BY position), {values}
+                     FROM stage_{table}
+                     EXCEPT ALL
+                     SELECT sub_area_id, row_number() OVER (PARTITION BY sub_area_id ORDER BY id), {values}
+                     FROM {table}
+                     WHERE edition_id = %(edition_id)s AND sub_area_id IN (SELECT id FROM stage_sub_areas))
+                    UNION ALL
+                    (SELECT sub_area_id, row_number() OVER (PARTITION BY sub_area_id ORDER BY id), {values}
+                     FROM {table}
+                     WHERE edition_id = %(edition_id)s AND sub_area_id IN (SELECT id FROM stage_sub_areas)
+                     EXCEPT ALL
+                     SELECT sub_area_id, row_number() OVER (PARTITION BY sub_area_id ORDER BY position), {values}
+                     FROM stage_{table})
+                ) differences
+            """, params)
+            changed = {row[0] for row in cursor.fetchall()}
+        plan[entity] = {
+            'added': [k for k in catalog[entity] if k in added_sub_areas],
+            'updated': [k for k in catalog[entity] if k in changed and k not in added_sub_areas],
+            'unchanged': [k for k in catalog[entity] if k not in changed and k not in added_sub_areas],
+            'removed': [],
+        }
+    return plan
+
+
+def merge_staged_changes(cursor, edition_id: int, plan, prune: bool = False) -> None:
+    """Merge planned changes from the staging tables into an edition with set-based statements"""
+    for entity, (table, columns) in ROW_TABLES.items():
+        keys = _changed(plan, entity)
+        if keys:
+            source = f"SELECT %s, {', '.join(columns)} FROM stage_{table} WHERE {columns[0]} = ANY(%s)"
+            cursor.execute(_upsert_sql(table, columns, source), (edition_id, keys))
+
+    for entity, (table, columns) in LIST_TABLES.items():
+        keys = _changed(plan, entity)
+        if not keys:
+            continue
+        cursor.execute(f"DELETE FROM {table} WHERE edition_id = %s AND sub_area_id = ANY(%s)", (edition_id, keys))
+        cursor.execute(f"""
+            INSERT INTO {table} (edition_id, {', '.join(columns)})
+            SELECT %s, {', '.join(columns)} FROM stage_{table}
+            WHERE sub_area_id = ANY(%s)
+            ORDER BY position
+        """, (edition_id, keys))
+
+    if prune:
+        prune_removed(cursor, edition_id, plan)
 
+    cursor.execute("""
+        INSERT INTO catalog_content_hashes (edition_id, entity, key, content_hash)
+        SELECT %s, entity, key, content_hash FROM stage_catalog_content_hashes
+        ON CONFLICT (edition_id, entity, key) DO UPDATE SET
+            content_hash = EXCLUDED.content_hash,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE catalog_content_hashes.content_hash <> EXCLUDED.content_hash
+    """, (edition_id,))
+
+
+# ---------------------------------------------------------------------------
+# Guide editions
+# ---------------------------------------------------------------------------
+
+def get_edition_id(cursor, code: str) -> Optional[int]:
+    cursor.execute("SELECT id FROM guide_editions WHERE code = %s", (code,))
+    row = cursor.fetchone()
+    return row[0] if row else None
+
+
+def ensure_edition(cursor, code: str, metadata: Dict[str, Any]) -> Tuple[int, bool]:
+    """
+    Id of the edition, creating it from the extraction metadata if it does
+    not exist; the first edition created becomes the current one.
+    Returns (edition_id, created).
+    """
+    edition_id = get_edition_id(cursor, code)
+    if edition_id is not None:
+        return edition_id, False
+
+    cursor.execute("""
+        INSERT INTO guide_editions (code, title, source_document, extraction_date, is_current)
+        VALUES (%s, %s, %s, %s, NOT EXISTS (SELECT 1 FROM guide_editions WHERE is_current))
+        RETURNING id
+    """, (
+        code,
+        f"{code} Comprehensive Review Guide",
+        metadata.get('source_document'),
+        metadata.get('extraction_date')
+    ))
+    return cursor.fetchone()[0], True
+
+
+def make_current(cursor, edition_id: int) -> None:
+    """Make an edition the one new projects are pinned to"""
+    # Two statements: the partial unique index allows one current edition at any time
+    cursor.execute("UPDATE guide_editions SET is_current = FALSE WHERE is_current AND id <> %s", (edition_id,))
+    cursor.execute("UPDATE guide_editions SET is_current = TRUE WHERE id = %s AND NOT is_current", (edition_id,))
+
+
+def inherit_from(
+    cursor,
+    edition_id: int,
+    source_edition_id: int,
+    renames: Optional[Dict[str, str]] = None
+) -> Tuple[int, int]:
+    """
+    Copy LOE estimates and applicability rules (with their conditions) onto
+    an edition's sub-areas from the matching sub-areas of the source
+    edition: the sub-area with the same id, or the old id of a renumbered
+    sub-area when renames ({new id: old id}) are given. Sub-areas that
+    already have an estimate, and rules that already exist, are kept.
+    Returns (sub-areas estimated, rules copied).
+    """
+    params: Dict[str, Any] = {'edition_id': edition_id, 'source': source_edition_id}
+    if renames is None:
+        matches = SAME_ID_MATCHES
+    else:
+        matches = "unnest(%(new_ids)s::text[], %(old_ids)s::text[]) AS m(new_id, old_id)"
+        params.update(new_ids=list(renames), old_ids=list(renames.values()))
+
+    updates = ',\n            '.join(f"{column} = s.{column}" for column in LOE_COLUMNS)
+    cursor.execute(f"""
+        UPDATE sub_areas t
+        SET {updates},
+            updated_at = CURRENT_TIMESTAMP
+        FROM {matches}
+        JOIN sub_areas s ON s.edition_id = %(source)s AND s.id = m.old_id
+        WHERE t.edition_id = %(edition_id)s AND t.id = m.new_id
+        AND t.loe_hours IS NULL AND s.loe_hours IS NOT NULL
+    """, params)
+    estimated = cursor.rowcount
+
+    return estimated, copy_rules(cursor, edition_id, source_edition_id, matches, params)
+
+
+def copy_rules(cursor, edition_id: int, source_edition_id: int, matches: str, params: Dict[str, Any]) -> int:
+    """
+    Copy the source edition's applicability rules and their conditions onto
+    the edition's sub-areas, through a `matches` relation m(new_id, old_id)
+    of sub-area ids. Copied rules get new ids, and their conditions are
+    re-pointed at them. A rule the edition already has for the sub-area (the
+    same question, or the same description for condition-only rules) is kept.
+    Returns the number of rules copied.
+    """
+    params = {**params, 'edition_id': edition_id, 'source': source_edition_id}
+    cursor.execute(f"""
+        WITH source AS (
+            SELECT nextval(pg_get_serial_sequence('applicability_rules', 'id')) AS new_rule_id, s.*
+            FROM (
+                SELECT r.id AS old_rule_id, m.new_id AS sub_area_id,
+                       {', '.join(f'r.{column}' for column in RULE_COLUMNS)}
+                FROM applicability_rules r
+                JOIN {matches} ON m.old_id = r.sub_area_id
+                JOIN sub_areas t ON t.edition_id = %(edition_id)s AND t.id = m.new_id
+                WHERE r.edition_id = %(source)s
+                AND NOT EXISTS (
+                    SELECT 1 FROM applicability_rules e
+                    WHERE e.edition_id = %(edition_id)s AND e.sub_area_id = m.new_id
+                    AND e.question_id IS NOT DISTINCT FROM r.question_id
+                    AND e.rule_description IS NOT DISTINCT FROM r.rule_description
+                )
+                ORDER BY r.id
+            ) s
+        ),
+        rules AS (
+            INSERT INTO applicability_rules (id, edition_id, sub_area_id, {', '.join(RULE_COLUMNS)})
+            SELECT new_rule_id, %(edition_id)s, sub_area_id, {', '.join(RULE_COLUMNS)}
+            FROM source
+            ORDER BY new_rule_id
+            ON CONFLICT (edition_id, sub_area_id, question_id) DO NOTHING
+            RETURNING id
+        ),
+        conditions AS (
+            INSERT INTO rule_conditions (rule_id, {', '.join(CONDITION_COLUMNS)})
+            SELECT source.new_rule_id, {', '.join(f'c.{column}' for column in CONDITION_COLUMNS)}
+            FROM rules
+            JOIN source ON source.new_rule_id = rules.id
+            JOIN rule_conditions c ON c.rule_id = source.old_rule_id
+            ORDER BY c.id
+        )
+        SELECT count(*) FROM rules
+    """, params)
+    return cursor.fetchone()[0]
+
+
+def clone_edition(
+    cursor,
+    source_edition_id: int,
+    edition_id: int,
+    removed_sub_areas: Sequence[str] = (),
+    removed_sections: Sequence[str] = ()
+) -> None:
+    """
+    Copy an edition's catalog, LOE estimates, applicability rules (with their
+    conditions) and content hashes into a new, empty edition. Copied
+    sub-areas get new ordinals, in the source's order. The removed sub-areas
+    and sections (e.g. those a changeset removes or renumbers) are left out,
+    with everything that belongs to them.
+    """
+    params = {
+        'edition_id': edition_id,
+        'source': source_edition_id,
+        'removed_sub_areas': list(removed_sub_areas),
+        'removed_sections': list(removed_sections),
+        'section': SECTION,
+    }
+    copied_sub_area = "sub_area_id IN (SELECT id FROM sub_areas WHERE edition_id = %(edition_id)s)"
+    copies = (
+        ('sections', (*SECTION_COLUMNS, 'chapter_number'), 'id', "id <> ALL(%(removed_sections)s::text[])"),
+        ('sub_areas', (*SUB_AREA_COLUMNS, *LOE_COLUMNS), 'ordinal',
+         "id <> ALL(%(removed_sub_areas)s::text[]) AND section_id <> ALL(%(removed_sections)s::text[])"),
+        *((table, columns, 'id', copied_sub_area) for table, columns in LIST_TABLES.values()),
+        ('catalog_content_hashes', ('entity', 'key', 'content_hash'), 'entity, key', """(
+            CASE WHEN entity = %(section)s
+                THEN key IN (SELECT id FROM sections WHERE edition_id = %(edition_id)s)
+                ELSE key IN (SELECT id FROM sub_areas WHERE edition_id = %(edition_id)s)
+            END)"""),
+    )
+    for table, columns, order, copied in copies:
+        cursor.execute(f"""
+            INSERT INTO {table} (edition_id, {', '.join(columns)})
+            SELECT %(edition_id)s, {', '.join(columns)} FROM {table}
+            WHERE edition_id = %(source)s AND {copied}
+            ORDER BY {order}
+        """, params)
+    copy_rules(cursor, edition_id, source_edition_id, SAME_ID_MATCHES, params)
+
+
+# ---------------------------------------------------------------------------
+# Changesets: apply a guide_diff.py changeset instead of a whole extraction
+# ---------------------------------------------------------------------------
+
+def _decode_rows(entity: str, key: str, rows: Any) -> Any:
+    """Rows of a changeset part as the tuples read_extraction() produces"""
+    if entity in ROW_TABLES:
+        return tuple(rows[column] for column in ROW_TABLES[entity][1])
+    return [(key, *(row[column] for column in LIST_TABLES[entity][1][1:])) for row in rows]
+
+
+def read_changeset(path: str):
+    """
+    A changeset and what it writes: (changeset, catalog, plan, expected,
+    renames). The catalog holds only the parts to write, in the shape of
+    read_extraction(); the plan has the same keys as plan_changes(), without
+    'unchanged'; expected maps (entity, key) to the (old, new) content hashes
+    the target edition may hold; renames maps new sub-area ids to old ones.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        changeset = json.load(f)
+    if changeset.get('format') != CHANGESET_FORMAT or changeset.get('format_version') != CHANGESET_VERSION:
+        raise SystemExit(f"{path} is not a version {CHANGESET_VERSION} guide changeset")
+
+    catalog: Dict[str, Dict[str, Tuple[str, Any]]] = {entity: {} for entity in ENTITIES}
+    plan = {entity: {'added': [], 'updated': [], 'unchanged': [], 'removed': []} for entity in ENTITIES}
+    expected: Dict[Tuple[str, str], Tuple[Optional[str], Optional[str]]] = {}
+    renames: Dict[str, str] = {}
+
+    def write(entity: str, key: str, content: Dict[str, Any], change: str) -> None:
+        rows = _decode_rows(entity, key, content['rows'])
+        if content_hash(rows) != content['new_hash']:
+            raise SystemExit(f"Changeset content for {entity} {key} does not match its hash")
+        catalog[entity][key] = (content['new_hash'], rows)
+        plan[entity][change].append(key)
+        expected[(entity, key)] = (content.get('old_hash') if change == 'updated' else None, content['new_hash'])
+
+    for record in changeset['sections']:
+        if record['op'] == 'remove':
+            plan[SECTION]['removed'].append(record['id'])
+            expected[(SECTION, record['id'])] = (record['content']['old_hash'], None)
+        else:
+            write(SECTION, record['id'], record['content'], 'added' if record['op'] == 'add' else 'updated')
+
+    for record in changeset['sub_areas']:
+        op, content = record['op'], record['content']
+        if op in ('add', 'rename', 'modify'):
+            for entity, part in content.items():
+                write(entity, record['id'], part, 'updated' if op == 'modify' else 'added')
+        if op in ('remove', 'rename'):
+            old_id = record['id'] if op == 'remove' else record['old_id']
+            plan[SUB_AREA]['removed'].append(old_id)
+            for entity, part in content.items():
+                expected[(entity, old_id)] = (part['old_hash'], None)
+        if op == 'rename':
+            renames[record['id']] = record['old_id']
+
+    return changeset, catalog, plan, expected, renames
+
+
+def changeset_conflicts(expected, database) -> List[str]:
+    """Parts whose stored hash is neither the changeset's old nor its new hash, i.e. edited since the diff"""
+    return [
+        f"{entity} {key}"
+        for (entity, key), hashes in expected.items()
+        if database['hashes'][entity].get(key) not in hashes
+    ]
+
+
+def _fill_unchanged(plan, database) -> None:
+    """Count every stored key the changeset does not touch as unchanged"""
+    for entity in ENTITIES:
+        touched = {key for keys in plan[entity].values() for key in keys}
+        if entity != SECTION:
+            touched.update(plan[SUB_AREA]['removed'])
+        ids = database['ids'][entity if entity in ROW_TABLES else SUB_AREA]
+        plan[entity]['unchanged'] = [key for key in ids if key not in touched]
+
+
+def load_changeset(
+    path: str,
+    edition: Optional[str] = None,
+    current: bool = False,
+    prune: bool = False,
+    dry_run: bool = False,
+    force: bool = False
+) -> None:
+    """Apply a guide_diff.py changeset to one edition in one transaction and print a change summary"""
     print("\n" + "=" * 80)
-    print("LOADING FTA COMPREHENSIVE REVIEW DATA")
+    print("APPLYING GUIDE CHANGESET")
     print("=" * 80)
 
-    sections_loaded = 0
-    sub_areas_loaded = 0
-    indicators_loaded = 0
-    deficiencies_loaded = 0
-
-    for section_data in data['sections']:
-        section = section_data['section']
-
-        # Insert section
-        cursor.execute("""
-            INSERT INTO sections (id, title, page_range, purpose)
-            VALUES (%s, %s, %s, %s)
-            ON CONFLICT (id) DO UPDATE SET
-                title = EXCLUDED.title,
-                page_range = EXCLUDED.page_range,
-                purpose = EXCLUDED.purpose,
-                updated_at = CURRENT_TIMESTAMP
-        """, (
-            section['id'],
-            section['title'],
-            section.get('page_range'),
-            section.get('purpose')
-        ))
-        sections_loaded += 1
-        print(f"\n[{sections_loaded}] Section: {section['title']}")
-
-        # Insert sub-areas
-        for sub_area in section_data.get('sub_areas', []):
-            cursor.execute("""
-                INSERT INTO sub_areas (
-                    id, section_id, question, basic_requirement,
-                    applicability, detailed_explanation, instructions_for_reviewer
+    changeset, catalog, plan, expected, renames = read_changeset(path)
+    base = (changeset['old'].get('edition') or '').upper()
+    code = (edition or changeset['new'].get('edition') or '').strip().upper()
+    if not code:
+        raise SystemExit("The changeset does not name the new guide edition; pass --edition")
+
+    pruned = prune
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cursor:
+            base_id = get_edition_id(cursor, base) if base else None
+            edition_id = get_edition_id(cursor, code)
+            if edition_id is None:
+                # A new edition starts as a copy of the one the changeset was diffed from
+                if base_id is None:
+                    raise SystemExit(
+                        f"{code} is not loaded and neither is the changeset's base edition "
+                        f"({base or 'unnamed'}); load the base edition or the full extraction first"
+                    )
+                edition_id, _ = ensure_edition(cursor, code, changeset['new'])
+                # Removed and renumbered parts are not copied, so they need no --prune
+                clone_edition(cursor, base_id, edition_id, plan[SUB_AREA]['removed'], plan[SECTION]['removed'])
+                pruned = True
+                print(f"Edition: {code} (id {edition_id}, new, copied from {base})")
+            else:
+                print(f"Edition: {code} (id {edition_id})")
+
+            database = read_database(cursor, edition_id)
+            conflicts = changeset_conflicts(expected, database)
+            if conflicts and not force:
+                raise SystemExit(
+                    f"{code} has changed since the changeset was made ({len(conflicts)} parts differ from both "
+                    f"its old and new content: {', '.join(conflicts[:10])}{', ...' if len(conflicts) > 10 else ''}); "
+                    "diff again, or pass --force to apply it anyway"
                 )
-                VALUES (%s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (id) DO UPDATE SET
-                    question = EXCLUDED.question,
-                    basic_requirement = EXCLUDED.basic_requirement,
-                    applicability = EXCLUDED.applicability,
-                    detailed_explanation = EXCLUDED.detailed_explanation,
-                    instructions_for_reviewer = EXCLUDED.instructions_for_reviewer,
-                    updated_at = CURRENT_TIMESTAMP
-                RETURNING id
-            """, (
-                sub_area['id'],
-                section['id'],
-                sub_area.get('question'),
-                sub_area.get('basic_requirement'),
-                sub_area.get('applicability'),
-                sub_area.get('detailed_explanation'),
-                sub_area.get('instructions_for_reviewer')
-            ))
-            sub_areas_loaded += 1
-            print(f"  → Sub-area {sub_area['id']}: {sub_area.get('question', '')[:60]}...")
-
-            # Insert indicators of compliance
-            indicators = sub_area.get('indicators_of_compliance') or []
-            for indicator in indicators:
-                if indicator:  # Skip None values
-                    cursor.execute("""
-                        INSERT INTO indicators_of_compliance (
-                            sub_area_id, indicator_id, text
-                        )
-                        VALUES (%s, %s, %s)
-                        ON CONFLICT DO NOTHING
-                    """, (
-                        sub_area['id'],
-                        indicator.get('indicator_id'),
-                        indicator.get('text')
-                    ))
-                    indicators_loaded += 1
-
-            # Insert deficiencies
-            deficiencies = sub_area.get('deficiencies') or []
-            for deficiency in deficiencies:
-                if deficiency:  # Skip None values
-                    cursor.execute("""
-                        INSERT INTO deficiencies (
-                            sub_area_id, code, title, determination, suggested_corrective_action
-                        )
-                        VALUES (%s, %s, %s, %s, %s)
-                        ON CONFLICT DO NOTHING
-                    """, (
-                        sub_area['id'],
-                        deficiency.get('code'),
-                        deficiency.get('title'),
-                        deficiency.get('determination'),
-                        deficiency.get('suggested_corrective_action')
-                    ))
-                    deficiencies_loaded += 1
-
-        conn.commit()
-
-    cursor.close()
-    conn.close()
+            _fill_unchanged(plan, database)
+            has_changes = any(
+                _changed(plan, entity) or (pruned and plan[entity]['removed'])
+                for entity in ENTITIES
+            )
+
+            version_before = get_catalog_version(cursor, edition_id)
+            carried = None
+            if not dry_run:
+                apply_changes(cursor, edition_id, catalog, plan)
+                if renames:
+                    # Renumbered sub-areas keep their reviewed LOE and rules, from the old id
+                    carried = inherit_from(cursor, edition_id, base_id or edition_id, renames)
+                if prune:
+                    prune_removed(cursor, edition_id, plan)
+                if current:
+                    make_current(cursor, edition_id)
+            version_after = get_catalog_version(cursor, edition_id)
+        if dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    print()
+    print_summary(catalog, plan, pruned)
+    if renames:
+        print(f"\n  Renumbered: {', '.join(f'{old} → {new}' for new, old in renames.items())}")
+    if carried is not None:
+        print(f"  Carried over to renumbered sub-areas: LOE for {carried[0]}, {carried[1]} applicability rules")
+    if conflicts:
+        print(f"\n  Applied over {len(conflicts)} parts changed since the diff (--force)")
+    if current and not dry_run:
+        print(f"\n  {code} is now the current edition")
+    print("\n" + "=" * 80)
+    if dry_run:
+        print("DRY RUN - nothing written" + ("" if has_changes else " (catalog is up to date)"))
+    elif has_changes:
+        print(f"✓ CATALOG UPDATED ({code} catalog version {version_before} → {version_after})")
+    else:
+        print(f"✓ CATALOG IS UP TO DATE ({code} catalog version {version_after})")
+    print("=" * 80)
+
+
+def get_catalog_version(cursor, edition_id: int) -> int:
+    cursor.execute("SELECT version FROM catalog_versions WHERE name = %s", (f"catalog:{edition_id}",))
+    row = cursor.fetchone()
+    return row[0] if row else 0
+
+
+def print_summary(catalog, plan, prune: bool) -> None:
+    labels = {
+        SECTION: 'Sections',
+        SUB_AREA: 'Sub-areas',
+        INDICATORS: 'Indicator lists',
+        DEFICIENCIES: 'Deficiency lists',
+        DIRECTIVES: 'Directive lists',
+    }
+    for entity in ENTITIES:
+        changes = plan[entity]
+        line = (f"  {labels[entity]:<17} {len(changes['added']):>4} added, {len(changes['updated']):>4} updated, "
+                f"{len(changes['unchanged']):>4} unchanged")
+        if entity in ROW_TABLES:
+            line += f", {len(changes['removed']):>3} {'removed' if prune else 'not extracted'}"
+        print(line)
 
+    rows = {
+        entity: sum(len(catalog[entity][key][1]) for key in _changed(plan, entity))
+        for entity in LIST_TABLES
+    }
+    print(f"  Rows written: {rows[INDICATORS]} indicators, {rows[DEFICIENCIES]} deficiencies, "
+          f"{rows[DIRECTIVES]} governing directives")
+
+    for entity in (SUB_AREA, SECTION):
+        removed = plan[entity]['removed']
+        if removed:
+            if prune:
+                print(f"\n  Deleted {labels[entity].lower()}: {', '.join(removed)}")
+            else:
+                print(f"\n  {labels[entity]} not in the extraction (use --prune to delete): {', '.join(removed)}")
+
+
+def load_data(
+    path: str = EXTRACTION_PATH,
+    edition: Optional[str] = None,
+    current: bool = False,
+    inherit: Optional[str] = None,
+    full: bool = False,
+    prune: bool = False,
+    dry_run: bool = False,
+    bulk: bool = False
+) -> None:
+    """Load what changed in the extraction into one edition in one transaction and print a change summary"""
     print("\n" + "=" * 80)
-    print("✓ DATA LOADED SUCCESSFULLY!")
+    print("LOADING FTA COMPREHENSIVE REVIEW DATA" + (" (BULK)" if bulk else ""))
     print("=" * 80)
-    print(f"  Sections: {sections_loaded}")
-    print(f"  Sub-areas: {sub_areas_loaded}")
-    print(f"  Indicators: {indicators_loaded}")
-    print(f"  Deficiencies: {deficiencies_loaded}")
+
+    metadata, catalog = read_extraction(path)
+    code = (edition or edition_code(metadata) or '').strip().upper()
+    if not code:
+        raise SystemExit("Could not derive the guide edition from the extraction metadata; pass --edition")
+
+    conn = get_db_connection()
+    try:
+        with conn.cursor() as cursor:
+            source_edition_id = None
+            if inherit:
+                source_edition_id = get_edition_id(cursor, inherit.strip().upper())
+                if source_edition_id is None:
+                    raise SystemExit(f"Unknown guide edition to inherit from: {inherit}")
+
+            edition_id, created = ensure_edition(cursor, code, metadata)
+            print(f"Edition: {code} (id {edition_id}{', new' if created else ''})")
+
+            if bulk:
+                stage_catalog(cursor, catalog)
+                plan = plan_staged_changes(cursor, edition_id, catalog, full=full)
+            else:
+                plan = plan_changes(catalog, read_database(cursor, edition_id), full=full)
+            has_changes = any(
+                _changed(plan, entity) or (prune and plan[entity]['removed'])
+                for entity in ENTITIES
+            )
+
+            version_before = get_catalog_version(cursor, edition_id)
+            # Both write only planned changes; bulk mode also records hashes for unchanged keys
+            if not dry_run:
+                if bulk:
+                    merge_staged_changes(cursor, edition_id, plan, prune=prune)
+                else:
+                    apply_changes(cursor, edition_id, catalog, plan, prune=prune)
+            inherited = None
+            if source_edition_id is not None and not dry_run:
+                inherited = inherit_from(cursor, edition_id, source_edition_id)
+            if current and not dry_run:
+                make_current(cursor, edition_id)
+            version_after = get_catalog_version(cursor, edition_id)
+        if dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    print()
+    print_summary(catalog, plan, prune)
+    if inherited is not None:
+        print(f"\n  Inherited from {inherit.upper()}: LOE for {inherited[0]} sub-areas, {inherited[1]} applicability rules")
+    if current and not dry_run:
+        print(f"\n  {code} is now the current edition")
+    print("\n" + "=" * 80)
+    if dry_run:
+        print("DRY RUN - nothing written" + ("" if has_changes else " (catalog is up to date)"))
+    elif has_changes:
+        print(f"✓ CATALOG UPDATED ({code} catalog version {version_before} → {version_after})")
+    else:
+        print(f"✓ CATALOG IS UP TO DATE ({code} catalog version {version_after})")
     print("=" * 80)
 
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally load the FTA extraction into the database")
+    parser.add_argument("--file", default=EXTRACTION_PATH,
+                        help="Extraction JSON file (default: docs/FTA_Complete_Extraction.json)")
+    parser.add_argument("--edition", default=None,
+                        help="Guide edition code, e.g. FY2026 (default: from the extraction's source document)")
+    parser.add_argument("--current", action="store_true",
+                        help="Make the edition the current one, used by new projects")
+    parser.add_argument("--inherit-from", dest="inherit", default=None, metavar="EDITION",
+                        help="Copy LOE estimates and applicability rules from this edition by sub-area id")
+    parser.add_argument("--full", action="store_true",
+                        help="Rewrite every section, sub-area and list")
+    parser.add_argument("--bulk", action="store_true",
+                        help="Stage the whole extraction with COPY and merge it with set-based SQL")
+    parser.add_argument("--prune", action="store_true",
+                        help="Delete sub-areas and sections that are no longer in the extraction")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Report what would change without writing")
+    parser.add_argument("--changeset", default=None, metavar="FILE",
+                        help="Apply a guide_diff.py changeset instead of loading an extraction")
+    parser.add_argument("--force", action="store_true",
+                        help="Apply a changeset even where the edition has changed since the diff")
+    args = parser.parse_args()
+
+    if args.changeset:
+        for flag, value in (("--full", args.full), ("--bulk", args.bulk), ("--inherit-from", args.inherit)):
+            if value:
+                parser.error(f"{flag} cannot be combined with --changeset")
+        load_changeset(
+            args.changeset, edition=args.edition, current=args.current,
+            prune=args.prune, dry_run=args.dry_run, force=args.force
+        )
+        return
+    if args.force:
+        parser.error("--force only applies to --changeset")
+    load_data(
+        args.file, edition=args.edition, current=args.current, inherit=args.inherit,
+        full=args.full, prune=args.prune, dry_run=args.dry_run, bulk=args.bulk
+    )
+
+
 if __name__ == '__main__':
-    load_data()
+    main()
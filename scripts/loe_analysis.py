@@ -8,6 +8,7 @@ import os
 import time
 from typing import Dict, List, Optional
 import psycopg2
+from psycopg2.extras import execute_values
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
@@ -110,7 +111,7 @@ def insert_section(cursor, section_data: Dict):
     cursor.execute("""
         INSERT INTO sections (id, title, page_range, purpose)
         VALUES (%s, %s, %s, %s)
-        ON CONFLICT (id) DO UPDATE SET
+        ON CONFLICT (edition_id, id) DO UPDATE SET
             title = EXCLUDED.title,
             page_range = EXCLUDED.page_range,
             purpose = EXCLUDED.purpose,
@@ -131,7 +132,7 @@ def insert_sub_area(cursor, section_id: str, sub_area: Dict, loe_data: Optional[
             loe_hours, loe_confidence, loe_confidence_score, loe_reasoning
         )
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (id) DO UPDATE SET
+        ON CONFLICT (edition_id, id) DO UPDATE SET
             section_id = EXCLUDED.section_id,
             question = EXCLUDED.question,
             basic_requirement = EXCLUDED.basic_requirement,
@@ -160,52 +161,50 @@ def insert_sub_area(cursor, section_id: str, sub_area: Dict, loe_data: Optional[
 def insert_indicators(cursor, sub_area_id: str, indicators: List[Dict]):
     """Insert indicators of compliance"""
     # Delete existing indicators
-    cursor.execute("DELETE FROM indicators_of_compliance WHERE sub_area_id = %s", (sub_area_id,))
+    cursor.execute("DELETE FROM indicators_of_compliance WHERE edition_id = current_guide_edition() AND sub_area_id = %s", (sub_area_id,))
 
-    # Insert new indicators
-    for indicator in indicators:
-        cursor.execute("""
-            INSERT INTO indicators_of_compliance (sub_area_id, indicator_id, text)
-            VALUES (%s, %s, %s)
-        """, (
-            sub_area_id,
-            indicator.get('indicator_id'),
-            indicator.get('text')
-        ))
+    # Insert new indicators in one statement
+    execute_values(cursor, """
+        INSERT INTO indicators_of_compliance (sub_area_id, indicator_id, text)
+        VALUES %s
+    """, [
+        (sub_area_id, indicator.get('indicator_id'), indicator.get('text'))
+        for indicator in indicators
+    ])
 
 def insert_deficiencies(cursor, sub_area_id: str, deficiencies: List[Dict]):
     """Insert deficiencies"""
     # Delete existing deficiencies
-    cursor.execute("DELETE FROM deficiencies WHERE sub_area_id = %s", (sub_area_id,))
-
-    # Insert new deficiencies
-    for deficiency in deficiencies:
-        cursor.execute("""
-            INSERT INTO deficiencies (sub_area_id, code, title, determination, suggested_corrective_action)
-            VALUES (%s, %s, %s, %s, %s)
-        """, (
+    cursor.execute("DELETE FROM deficiencies WHERE edition_id = current_guide_edition() AND sub_area_id = %s", (sub_area_id,))
+
+    # Insert new deficiencies in one statement
+    execute_values(cursor, """
+        INSERT INTO deficiencies (sub_area_id, code, title, determination, suggested_corrective_action)
+        VALUES %s
+    """, [
+        (
             sub_area_id,
             deficiency.get('code'),
             deficiency.get('title'),
             deficiency.get('determination'),
             deficiency.get('suggested_corrective_action')
-        ))
+        )
+        for deficiency in deficiencies
+    ])
 
 def insert_governing_directives(cursor, sub_area_id: str, directives: List[Dict]):
     """Insert governing directives"""
     # Delete existing directives
-    cursor.execute("DELETE FROM governing_directives WHERE sub_area_id = %s", (sub_area_id,))
-
-    # Insert new directives
-    for directive in directives:
-        cursor.execute("""
-            INSERT INTO governing_directives (sub_area_id, reference, text)
-            VALUES (%s, %s, %s)
-        """, (
-            sub_area_id,
-            directive.get('reference'),
-            directive.get('text')
-        ))
+    cursor.execute("DELETE FROM governing_directives WHERE edition_id = current_guide_edition() AND sub_area_id = %s", (sub_area_id,))
+
+    # Insert new directives in one statement
+    execute_values(cursor, """
+        INSERT INTO governing_directives (sub_area_id, reference, text)
+        VALUES %s
+    """, [
+        (sub_area_id, directive.get('reference'), directive.get('text'))
+        for directive in directives
+    ])
 
 def process_fta_data(fta_data: Dict):
     """Process FTA data and populate database with LOE analysis"""
@@ -1,17 +1,20 @@
 """
 Complete LOE Analysis Script - Handles all 173 sub-areas including duplicates
-This script fixes duplicate IDs by appending sequential suffixes
+This script fixes duplicate IDs by appending sequential suffixes as the
+extraction is streamed (fta_extraction.iter_extraction)
 """
 
 import json
 import os
 import time
 from typing import Dict, List, Optional
-from collections import defaultdict
 import psycopg2
+from psycopg2.extras import execute_values
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+from fta_extraction import iter_extraction
+
 # Load environment variables
 load_dotenv()
 
@@ -28,46 +31,6 @@ def get_db_connection():
         database=os.getenv('DB_NAME', 'fta_review')
     )
 
-def load_fta_data(file_path: str) -> Dict:
-    """Load FTA extraction JSON file"""
-    with open(file_path, 'r') as f:
-        return json.load(f)
-
-def create_unique_ids(fta_data: Dict) -> Dict:
-    """
-    Create unique IDs for duplicate sub-areas by appending sequential suffixes
-    Returns mapping of original_id -> list of (unique_id, sub_area_data)
-    """
-    id_counter = defaultdict(int)
-    modified_data = {'metadata': fta_data['metadata'], 'sections': []}
-
-    for section in fta_data['sections']:
-        new_section = {
-            'section': section['section'],
-            'sub_areas': []
-        }
-
-        for sub_area in section.get('sub_areas', []):
-            original_id = sub_area['id']
-            id_counter[original_id] += 1
-
-            # If this ID has appeared before, add suffix
-            if id_counter[original_id] > 1:
-                unique_id = f"{original_id}_{id_counter[original_id]}"
-                print(f"  ⚠️  Duplicate ID '{original_id}' renamed to '{unique_id}'")
-            else:
-                unique_id = original_id
-
-            # Create new sub-area with unique ID
-            new_sub_area = sub_area.copy()
-            new_sub_area['original_id'] = original_id
-            new_sub_area['id'] = unique_id
-            new_section['sub_areas'].append(new_sub_area)
-
-        modified_data['sections'].append(new_section)
-
-    return modified_data
-
 def create_loe_prompt(sub_area: Dict) -> str:
     """Create a prompt for Claude to analyze LOE for a sub-area"""
     prompt = f"""You are an expert FTA (Federal Transit Administration) auditor and reviewer.
@@ -156,7 +119,7 @@ def insert_section(cursor, section_data: Dict):
     cursor.execute("""
         INSERT INTO sections (id, title, page_range, purpose)
         VALUES (%s, %s, %s, %s)
-        ON CONFLICT (id) DO UPDATE SET
+        ON CONFLICT (edition_id, id) DO UPDATE SET
             title = EXCLUDED.title,
             page_range = EXCLUDED.page_range,
             purpose = EXCLUDED.purpose,
@@ -177,7 +140,7 @@ def insert_sub_area(cursor, section_id: str, sub_area: Dict, loe_data: Optional[
             loe_hours, loe_confidence, loe_confidence_score, loe_reasoning
         )
         VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        ON CONFLICT (id) DO UPDATE SET
+        ON CONFLICT (edition_id, id) DO UPDATE SET
             section_id = EXCLUDED.section_id,
             question = EXCLUDED.question,
             basic_requirement = EXCLUDED.basic_requirement,
@@ -206,114 +169,119 @@ def insert_sub_area(cursor, section_id: str, sub_area: Dict, loe_data: Optional[
 def insert_indicators(cursor, sub_area_id: str, indicators: List[Dict]):
     """Insert indicators of compliance"""
     # Delete existing indicators
-    cursor.execute("DELETE FROM indicators_of_compliance WHERE sub_area_id = %s", (sub_area_id,))
+    cursor.execute("DELETE FROM indicators_of_compliance WHERE edition_id = current_guide_edition() AND sub_area_id = %s", (sub_area_id,))
 
-    # Insert new indicators
-    for indicator in indicators:
-        cursor.execute("""
-            INSERT INTO indicators_of_compliance (sub_area_id, indicator_id, text)
-            VALUES (%s, %s, %s)
-        """, (
-            sub_area_id,
-            indicator.get('indicator_id'),
-            indicator.get('text')
-        ))
+    # Insert new indicators in one statement
+    execute_values(cursor, """
+        INSERT INTO indicators_of_compliance (sub_area_id, indicator_id, text)
+        VALUES %s
+    """, [
+        (sub_area_id, indicator.get('indicator_id'), indicator.get('text'))
+        for indicator in indicators
+    ])
 
 def insert_deficiencies(cursor, sub_area_id: str, deficiencies: List[Dict]):
     """Insert deficiencies"""
     # Delete existing deficiencies
-    cursor.execute("DELETE FROM deficiencies WHERE sub_area_id = %s", (sub_area_id,))
-
-    # Insert new deficiencies
-    for deficiency in deficiencies:
-        cursor.execute("""
-            INSERT INTO deficiencies (sub_area_id, code, title, determination, suggested_corrective_action)
-            VALUES (%s, %s, %s, %s, %s)
-        """, (
+    cursor.execute("DELETE FROM deficiencies WHERE edition_id = current_guide_edition() AND sub_area_id = %s", (sub_area_id,))
+
+    # Insert new deficiencies in one statement
+    execute_values(cursor, """
+        INSERT INTO deficiencies (sub_area_id, code, title, determination, suggested_corrective_action)
+        VALUES %s
+    """, [
+        (
             sub_area_id,
             deficiency.get('code'),
             deficiency.get('title'),
             deficiency.get('determination'),
             deficiency.get('suggested_corrective_action')
-        ))
+        )
+        for deficiency in deficiencies
+    ])
 
 def insert_governing_directives(cursor, sub_area_id: str, directives: List[Dict]):
     """Insert governing directives"""
     # Delete existing directives
-    cursor.execute("DELETE FROM governing_directives WHERE sub_area_id = %s", (sub_area_id,))
-
-    # Insert new directives
-    for directive in directives:
-        cursor.execute("""
-            INSERT INTO governing_directives (sub_area_id, reference, text)
-            VALUES (%s, %s, %s)
-        """, (
-            sub_area_id,
-            directive.get('reference'),
-            directive.get('text')
-        ))
-
-def process_fta_data(fta_data: Dict):
-    """Process FTA data and populate database with LOE analysis"""
+    cursor.execute("DELETE FROM governing_directives WHERE edition_id = current_guide_edition() AND sub_area_id = %s", (sub_area_id,))
+
+    # Insert new directives in one statement
+    execute_values(cursor, """
+        INSERT INTO governing_directives (sub_area_id, reference, text)
+        VALUES %s
+    """, [
+        (sub_area_id, directive.get('reference'), directive.get('text'))
+        for directive in directives
+    ])
+
+def process_fta_data(file_path: str):
+    """Process FTA data and populate database with LOE analysis, streaming one sub-area at a time"""
     conn = get_db_connection()
     cursor = conn.cursor()
 
-    total_sections = len(fta_data.get('sections', []))
-    total_sub_areas = sum(len(section.get('sub_areas', [])) for section in fta_data.get('sections', []))
+    metadata = {}
 
-    print(f"\n🚀 Starting COMPLETE LOE analysis for {total_sections} sections and {total_sub_areas} sub-areas...")
+    print(f"\n🚀 Starting COMPLETE LOE analysis...")
     print("=" * 80)
 
     processed_sub_areas = 0
     successful_analyses = 0
     failed_analyses = 0
+    section_idx = 0
+    previous = None
 
     try:
-        for section_idx, section in enumerate(fta_data.get('sections', []), 1):
-            section_data = section.get('section', {})
+        for section_data, sub_area in iter_extraction(file_path, metadata):
             section_id = section_data.get('id')
 
-            print(f"\n[{section_idx}/{total_sections}] Section: {section_id} - {section_data.get('title')}")
-            print(f"  Sub-areas: {len(section.get('sub_areas', []))}")
+            if section_data is not previous:
+                previous = section_data
+                section_idx += 1
+                total_sections = metadata.get('metadata', {}).get('total_sections', '?')
+                print(f"\n[{section_idx}/{total_sections}] Section: {section_id} - {section_data.get('title')}")
+
+                # Insert section
+                insert_section(cursor, section_data)
+                conn.commit()
 
-            # Insert section
-            insert_section(cursor, section_data)
+            if sub_area is None:
+                continue
 
-            # Process sub-areas
-            for sub_area in section.get('sub_areas', []):
-                sub_area_id = sub_area.get('id')
-                print(f"    → {sub_area_id}... ", end='', flush=True)
+            sub_area_id = sub_area.get('id')
+            if sub_area_id != sub_area['original_id']:
+                print(f"    ⚠️  Duplicate ID '{sub_area['original_id']}' renamed to '{sub_area_id}'")
+            print(f"    → {sub_area_id}... ", end='', flush=True)
 
-                # Analyze LOE using Claude
-                loe_data = analyze_sub_area_loe(sub_area)
+            # Analyze LOE using Claude
+            loe_data = analyze_sub_area_loe(sub_area)
 
-                if loe_data:
-                    print(f"✓ {loe_data.get('hours')}h ({loe_data.get('confidence_level')})")
-                    successful_analyses += 1
-                else:
-                    print(f"✗ Failed")
-                    failed_analyses += 1
+            if loe_data:
+                print(f"✓ {loe_data.get('hours')}h ({loe_data.get('confidence_level')})")
+                successful_analyses += 1
+            else:
+                print(f"✗ Failed")
+                failed_analyses += 1
 
-                # Insert sub-area with LOE data
-                insert_sub_area(cursor, section_id, sub_area, loe_data)
+            # Insert sub-area with LOE data
+            insert_sub_area(cursor, section_id, sub_area, loe_data)
 
-                # Insert related data
-                if sub_area.get('indicators_of_compliance'):
-                    insert_indicators(cursor, sub_area_id, sub_area.get('indicators_of_compliance'))
+            # Insert related data
+            if sub_area.get('indicators_of_compliance'):
+                insert_indicators(cursor, sub_area_id, sub_area.get('indicators_of_compliance'))
 
-                if sub_area.get('deficiencies'):
-                    insert_deficiencies(cursor, sub_area_id, sub_area.get('deficiencies'))
+            if sub_area.get('deficiencies'):
+                insert_deficiencies(cursor, sub_area_id, sub_area.get('deficiencies'))
 
-                if sub_area.get('governing_directives'):
-                    insert_governing_directives(cursor, sub_area_id, sub_area.get('governing_directives'))
+            if sub_area.get('governing_directives'):
+                insert_governing_directives(cursor, sub_area_id, sub_area.get('governing_directives'))
 
-                processed_sub_areas += 1
+            processed_sub_areas += 1
 
-                # Commit after each sub-area to save progress
-                conn.commit()
+            # Commit after each sub-area to save progress
+            conn.commit()
 
-                # Small delay to avoid rate limiting
-                time.sleep(0.5)
+            # Small delay to avoid rate limiting
+            time.sleep(0.5)
 
         print("\n" + "=" * 80)
         print(f"✓ Successfully processed {processed_sub_areas} sub-areas!")
@@ -394,20 +362,11 @@ def main():
     print("FTA COMPREHENSIVE REVIEW - COMPLETE LOE ANALYSIS")
     print("=" * 80)
 
-    # Load FTA data
+    # Stream FTA data; duplicate sub-area ids get sequential suffixes as they are read
     print(f"\n📁 Loading FTA data from: {fta_file_path}")
-    fta_data = load_fta_data(fta_file_path)
-    print(f"  ✓ Loaded {fta_data['metadata']['total_sections']} sections")
-
-    total_sub_areas = sum(len(section.get('sub_areas', [])) for section in fta_data['sections'])
-    print(f"  ✓ Found {total_sub_areas} sub-areas")
-
-    # Fix duplicate IDs
-    print(f"\n🔧 Fixing duplicate sub-area IDs...")
-    fta_data = create_unique_ids(fta_data)
 
     # Process and analyze
-    process_fta_data(fta_data)
+    process_fta_data(fta_file_path)
 
     # Display summary
     display_summary()
@@ -3,12 +3,13 @@ Populate applicability rules from FTA JSON data
 Parses natural language applicability criteria into structured database rules
 """
 
-import json
 import os
 import re
 import psycopg2
 from dotenv import load_dotenv
 
+from fta_extraction import iter_extraction
+
 load_dotenv()
 
 def get_db_connection():
@@ -184,11 +185,6 @@ def populate_rules(conn):
     """Populate applicability rules from FTA JSON"""
     cursor = conn.cursor()
 
-    # Load FTA data
-    fta_file = os.path.join(os.path.dirname(__file__), '..', 'docs', 'FTA_Complete_Extraction.json')
-    with open(fta_file, 'r') as f:
-        fta_data = json.load(f)
-
     print("\n" + "=" * 80)
     print("POPULATING APPLICABILITY RULES")
     print("=" * 80)
@@ -196,43 +192,39 @@ def populate_rules(conn):
     total_rules = 0
     total_conditions = 0
     sections_processed = 0
+    metadata = {}
+    previous = None
 
-    # Track ID renaming for duplicates
-    id_counter = {}
-
-    for section in fta_data['sections']:
-        section_id = section['section']['id']
-        sections_processed += 1
-
-        print(f"\n[{sections_processed}/23] Section: {section_id}")
+    # Streamed one sub-area at a time, with unique ids for duplicates (same as the LOE script)
+    for section, sub_area in iter_extraction(metadata=metadata):
+        if section is not previous:
+            if previous is not None:
+                conn.commit()
+            previous = section
+            sections_processed += 1
+            total_sections = metadata.get('metadata', {}).get('total_sections', '?')
+            print(f"\n[{sections_processed}/{total_sections}] Section: {section['id']}")
+        if sub_area is None:
+            continue
 
-        for sub_area in section.get('sub_areas', []):
-            original_id = sub_area['id']
+        sub_area_id = sub_area['id']
+        applicability_text = sub_area.get('applicability', '')
 
-            # Handle duplicate IDs (same logic as LOE script)
-            id_counter[original_id] = id_counter.get(original_id, 0) + 1
-            if id_counter[original_id] > 1:
-                sub_area_id = f"{original_id}_{id_counter[original_id]}"
-            else:
-                sub_area_id = original_id
+        # Parse applicability into conditions
+        conditions = parse_applicability(applicability_text)
 
-            applicability_text = sub_area.get('applicability', '')
+        # Create rule
+        rule_id = create_rule(cursor, sub_area_id, applicability_text, conditions)
+        total_rules += 1
+        total_conditions += len(conditions) if conditions else 0
 
-            # Parse applicability into conditions
-            conditions = parse_applicability(applicability_text)
+        cond_str = ', '.join([f"{c[0]}={c[2]}" for c in conditions[:2]]) if conditions else "all"
+        if len(conditions) > 2:
+            cond_str += "..."
 
-            # Create rule
-            rule_id = create_rule(cursor, sub_area_id, applicability_text, conditions)
-            total_rules += 1
-            total_conditions += len(conditions) if conditions else 0
+        print(f"  {sub_area_id:15} → Rule #{rule_id:3} ({len(conditions)} conditions): {cond_str}")
 
-            cond_str = ', '.join([f"{c[0]}={c[2]}" for c in conditions[:2]]) if conditions else "all"
-            if len(conditions) > 2:
-                cond_str += "..."
-
-            print(f"  {sub_area_id:15} → Rule #{rule_id:3} ({len(conditions)} conditions): {cond_str}")
-
-        conn.commit()
+    conn.commit()
 
     print("\n" + "=" * 80)
     print(f"✓ Created {total_rules} rules with {total_conditions} conditions")
@@ -285,8 +277,11 @@ def main():
     try:
         # Clear existing rules
         cursor = conn.cursor()
-        cursor.execute("DELETE FROM rule_conditions")
-        cursor.execute("DELETE FROM applicability_rules")
+        cursor.execute("""
+            DELETE FROM rule_conditions
+            WHERE rule_id IN (SELECT id FROM applicability_rules WHERE edition_id = current_guide_edition())
+        """)
+        cursor.execute("DELETE FROM applicability_rules WHERE edition_id = current_guide_edition()")
         conn.commit()
         cursor.close()
         print("✓ Cleared existing rules")